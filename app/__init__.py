@@ -19,9 +19,42 @@ def create_app(config_class=Config):
     
     # Inicializar extensões com a aplicação
     db.init_app(app)
-    migrate.init_app(app, db)
+    from app.services.busca_textual import incluir_na_migracao
+    migrate.init_app(app, db, include_object=incluir_na_migracao)
     login.init_app(app)
     
+    # Cache de perfis do LinkedIn
+    from app.services.cache_perfis import cache_perfis
+    cache_perfis.init_app(app)
+    
+    # Estatísticas de acerto dos seletores de extração do LinkedIn
+    from app.services.seletores import registro_seletores
+    registro_seletores.init_app(app)
+    
+    # Pool de sessões do crawler do LinkedIn
+    from app.services.crawler_pool import crawler_pool
+    crawler_pool.init_app(app)
+    
+    # Executor das tarefas do LinkedIn em segundo plano
+    from app.services.tarefas import executor_tarefas
+    executor_tarefas.init_app(app)
+    
+    # Atualização periódica dos palestrantes desatualizados
+    from app.services.agendador import agendador_atualizacao
+    agendador_atualizacao.init_app(app)
+    
+    # Acervo local das fotos dos palestrantes (com miniaturas)
+    from app.services.fotos import acervo_fotos
+    acervo_fotos.init_app(app)
+    
+    # Índice de busca textual dos palestrantes
+    from app.services.busca_textual import indice_busca
+    indice_busca.init_app(app)
+    
+    # Recomendação de palestrantes para eventos
+    from app.services.recomendacao import motor_recomendacao
+    motor_recomendacao.init_app(app)
+    
     # Criar diretório de uploads se não existir
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     
@@ -29,13 +62,19 @@ def create_app(config_class=Config):
     from app.controllers.auth import bp as auth_bp
     from app.controllers.palestrantes import bp as palestrantes_bp
     from app.controllers.eventos import bp as eventos_bp
+    from app.controllers.fotos import bp as fotos_bp
     
     app.register_blueprint(auth_bp, url_prefix='/auth')
     app.register_blueprint(palestrantes_bp, url_prefix='/palestrantes')
     app.register_blueprint(eventos_bp, url_prefix='/eventos')
+    app.register_blueprint(fotos_bp, url_prefix='/fotos')
     
     # Definir rota principal
     from app.controllers import main
     app.register_blueprint(main.bp)
     
+    # Registrar comandos de linha de comando
+    from app.comandos import registrar_comandos
+    registrar_comandos(app)
+    
     return app
@@ -0,0 +1,155 @@
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+linkedin_cli = AppGroup('linkedin', help='Comandos de integração com o LinkedIn.')
+
+@linkedin_cli.command('atualizar-desatualizados')
+@click.option('--dias', type=int, default=None, help='Idade mínima da última atualização, em dias.')
+@click.option('--lote', type=int, default=None, help='Palestrantes gravados por commit.')
+@click.option('--limite', type=int, default=None, help='Quantidade máxima de palestrantes nesta execução.')
+@click.option('--intervalo', type=float, default=None, help='Intervalo mínimo entre visitas de perfil, em segundos.')
+def atualizar_desatualizados_comando(dias, lote, limite, intervalo):
+    """Atualiza pelo LinkedIn os palestrantes com dados desatualizados."""
+    from app.services.agendador import atualizar_desatualizados
+
+    config = current_app.config
+    estatisticas = atualizar_desatualizados(
+        dias=dias if dias is not None else config.get('LINKEDIN_ATUALIZACAO_DIAS', 30),
+        tamanho_lote=lote or config.get('LINKEDIN_ATUALIZACAO_LOTE', 10),
+        limite=limite or config.get('LINKEDIN_ATUALIZACAO_LIMITE'),
+        intervalo=intervalo if intervalo is not None else config.get('LINKEDIN_ATUALIZACAO_INTERVALO', 5.0),
+        espera_falha=config.get('LINKEDIN_ATUALIZACAO_ESPERA_FALHA', 6.0)
+    )
+
+    click.echo(f"Selecionados: {estatisticas['selecionados']}")
+    click.echo(f"Atualizados: {estatisticas['atualizados']} em {estatisticas['lotes']} lote(s)")
+    click.echo(f"Falhas: {estatisticas['falhas']}")
+    click.echo(f"Duração: {estatisticas['duracao_s']} s ({estatisticas['perfis_por_minuto']} perfis/min)")
+    for erro in estatisticas['erros']:
+        click.echo(f"  - {erro}")
+
+fotos_cli = AppGroup('fotos', help='Comandos do acervo de fotos dos palestrantes.')
+
+@fotos_cli.command('espelhar')
+def espelhar_fotos_comando():
+    """Copia para o acervo as fotos remotas e os uploads antigos dos palestrantes."""
+    import os
+    from app import db
+    from app.models.palestrante import Palestrante
+    from app.services.fotos import acervo_fotos
+
+    copiadas = falhas = 0
+    for palestrante in Palestrante.query.filter(Palestrante.foto_url.isnot(None), Palestrante.foto_url != ''):
+        if acervo_fotos.hash_da_url(palestrante.foto_url):
+            continue
+
+        if palestrante.foto_url.startswith('/static/'):
+            # Upload gravado antes do acervo, em tamanho original
+            caminho = os.path.join(current_app.static_folder, palestrante.foto_url[len('/static/'):])
+            try:
+                with open(caminho, 'rb') as f:
+                    nova_url = acervo_fotos.armazenar(f.read())
+            except (OSError, ValueError) as e:
+                click.echo(f"  - {palestrante.id}: {e}")
+                nova_url = palestrante.foto_url
+        else:
+            nova_url = acervo_fotos.espelhar(palestrante.foto_url)
+
+        if nova_url != palestrante.foto_url:
+            palestrante.foto_url = nova_url
+            copiadas += 1
+        else:
+            falhas += 1
+
+    db.session.commit()
+    click.echo(f"Fotos copiadas para o acervo: {copiadas}")
+    click.echo(f"Falhas: {falhas}")
+
+busca_cli = AppGroup('busca', help='Comandos do índice de busca textual dos palestrantes.')
+
+@busca_cli.command('reconstruir')
+def reconstruir_indice_comando():
+    """Recria o índice de busca textual a partir dos palestrantes cadastrados."""
+    from app.services.busca_textual import indice_busca
+
+    estatisticas = indice_busca.reconstruir()
+    if estatisticas is None:
+        click.echo("Banco de dados sem suporte a busca textual (use SQLite ou PostgreSQL).")
+        return
+    click.echo(f"Palestrantes indexados: {estatisticas['indexados']} em {estatisticas['duracao_s']} s")
+
+@busca_cli.command('normalizar')
+@click.option('--todos', is_flag=True, help='Recalcular também as colunas já preenchidas.')
+@click.option('--lote', type=int, default=1000, help='Registros gravados por commit.')
+def normalizar_colunas_comando(todos, lote):
+    """Atualiza o esquema do banco e preenche as colunas normalizadas (sem acentos, em minúsculas)."""
+    from sqlalchemy import update
+    from app import db
+    from app.models.evento import Evento
+    from app.models.normalizacao import normalizar_texto
+    from app.models.palestrante import Palestrante, PalavraChave
+    from app.services.esquema import atualizar_esquema
+
+    # Bancos anteriores às colunas normalizadas ainda não as têm: criá-las antes do preenchimento
+    for alteracao in atualizar_esquema():
+        click.echo(f"Esquema: {alteracao}")
+
+    for modelo, origem, destino in (
+        (Palestrante, Palestrante.nome, Palestrante.nome_normalizado),
+        (Evento, Evento.nome, Evento.nome_normalizado),
+        (PalavraChave, PalavraChave.palavra, PalavraChave.palavra_normalizada),
+    ):
+        atualizados, ultimo_id = 0, 0
+        while True:
+            # Percorrer por id (sem OFFSET), gravando cada lote com um UPDATE em massa por chave primária
+            query = db.session.query(modelo.id, origem).filter(modelo.id > ultimo_id)
+            if not todos:
+                query = query.filter(destino.is_(None))
+            linhas = query.order_by(modelo.id).limit(lote).all()
+            if not linhas:
+                break
+            db.session.execute(
+                update(modelo),
+                [{'id': id_, destino.key: normalizar_texto(valor)} for id_, valor in linhas]
+            )
+            db.session.commit()
+            atualizados += len(linhas)
+            ultimo_id = linhas[-1][0]
+        click.echo(f"{modelo.__tablename__}: {atualizados} registro(s) normalizado(s)")
+
+palavras_chave_cli = AppGroup('palavras-chave', help='Comandos de manutenção das palavras-chave.')
+
+@palavras_chave_cli.command('canonicalizar')
+@click.option('--limiar', type=click.FloatRange(0.1, 1.0), default=0.8, show_default=True,
+              help='Similaridade mínima (trigramas) para agrupar duas palavras-chave.')
+@click.option('--ignorar-grupo', 'grupos', type=int, multiple=True,
+              help='Número (como listado) de um grupo a não fundir. Pode ser repetida.')
+@click.option('--manter', 'palavras', multiple=True,
+              help='Palavra-chave a deixar fora das fusões. Pode ser repetida.')
+@click.option('--aplicar', is_flag=True, help='Fundir os grupos propostos (sem a opção, só lista).')
+def canonicalizar_palavras_chave_comando(limiar, grupos, palavras, aplicar):
+    """Agrupa palavras-chave quase duplicadas e, com --aplicar, funde cada grupo na canônica."""
+    from app.services.canonicalizacao import propor_fusoes, filtrar_fusoes, aplicar_fusoes
+
+    fusoes = filtrar_fusoes(propor_fusoes(limiar), grupos, palavras)
+    for fusao in fusoes:
+        usos = fusao['usos']
+        variantes = ', '.join(f"{v.palavra} ({usos[v.id]})" for v in fusao['variantes'])
+        click.echo(f"{fusao['grupo']:>4}. {fusao['canonica'].palavra} ({usos[fusao['canonica'].id]}) <- {variantes}")
+    click.echo(f"Grupos encontrados: {len(fusoes)}")
+
+    if aplicar and fusoes:
+        estatisticas = aplicar_fusoes(fusoes)
+        click.echo(f"Palavras-chave removidas: {estatisticas['palavras_chave_removidas']}")
+        click.echo(f"Palestrantes afetados: {estatisticas['palestrantes_afetados']}")
+    elif fusoes:
+        click.echo("Nada foi alterado; use --aplicar para fundir os grupos "
+                   "(--ignorar-grupo e --manter deixam grupos e palavras-chave de fora).")
+
+def registrar_comandos(app):
+    """Registra os comandos de linha de comando da aplicação (flask <grupo> <comando>)"""
+    app.cli.add_command(linkedin_cli)
+    app.cli.add_command(fotos_cli)
+    app.cli.add_command(busca_cli)
+    app.cli.add_command(palavras_chave_cli)
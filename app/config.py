@@ -4,9 +4,12 @@ from dotenv import load_dotenv
 basedir = os.path.abspath(os.path.dirname(__file__))
 load_dotenv(os.path.join(os.path.dirname(basedir), '.env'))
 
+# Chave usada quando SECRET_KEY não é definida; pública, só serve para desenvolvimento
+SECRET_KEY_PADRAO = 'chave-secreta-desenvolvimento'
+
 class Config:
     # Configuração básica
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'chave-secreta-desenvolvimento'
+    SECRET_KEY = os.environ.get('SECRET_KEY') or SECRET_KEY_PADRAO
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///' + os.path.join(basedir, '../instance/app.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
@@ -15,6 +18,109 @@ class Config:
     LINKEDIN_USERNAME = os.environ.get('LINKEDIN_USERNAME')
     LINKEDIN_PASSWORD = os.environ.get('LINKEDIN_PASSWORD')
     
+    # Endereço base do LinkedIn (pode apontar para um servidor local nos benchmarks)
+    LINKEDIN_BASE_URL = os.environ.get('LINKEDIN_BASE_URL') or 'https://www.linkedin.com'
+    
+    # Cookies da sessão autenticada, salvos criptografados para evitar novos logins
+    # (defina LINKEDIN_COOKIES_PATH vazio para desativar; exige LINKEDIN_COOKIES_CHAVE ou uma
+    # SECRET_KEY própria, já que a chave padrão é pública)
+    LINKEDIN_COOKIES_PATH = os.environ.get('LINKEDIN_COOKIES_PATH',
+                                           os.path.join(basedir, '../instance/linkedin_cookies.enc'))
+    LINKEDIN_COOKIES_CHAVE = os.environ.get('LINKEDIN_COOKIES_CHAVE')  # padrão: SECRET_KEY
+    
+    # Backend de acesso ao LinkedIn: 'selenium' (Chrome headless) ou 'http' (requests + BeautifulSoup)
+    LINKEDIN_BACKEND = os.environ.get('LINKEDIN_BACKEND') or 'selenium'
+    LINKEDIN_HTTP_TIMEOUT = int(os.environ.get('LINKEDIN_HTTP_TIMEOUT') or 15)  # segundos
+    LINKEDIN_HTTP_POOL_MAXSIZE = int(os.environ.get('LINKEDIN_HTTP_POOL_MAXSIZE') or 10)
+    
+    # chromedriver: caminho fixo (opcional) e registro do driver já resolvido, para não
+    # consultar o webdriver_manager (e a rede) a cada navegador aberto
+    CHROMEDRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH')
+    CHROMEDRIVER_CACHE_PATH = os.environ.get('CHROMEDRIVER_CACHE_PATH',
+                                             os.path.join(basedir, '../instance/chromedriver.json'))
+    
+    # Pool de sessões do crawler (navegadores já autenticados)
+    CRAWLER_POOL_SIZE = int(os.environ.get('CRAWLER_POOL_SIZE') or 2)
+    CRAWLER_POOL_TIMEOUT = int(os.environ.get('CRAWLER_POOL_TIMEOUT') or 60)  # segundos
+    CRAWLER_MAX_PAGINAS = int(os.environ.get('CRAWLER_MAX_PAGINAS') or 200)
+    CRAWLER_MAX_MEMORIA_MB = int(os.environ.get('CRAWLER_MAX_MEMORIA_MB') or 1024)
+    
+    # Número de navegadores visitando perfis em paralelo durante uma busca
+    CRAWLER_WORKERS = int(os.environ.get('CRAWLER_WORKERS') or 2)
+    
+    # Limites das esperas adaptativas do crawler (em segundos)
+    CRAWLER_ESPERA_MAXIMA = float(os.environ.get('CRAWLER_ESPERA_MAXIMA') or 10)
+    CRAWLER_ESPERA_QUIETO = float(os.environ.get('CRAWLER_ESPERA_QUIETO') or 0.5)
+    CRAWLER_ESPERA_CRESCIMENTO = float(os.environ.get('CRAWLER_ESPERA_CRESCIMENTO') or 2.0)
+    CRAWLER_MAX_ROLAGENS = int(os.environ.get('CRAWLER_MAX_ROLAGENS') or 10)
+    
+    # Modo leve do Chrome: bloquear imagens, fontes, mídia e rastreadores (só o texto é extraído)
+    CRAWLER_BLOQUEAR_RECURSOS = os.environ.get('CRAWLER_BLOQUEAR_RECURSOS', 'true').lower() in ['true', 'on', '1']
+    # Tipos liberados mesmo no modo leve (imagens, fontes, midia, rastreamento), separados por vírgula
+    CRAWLER_RECURSOS_PERMITIDOS = os.environ.get('CRAWLER_RECURSOS_PERMITIDOS') or ''
+    # Padrões de URL bloqueados além dos tipos acima (ex.: "*/li/track*,*.js.map")
+    CRAWLER_URLS_BLOQUEADAS = os.environ.get('CRAWLER_URLS_BLOQUEADAS') or ''
+    # Estratégia de carregamento das páginas: 'normal', 'eager' (até o DOM) ou 'none'
+    CRAWLER_PAGE_LOAD_STRATEGY = os.environ.get('CRAWLER_PAGE_LOAD_STRATEGY') or 'eager'
+    
+    # Número de buscas/atualizações do LinkedIn executadas simultaneamente em segundo plano
+    LINKEDIN_TAREFAS_WORKERS = int(os.environ.get('LINKEDIN_TAREFAS_WORKERS') or 2)
+    
+    # Marcar como erro, ao iniciar, as tarefas que ficaram pendentes/em execução quando a
+    # aplicação parou (desative se vários processos da aplicação compartilharem o banco)
+    LINKEDIN_TAREFAS_RECUPERAR = os.environ.get('LINKEDIN_TAREFAS_RECUPERAR', 'true').lower() in ['true', 'on', '1']
+    
+    # Validade (s) dos resultados de busca guardados no servidor para a importação
+    LINKEDIN_RESULTADOS_TTL = int(os.environ.get('LINKEDIN_RESULTADOS_TTL') or 24 * 3600)
+    
+    # Espera máxima (s) por novos perfis na transmissão de uma busca à página, antes de
+    # enviar uma mensagem para manter a conexão
+    LINKEDIN_EVENTOS_ESPERA = float(os.environ.get('LINKEDIN_EVENTOS_ESPERA') or 15)
+    # Intervalo (s) entre as consultas ao banco quando a busca executa em outro processo
+    LINKEDIN_EVENTOS_INTERVALO = float(os.environ.get('LINKEDIN_EVENTOS_INTERVALO') or 2.0)
+    
+    # Atualização em lote dos palestrantes desatualizados (flask linkedin atualizar-desatualizados)
+    LINKEDIN_ATUALIZACAO_DIAS = int(os.environ.get('LINKEDIN_ATUALIZACAO_DIAS') or 30)
+    LINKEDIN_ATUALIZACAO_LOTE = int(os.environ.get('LINKEDIN_ATUALIZACAO_LOTE') or 10)
+    LINKEDIN_ATUALIZACAO_LIMITE = int(os.environ.get('LINKEDIN_ATUALIZACAO_LIMITE') or 0) or None
+    LINKEDIN_ATUALIZACAO_INTERVALO = float(os.environ.get('LINKEDIN_ATUALIZACAO_INTERVALO') or 5.0)  # segundos
+    # Espera após a primeira falha ao ler um perfil (dobra a cada falha seguida, até LINKEDIN_ATUALIZACAO_DIAS)
+    LINKEDIN_ATUALIZACAO_ESPERA_FALHA = float(os.environ.get('LINKEDIN_ATUALIZACAO_ESPERA_FALHA') or 6)  # horas
+    LINKEDIN_AGENDADOR_ATIVO = (os.environ.get('LINKEDIN_AGENDADOR_ATIVO') or '').lower() in ('1', 'true', 'sim')
+    LINKEDIN_AGENDADOR_PERIODO = int(os.environ.get('LINKEDIN_AGENDADOR_PERIODO') or 3600)  # segundos
+    
+    # Cache persistente dos perfis visitados (0 no TTL desativa o cache)
+    LINKEDIN_CACHE_PATH = os.environ.get('LINKEDIN_CACHE_PATH') or \
+        os.path.join(basedir, '../instance/perfis_cache.db')
+    LINKEDIN_CACHE_TTL = int(os.environ.get('LINKEDIN_CACHE_TTL') or 7 * 24 * 3600)  # segundos
+    LINKEDIN_CACHE_MAX_ITENS = int(os.environ.get('LINKEDIN_CACHE_MAX_ITENS') or 5000)
+    
+    # Estatísticas dos seletores de extração, usadas para tentar primeiro o que está acertando;
+    # campos cuja taxa de acerto cai abaixo de LIMIAR_ALERTA vezes a habitual geram aviso no log
+    LINKEDIN_SELETORES_PATH = os.environ.get('LINKEDIN_SELETORES_PATH') or \
+        os.path.join(basedir, '../instance/seletores.json')
+    LINKEDIN_SELETORES_LIMIAR_ALERTA = float(os.environ.get('LINKEDIN_SELETORES_LIMIAR_ALERTA') or 0.5)
+    LINKEDIN_SELETORES_MIN_AMOSTRAS = int(os.environ.get('LINKEDIN_SELETORES_MIN_AMOSTRAS') or 20)
+    
+    # Acervo de fotos dos palestrantes: originais pelo hash do conteúdo e miniaturas quadradas (px)
+    FOTOS_FOLDER = os.environ.get('FOTOS_FOLDER') or os.path.join(basedir, 'static/fotos')
+    FOTOS_TAMANHOS = {'mini': 80, 'media': 240, 'grande': 600}
+    FOTOS_TAMANHO_MAXIMO = 5 * 1024 * 1024  # 5 MB
+    FOTOS_TIMEOUT = float(os.environ.get('FOTOS_TIMEOUT') or 5)  # segundos, por foto
+    # Tempo total (s) para baixar as fotos de uma importação em lote; as que não couberem
+    # mantêm a URL remota (copie depois com `flask fotos espelhar`)
+    FOTOS_PRAZO_LOTE = float(os.environ.get('FOTOS_PRAZO_LOTE') or 8)
+    
+    # Listagens paginadas por cursor: por quanto tempo o total de cada consulta é reaproveitado
+    # (0 desativa a contagem)
+    PAGINACAO_TOTAL_TTL = int(os.environ.get('PAGINACAO_TOTAL_TTL') or 60)  # segundos
+    
+    # Recomendação de palestrantes: pesos dos sinais (ver recomendacao.PESOS_PADRAO), intervalo
+    # da recarga completa da matriz e meia-vida, em dias, do peso do último evento do palestrante
+    RECOMENDACAO_PESOS = {}
+    RECOMENDACAO_RECARGA = int(os.environ.get('RECOMENDACAO_RECARGA') or 3600)  # segundos
+    RECOMENDACAO_MEIA_VIDA_DIAS = int(os.environ.get('RECOMENDACAO_MEIA_VIDA_DIAS') or 365)
+    
     # Configurações para upload de arquivos
     UPLOAD_FOLDER = os.path.join(basedir, 'static/uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16 MB
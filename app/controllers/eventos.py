@@ -1,11 +1,15 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_required
 from datetime import datetime
 
 from app import db
 from app.models.evento import Evento, AvaliacaoPalestrante
 from app.models.palestrante import Palestrante
+from app.models.normalizacao import normalizar_texto
 from app.forms.evento import EventoForm, AvaliacaoForm
+from app.services.paginacao import paginar_por_cursor
+from app.services.recomendacao import motor_recomendacao
+from app.services.fotos import acervo_fotos
 
 bp = Blueprint('eventos', __name__)
 
@@ -13,18 +17,21 @@ bp = Blueprint('eventos', __name__)
 @login_required
 def index():
     """Listar todos os eventos cadastrados"""
-    page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     per_page = 10  # Eventos por página
     
     # Filtros
     nome = request.args.get('nome', '')
     periodo = request.args.get('periodo', 'todos')  # 'passados', 'proximos', 'todos'
+    if periodo not in ('passados', 'proximos'):
+        periodo = 'todos'
     
     query = Evento.query
     
     # Aplicar filtros se fornecidos
     if nome:
-        query = query.filter(Evento.nome.ilike(f'%{nome}%'))
+        # Trecho em qualquer parte do nome, sem diferenciar acentos e maiúsculas
+        query = query.filter(Evento.nome_normalizado.contains(normalizar_texto(nome), autoescape=True))
     
     # Filtrar por período
     hoje = datetime.utcnow()
@@ -33,9 +40,10 @@ def index():
     elif periodo == 'proximos':
         query = query.filter(Evento.data_inicio >= hoje)
     
-    # Ordenar e paginar
-    eventos = query.order_by(Evento.data_inicio.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    # Paginar por cursor (data_inicio, id), dos mais recentes para os mais antigos, sem OFFSET
+    eventos = paginar_por_cursor(
+        query, [(Evento.data_inicio, True), (Evento.id, True)], cursor=cursor, por_pagina=per_page,
+        chave_total=('eventos', normalizar_texto(nome), periodo)
     )
     
     return render_template(
@@ -83,6 +91,43 @@ def novo():
     
     return render_template('eventos/form.html', form=form, title="Novo Evento")
 
+@bp.route('/recomendar-palestrantes')
+@login_required
+def recomendar_palestrantes():
+    """
+    Palestrantes recomendados para um evento, em JSON
+    
+    Parâmetros: descricao (texto do evento), palavra_chave (repetível ou separada
+    por vírgulas), k (quantidade, até 50) e excluir (ids já selecionados, repetível)
+    """
+    palavras_chave = [p for valor in request.args.getlist('palavra_chave') for p in valor.split(',') if p.strip()]
+    k = min(max(request.args.get('k', 10, type=int), 1), 50)
+    
+    resultado = motor_recomendacao.recomendar(
+        descricao=request.args.get('descricao', ''),
+        palavras_chave=palavras_chave,
+        k=k,
+        excluir=request.args.getlist('excluir', type=int)
+    )
+    
+    # Dados de exibição dos recomendados: uma consulta
+    ids = [r['palestrante_id'] for r in resultado['recomendacoes']]
+    palestrantes = {p.id: p for p in Palestrante.query.filter(Palestrante.id.in_(ids))} if ids else {}
+    recomendacoes = []
+    for recomendacao in resultado['recomendacoes']:
+        palestrante = palestrantes.get(recomendacao['palestrante_id'])
+        if palestrante is None:
+            continue
+        recomendacoes.append(dict(
+            recomendacao,
+            nome=palestrante.nome,
+            cargo=palestrante.linkedin_cargo_atual,
+            empresa=palestrante.linkedin_empresa_atual,
+            foto_url=acervo_fotos.url_miniatura(palestrante.foto_url, 'mini')
+        ))
+    
+    return jsonify({'palavras_chave': resultado['palavras_chave'], 'recomendacoes': recomendacoes})
+
 @bp.route('/<int:id>')
 @login_required
 def detalhes(id):
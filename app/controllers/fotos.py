@@ -0,0 +1,21 @@
+from flask import Blueprint, request, send_file, abort
+from flask_login import login_required
+
+from app.services.fotos import acervo_fotos, FORMATOS_MINIATURA
+
+bp = Blueprint('fotos', __name__)
+
+@bp.route('/<hash_foto>/<tamanho>')
+@login_required
+def miniatura(hash_foto, tamanho):
+    """Miniatura de uma foto do acervo, em WebP quando o navegador aceita"""
+    formato = 'webp' if request.accept_mimetypes['image/webp'] else 'jpg'
+    caminho = acervo_fotos.miniatura(hash_foto, tamanho, formato)
+    if caminho is None:
+        abort(404)
+    
+    # O conteúdo de um hash nunca muda: cache longo, mas só no navegador (exige login)
+    resposta = send_file(caminho, mimetype=FORMATOS_MINIATURA[formato][1], max_age=365 * 24 * 3600)
+    resposta.cache_control.private = True
+    resposta.headers['Vary'] = 'Accept'
+    return resposta
@@ -1,13 +1,25 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app
-from flask_login import login_required
-from werkzeug.utils import secure_filename
-import os
-from datetime import datetime
+from flask import (Blueprint, render_template, redirect, url_for, flash, request, current_app, jsonify,
+                   Response, stream_with_context)
+from flask_login import login_required, current_user
+import json
+import time
 
 from app import db
 from app.models.palestrante import Palestrante, PalavraChave
+from app.models.normalizacao import normalizar_texto
 from app.forms.palestrante import PalestranteForm, BuscarPalestranteForm, PalavraChaveForm
-from app.services.linkedin_crawler import LinkedInCrawler
+from app.models.tarefa import TarefaLinkedIn
+from app.services.tarefas import executor_tarefas
+from app.services.cache_perfis import cache_perfis
+from app.services.seletores import registro_seletores
+from app.services.fotos import acervo_fotos
+from app.services.importacao import importar_perfis
+from app.services.resultados import obter_resultados
+from app.services.canonicalizacao import resolver_palavras_chave
+from app.services.busca_textual import indice_busca
+from app.services.paginacao import paginar_por_cursor
+from app.services.especialidades import (MODOS, MODO_QUALQUER, interpretar_especialidades,
+                                         filtrar_especialidades, contar_especialidades)
 
 bp = Blueprint('palestrantes', __name__)
 
@@ -15,34 +27,45 @@ bp = Blueprint('palestrantes', __name__)
 @login_required
 def index():
     """Listar todos os palestrantes cadastrados"""
-    page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     per_page = 10  # Palestrantes por página
     
-    # Filtros
+    # Filtros (especialidade pode vir repetida ou separada por vírgulas)
     nome = request.args.get('nome', '')
-    especialidade = request.args.get('especialidade', '')
+    especialidades = interpretar_especialidades(request.args.getlist('especialidade'))
+    modo = request.args.get('modo', MODO_QUALQUER)
+    if modo not in MODOS:
+        modo = MODO_QUALQUER
     
     query = Palestrante.query
+    ordem = [(Palestrante.nome, False), (Palestrante.id, False)]
     
     # Aplicar filtros se fornecidos
-    if nome:
-        query = query.filter(Palestrante.nome.ilike(f'%{nome}%'))
-    
-    if especialidade:
-        palavra = PalavraChave.query.filter(PalavraChave.palavra.ilike(f'%{especialidade}%')).first()
-        if palavra:
-            query = query.filter(Palestrante.palavras_chave.contains(palavra))
+    query = filtrar_especialidades(query, especialidades, modo)
     
-    # Ordenar e paginar
-    palestrantes = query.order_by(Palestrante.nome).paginate(
-        page=page, per_page=per_page, error_out=False
+    # Busca textual (nome, cargo, empresa, bio e palavras-chave), por relevância
+    if nome:
+        query, relevancia = indice_busca.filtrar(query, nome)
+        if relevancia is not None:
+            ordem.insert(0, (relevancia, True))
+    
+    # Paginar por cursor sobre (nome, id), precedidos da relevância na busca textual, sem OFFSET
+    palestrantes = paginar_por_cursor(
+        query, ordem, cursor=cursor, por_pagina=per_page,
+        chave_total=('palestrantes', normalizar_texto(nome), tuple(especialidades), modo)
     )
     
+    # Quantidade de palestrantes do resultado por palavra-chave
+    facetas = contar_especialidades(query)
+    
     return render_template(
         'palestrantes/index.html', 
         palestrantes=palestrantes,
         nome_filtro=nome,
-        especialidade_filtro=especialidade
+        especialidade_filtro=', '.join(especialidades),
+        especialidades_filtro=especialidades,
+        modo_filtro=modo,
+        facetas=facetas
     )
 
 @bp.route('/novo', methods=['GET', 'POST'])
@@ -67,10 +90,10 @@ def novo():
         
         # Processar upload da foto, se fornecida
         if form.foto.data:
-            filename = secure_filename(f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{form.foto.data.filename}")
-            filepath = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
-            form.foto.data.save(filepath)
-            palestrante.foto_url = f"/static/uploads/{filename}"
+            try:
+                palestrante.foto_url = acervo_fotos.armazenar_upload(form.foto.data)
+            except ValueError as e:
+                flash(f'Foto não salva: {e}', 'warning')
         
         # Adicionar palavras-chave
         for palavra_id in form.palavras_chave.data:
@@ -119,10 +142,10 @@ def editar(id):
         
         # Processar upload da foto, se fornecida
         if form.foto.data:
-            filename = secure_filename(f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{form.foto.data.filename}")
-            filepath = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
-            form.foto.data.save(filepath)
-            palestrante.foto_url = f"/static/uploads/{filename}"
+            try:
+                palestrante.foto_url = acervo_fotos.armazenar_upload(form.foto.data)
+            except ValueError as e:
+                flash(f'Foto não salva: {e}', 'warning')
         
         # Atualizar palavras-chave (limpar e adicionar novamente)
         palestrante.palavras_chave = []
@@ -153,88 +176,227 @@ def excluir(id):
     flash(f'Palestrante {nome} excluído com sucesso!', 'success')
     return redirect(url_for('palestrantes.index'))
 
+def _tarefa_do_usuario(tarefa_id):
+    """Tarefa do LinkedIn solicitada pelo usuário atual (qualquer uma, para administradores); 404 caso contrário"""
+    query = TarefaLinkedIn.query.filter(TarefaLinkedIn.id == tarefa_id)
+    if not current_user.is_admin:
+        query = query.filter(TarefaLinkedIn.usuario_id == current_user.id)
+    return query.first_or_404()
+
 @bp.route('/buscar-linkedin', methods=['GET', 'POST'])
 @login_required
 def buscar_linkedin():
     """Buscar palestrantes no LinkedIn"""
     form = BuscarPalestranteForm()
     resultados = []
+    tarefa = None
     
     if form.validate_on_submit():
-        try:
-            # Inicializar o crawler
-            crawler = LinkedInCrawler()
-            
-            # Realizar a busca
-            palavras_chave = form.palavras_chave.data.split(',')
-            palavras_chave = [p.strip() for p in palavras_chave if p.strip()]
-            
-            resultados = crawler.buscar_profissionais(
-                palavras_chave=palavras_chave,
-                min_seguidores=form.min_seguidores.data or 0,
-                localizacao=form.localizacao.data or None,
-                max_resultados=form.max_resultados.data or 10
-            )
-            
+        palavras_chave = form.palavras_chave.data.split(',')
+        palavras_chave = [p.strip() for p in palavras_chave if p.strip()]
+        
+        # A busca é executada em segundo plano; a página acompanha o progresso
+        tarefa = executor_tarefas.enviar_busca({
+            'palavras_chave': palavras_chave,
+            'min_seguidores': form.min_seguidores.data or 0,
+            'localizacao': form.localizacao.data or None,
+            'max_resultados': form.max_resultados.data or 10,
+            'por_palavra': bool(form.busca_por_palavra.data)
+        }, usuario_id=current_user.id)
+        
+        if request.accept_mimetypes.best == 'application/json':
+            return jsonify(tarefa.to_dict()), 202
+        
+        return redirect(url_for('palestrantes.buscar_linkedin', tarefa=tarefa.id))
+    
+    # Exibir resultados de uma busca já realizada
+    tarefa_id = request.args.get('tarefa')
+    if tarefa_id:
+        tarefa = _tarefa_do_usuario(tarefa_id)
+        
+        if tarefa.status == TarefaLinkedIn.STATUS_CONCLUIDA:
+            resultados = tarefa.get_resultados()
             if not resultados:
                 flash('Nenhum resultado encontrado para os critérios informados.', 'info')
+        elif tarefa.status == TarefaLinkedIn.STATUS_CANCELADA:
+            resultados = tarefa.get_resultados()
+            flash('Busca no LinkedIn cancelada.', 'info')
+        elif tarefa.status == TarefaLinkedIn.STATUS_ERRO:
+            flash(f'Erro ao realizar busca no LinkedIn: {tarefa.erro}', 'danger')
+    
+    return render_template('palestrantes/buscar_linkedin.html', form=form, resultados=resultados, tarefa=tarefa)
+
+@bp.route('/tarefas/<tarefa_id>')
+@login_required
+def status_tarefa(tarefa_id):
+    """Consultar o andamento (e os resultados, se concluída) de uma tarefa do LinkedIn"""
+    tarefa = _tarefa_do_usuario(tarefa_id)
+    return jsonify(tarefa.to_dict())
+
+def _evento_sse(evento, dados, id_evento=None):
+    """Formata uma mensagem de Server-Sent Events"""
+    id_linha = f"id: {id_evento}\n" if id_evento is not None else ''
+    return f"{id_linha}event: {evento}\ndata: {json.dumps(dados, ensure_ascii=False)}\n\n"
+
+@bp.route('/tarefas/<tarefa_id>/eventos')
+@login_required
+def eventos_tarefa(tarefa_id):
+    """Transmitir (Server-Sent Events) os perfis de uma busca à medida que são extraídos"""
+    _tarefa_do_usuario(tarefa_id)
+    transmissao = executor_tarefas.transmissao(tarefa_id)
+    espera = current_app.config.get('LINKEDIN_EVENTOS_ESPERA', 15)
+    intervalo = current_app.config.get('LINKEDIN_EVENTOS_INTERVALO', 2.0)
+    
+    # Reconexão: o navegador informa o índice do último perfil recebido
+    ultimo = request.headers.get('Last-Event-ID', '')
+    inicio = int(ultimo) + 1 if ultimo.isdigit() else 0
+    
+    def gerar():
+        enviados = inicio
+        progresso = None
+        
+        # Tarefa em andamento neste processo: aguardar as novidades publicadas em memória,
+        # sem reter uma conexão do banco durante a espera
+        if transmissao is not None:
+            db.session.remove()
+            versao = -1
+            while True:
+                nova_versao, perfis, atual, finalizada = transmissao.aguardar(versao, enviados, espera)
+                for perfil in perfis:
+                    yield _evento_sse('perfil', perfil, enviados)
+                    enviados += 1
+                if atual != progresso:
+                    progresso = atual
+                    yield _evento_sse('progresso', {'atual': atual[0], 'total': atual[1]})
+                if finalizada:
+                    break
+                if nova_versao == versao:
+                    # Nada de novo: comentário para manter a conexão (e detectar a desconexão)
+                    yield ": aguardando\n\n"
+                versao = nova_versao
+        
+        # Estado final, gravado pela thread da tarefa (ou tarefa executada por outro processo)
+        while True:
+            db.session.expire_all()
+            tarefa = TarefaLinkedIn.query.get(tarefa_id)
+            
+            if tarefa.finalizada:
+                for perfil in tarefa.get_resultados()[enviados:]:
+                    yield _evento_sse('perfil', perfil, enviados)
+                    enviados += 1
+                yield _evento_sse('fim', tarefa.to_dict(incluir_resultados=False))
+                return
             
-        except Exception as e:
-            flash(f'Erro ao realizar busca no LinkedIn: {str(e)}', 'danger')
+            atual = (tarefa.progresso_atual or 0, tarefa.progresso_total or 0)
+            if atual != progresso:
+                progresso = atual
+                yield _evento_sse('progresso', {'atual': atual[0], 'total': atual[1]})
+            
+            db.session.remove()
+            time.sleep(intervalo)
+    
+    return Response(stream_with_context(gerar()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # Não acumular a resposta em proxies (nginx)
+    })
+
+@bp.route('/tarefas/<tarefa_id>/cancelar', methods=['POST'])
+@login_required
+def cancelar_tarefa(tarefa_id):
+    """Cancelar uma busca do LinkedIn, liberando a sessão do navegador"""
+    tarefa = _tarefa_do_usuario(tarefa_id)
+    cancelada = executor_tarefas.cancelar(tarefa.id)
     
-    return render_template('palestrantes/buscar_linkedin.html', form=form, resultados=resultados)
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify({'cancelada': cancelada})
+    
+    if cancelada:
+        flash('Cancelamento da busca solicitado.', 'info')
+    return redirect(url_for('palestrantes.buscar_linkedin', tarefa=tarefa.id))
+
+@bp.route('/linkedin/cache')
+@login_required
+def estatisticas_cache():
+    """Contadores de acertos/falhas do cache de perfis do LinkedIn"""
+    return jsonify(cache_perfis.estatisticas())
+
+@bp.route('/linkedin/seletores')
+@login_required
+def estatisticas_seletores():
+    """Taxas de acerto dos seletores de extração do LinkedIn e campos em alerta"""
+    return jsonify(registro_seletores.estatisticas())
 
 @bp.route('/importar-linkedin', methods=['POST'])
 @login_required
 def importar_linkedin():
-    """Importar um perfil do LinkedIn para o banco de dados"""
-    # Verificar se os dados necessários foram enviados
-    if not all(k in request.form for k in ('nome', 'cargo_atual', 'perfil_url')):
-        flash('Dados insuficientes para importar o perfil.', 'danger')
+    """Importar um perfil do LinkedIn, a partir do id do resultado da busca guardado no servidor"""
+    resultado_id = request.form.get('resultado_id')
+    perfil = obter_resultados([resultado_id], usuario_id=current_user.id).get(resultado_id)
+    
+    if perfil is None:
+        flash('Resultado da busca não encontrado ou expirado. Refaça a busca para importar o perfil.', 'danger')
         return redirect(url_for('palestrantes.buscar_linkedin'))
     
     # Verificar se já existe palestrante com esta URL
-    perfil_url = request.form.get('perfil_url')
-    existente = Palestrante.query.filter_by(linkedin_url=perfil_url).first()
+    existente = Palestrante.query.filter_by(linkedin_url=perfil.get('perfil_url')).first()
     
     if existente:
         flash(f'Palestrante {existente.nome} já existe no sistema com este perfil do LinkedIn.', 'warning')
         return redirect(url_for('palestrantes.detalhes', id=existente.id))
     
-    # Criar novo palestrante com os dados do LinkedIn
-    palestrante = Palestrante(
-        nome=request.form.get('nome'),
-        linkedin_url=perfil_url,
-        linkedin_cargo_atual=request.form.get('cargo_atual'),
-        linkedin_empresa_atual=request.form.get('empresa_atual'),
-        bio=request.form.get('bio', ''),
-        foto_url=request.form.get('foto_url', ''),
-        linkedin_seguidores=request.form.get('seguidores', 0),
-        linkedin_ultima_atualizacao=datetime.utcnow()
-    )
-    
-    # Adicionar habilidades como palavras-chave
-    if 'habilidades' in request.form and request.form.get('habilidades'):
-        habilidades = request.form.get('habilidades').split(',')
-        for hab in habilidades:
-            hab = hab.strip()
-            if hab:
-                # Verificar se a palavra-chave já existe ou criar nova
-                palavra = PalavraChave.query.filter_by(palavra=hab).first()
-                if not palavra:
-                    palavra = PalavraChave(palavra=hab)
-                    db.session.add(palavra)
-                
-                # Adicionar ao palestrante
-                palestrante.palavras_chave.append(palavra)
-    
-    # Salvar no banco
-    db.session.add(palestrante)
-    db.session.commit()
+    resultado = importar_perfis([perfil])
+    if not resultado['palestrantes']:
+        flash('Dados insuficientes para importar o perfil.', 'danger')
+        return redirect(url_for('palestrantes.buscar_linkedin'))
     
+    palestrante = resultado['palestrantes'][0]
     flash(f'Palestrante {palestrante.nome} importado com sucesso do LinkedIn!', 'success')
     return redirect(url_for('palestrantes.detalhes', id=palestrante.id))
 
+@bp.route('/importar-linkedin/lote', methods=['POST'])
+@login_required
+def importar_linkedin_lote():
+    """Importar de uma vez vários perfis do LinkedIn (JSON {"resultados": [ids]} ou campos "resultado_id")"""
+    dados = request.get_json(silent=True)
+    if isinstance(dados, dict):
+        ids_resultados = dados.get('resultados')
+    else:
+        ids_resultados = request.form.getlist('resultado_id')
+    
+    if not isinstance(ids_resultados, list) or not ids_resultados:
+        if request.is_json:
+            return jsonify({'erro': 'Informe os resultados a importar.'}), 400
+        flash('Nenhum perfil selecionado para importar.', 'danger')
+        return redirect(url_for('palestrantes.buscar_linkedin'))
+    
+    ids_resultados = [str(id_resultado) for id_resultado in ids_resultados]
+    perfis = obter_resultados(ids_resultados, usuario_id=current_user.id)
+    
+    try:
+        resultado = importar_perfis(list(perfis.values()))
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Erro na importação em lote do LinkedIn: {e}")
+        if request.is_json:
+            return jsonify({'erro': str(e)}), 500
+        flash(f'Erro ao importar os perfis do LinkedIn: {e}', 'danger')
+        return redirect(url_for('palestrantes.buscar_linkedin'))
+    
+    resumo = {
+        'criados': resultado['criados'],
+        'ignorados': resultado['ignorados'],
+        'invalidos': resultado['invalidos'],
+        'expirados': len(set(ids_resultados)) - len(perfis),
+        'palavras_chave_criadas': resultado['palavras_chave_criadas'],
+        'ids': [p.id for p in resultado['palestrantes']]
+    }
+    if request.is_json:
+        return jsonify(resumo)
+    
+    flash(f"{resumo['criados']} palestrante(s) importado(s) do LinkedIn; "
+          f"{resumo['ignorados']} já cadastrado(s) ou repetido(s).", 'success')
+    return redirect(url_for('palestrantes.index'))
+
 @bp.route('/atualizar-linkedin/<int:id>', methods=['POST'])
 @login_required
 def atualizar_linkedin(id):
@@ -246,54 +408,14 @@ def atualizar_linkedin(id):
         flash('Este palestrante não possui URL do LinkedIn cadastrada.', 'danger')
         return redirect(url_for('palestrantes.detalhes', id=palestrante.id))
     
-    try:
-        # Inicializar o crawler
-        crawler = LinkedInCrawler()
-        
-        # Obter informações atualizadas
-        info = crawler.obter_info_perfil(palestrante.linkedin_url)
-        
-        # Atualizar dados do palestrante
-        if info.get('nome'):
-            palestrante.nome = info['nome']
-        if info.get('cargo_atual'):
-            palestrante.linkedin_cargo_atual = info['cargo_atual']
-        if info.get('empresa_atual'):
-            palestrante.linkedin_empresa_atual = info['empresa_atual']
-        if info.get('bio'):
-            palestrante.bio = info['bio']
-        if info.get('foto_url'):
-            palestrante.foto_url = info['foto_url']
-        if info.get('seguidores'):
-            palestrante.linkedin_seguidores = info['seguidores']
-        
-        # Atualizar habilidades como palavras-chave
-        if info.get('habilidades'):
-            for hab in info['habilidades']:
-                hab = hab.strip()
-                if hab:
-                    # Verificar se a palavra-chave já existe ou criar nova
-                    palavra = PalavraChave.query.filter_by(palavra=hab).first()
-                    if not palavra:
-                        palavra = PalavraChave(palavra=hab)
-                        db.session.add(palavra)
-                    
-                    # Adicionar ao palestrante se ainda não tiver
-                    if palavra not in palestrante.palavras_chave:
-                        palestrante.palavras_chave.append(palavra)
-        
-        # Atualizar timestamp
-        palestrante.linkedin_ultima_atualizacao = datetime.utcnow()
-        
-        # Salvar no banco
-        db.session.commit()
-        
-        flash(f'Dados do palestrante {palestrante.nome} atualizados com sucesso do LinkedIn!', 'success')
+    # A atualização é executada em segundo plano
+    tarefa = executor_tarefas.enviar_atualizacao(palestrante.id, usuario_id=current_user.id)
     
-    except Exception as e:
-        flash(f'Erro ao atualizar dados do LinkedIn: {str(e)}', 'danger')
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify(tarefa.to_dict()), 202
     
-    return redirect(url_for('palestrantes.detalhes', id=palestrante.id))
+    flash(f'Atualização dos dados de {palestrante.nome} pelo LinkedIn iniciada. Acompanhe o andamento nesta página.', 'info')
+    return redirect(url_for('palestrantes.detalhes', id=palestrante.id, tarefa=tarefa.id))
 
 @bp.route('/palavras-chave')
 @login_required
@@ -312,10 +434,12 @@ def nova_palavra_chave():
     
     if form.validate_on_submit():
         # Verificar se já existe
-        existente = PalavraChave.query.filter_by(palavra=form.palavra.data).first()
+        # Verificar sem diferenciar acentos e maiúsculas ("inovacao" e "Inovação"),
+        # inclusive entre as grafias de palavras-chave já fundidas
+        existente = resolver_palavras_chave([form.palavra.data]).get(normalizar_texto(form.palavra.data))
         
         if existente:
-            flash(f'A palavra-chave "{form.palavra.data}" já existe.', 'warning')
+            flash(f'A palavra-chave "{existente.palavra}" já existe.', 'warning')
         else:
             # Criar nova palavra-chave
             palavra = PalavraChave(palavra=form.palavra.data)
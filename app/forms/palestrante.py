@@ -1,6 +1,6 @@
 from flask_wtf import FlaskForm
 from flask_wtf.file import FileField, FileAllowed
-from wtforms import StringField, TextAreaField, SelectMultipleField, IntegerField, SubmitField
+from wtforms import StringField, TextAreaField, SelectMultipleField, IntegerField, BooleanField, SubmitField
 from wtforms.validators import DataRequired, Email, Length, Optional, URL, NumberRange
 
 class PalestranteForm(FlaskForm):
@@ -28,6 +28,7 @@ class BuscarPalestranteForm(FlaskForm):
     max_resultados = IntegerField('Máximo de resultados', 
                                  validators=[Optional(), NumberRange(min=1, max=20)],
                                  default=10)
+    busca_por_palavra = BooleanField('Buscar cada palavra-chave separadamente e combinar os resultados')
     submit = SubmitField('Buscar')
 
 class PalavraChaveForm(FlaskForm):
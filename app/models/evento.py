@@ -1,5 +1,8 @@
 from app import db
 from datetime import datetime
+from sqlalchemy.orm import validates
+
+from app.models.normalizacao import normalizar_texto
 
 # Tabela de associação entre palestrantes e eventos
 palestrante_eventos = db.Table(
@@ -12,6 +15,8 @@ class Evento(db.Model):
     """Modelo para eventos do Senac Cápsula"""
     id = db.Column(db.Integer, primary_key=True)
     nome = db.Column(db.String(100), nullable=False)
+    # Sem acentos e em minúsculas, preenchida ao atribuir `nome` (ver normalizar_texto)
+    nome_normalizado = db.Column(db.String(100), index=True)
     descricao = db.Column(db.Text)
     data_inicio = db.Column(db.DateTime, nullable=False)
     data_fim = db.Column(db.DateTime, nullable=False)
@@ -32,6 +37,16 @@ class Evento(db.Model):
     data_criacao = db.Column(db.DateTime, default=datetime.utcnow)
     data_atualizacao = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Índice da paginação por cursor da listagem
+    __table_args__ = (
+        db.Index('ix_evento_data_inicio_id', 'data_inicio', 'id'),
+    )
+    
+    @validates('nome')
+    def _normalizar_nome(self, chave, nome):
+        self.nome_normalizado = normalizar_texto(nome)
+        return nome
+    
     def __repr__(self):
         return f'<Evento {self.nome}>'
 
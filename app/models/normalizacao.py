@@ -0,0 +1,31 @@
+import re
+import unicodedata
+
+from sqlalchemy import and_
+
+def normalizar_texto(texto):
+    """
+    Forma de comparação de um texto: sem acentos, em minúsculas e com os
+    espaços simplificados ("  Inovação " -> "inovacao")
+
+    Returns:
+        str: Texto normalizado, ou None se `texto` for None
+    """
+    if texto is None:
+        return None
+    decomposto = unicodedata.normalize('NFKD', texto)
+    sem_acentos = ''.join(c for c in decomposto if not unicodedata.combining(c))
+    return re.sub(r'\s+', ' ', sem_acentos).strip().casefold()
+
+def filtro_prefixo(coluna, prefixo):
+    """
+    Condição "começa com `prefixo`" sobre uma coluna normalizada, escrita como
+    intervalo (coluna >= prefixo AND coluna < prefixo + maior caractere) para
+    que o banco use o índice da coluna, ao contrário de LIKE/ILIKE
+
+    Args:
+        coluna: Coluna normalizada (ex.: Palestrante.nome_normalizado)
+        prefixo (str): Texto digitado; é normalizado aqui
+    """
+    prefixo = normalizar_texto(prefixo)
+    return and_(coluna >= prefixo, coluna < prefixo + '\U0010ffff')
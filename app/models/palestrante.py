@@ -1,26 +1,55 @@
 from app import db
 from datetime import datetime
+from sqlalchemy.orm import validates
+
+from app.models.normalizacao import normalizar_texto
 
 # Tabela de associação entre palestrantes e palavras-chave
 palestrante_palavras_chave = db.Table(
     'palestrante_palavras_chave',
     db.Column('palestrante_id', db.Integer, db.ForeignKey('palestrante.id'), primary_key=True),
-    db.Column('palavra_chave_id', db.Integer, db.ForeignKey('palavra_chave.id'), primary_key=True)
+    db.Column('palavra_chave_id', db.Integer, db.ForeignKey('palavra_chave.id'), primary_key=True),
+    # A chave primária começa por palestrante_id; este índice atende às consultas por palavra-chave
+    db.Index('ix_palestrante_palavras_chave_palavra', 'palavra_chave_id', 'palestrante_id')
 )
 
 class PalavraChave(db.Model):
     """Modelo para palavras-chave/especialidades dos palestrantes"""
     id = db.Column(db.Integer, primary_key=True)
     palavra = db.Column(db.String(50), unique=True, nullable=False)
+    # Sem acentos e em minúsculas, preenchida ao atribuir `palavra` (ver normalizar_texto)
+    palavra_normalizada = db.Column(db.String(50), index=True)
+    
+    @validates('palavra')
+    def _normalizar_palavra(self, chave, palavra):
+        self.palavra_normalizada = normalizar_texto(palavra)
+        return palavra
     
     def __repr__(self):
         return f'<PalavraChave {self.palavra}>'
 
+class AliasPalavraChave(db.Model):
+    """Grafia alternativa (já normalizada) de uma palavra-chave, mapeada para a forma canônica"""
+    id = db.Column(db.Integer, primary_key=True)
+    alias_normalizado = db.Column(db.String(100), unique=True, nullable=False)
+    palavra_chave_id = db.Column(db.Integer, db.ForeignKey('palavra_chave.id'), nullable=False, index=True)
+    
+    palavra_chave = db.relationship(
+        'PalavraChave',
+        backref=db.backref('aliases', lazy='dynamic', cascade='all, delete-orphan')
+    )
+    
+    def __repr__(self):
+        return f'<AliasPalavraChave {self.alias_normalizado} -> {self.palavra_chave_id}>'
+
 class Palestrante(db.Model):
     """Modelo para palestrantes"""
     id = db.Column(db.Integer, primary_key=True)
     nome = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(100), nullable=False, unique=True)
+    # Sem acentos e em minúsculas, preenchida ao atribuir `nome` (ver normalizar_texto)
+    nome_normalizado = db.Column(db.String(100), index=True)
+    # Opcional: perfis importados do LinkedIn não trazem email (NULLs não conflitam no índice único)
+    email = db.Column(db.String(100), unique=True)
     telefone = db.Column(db.String(20))
     bio = db.Column(db.Text)
     foto_url = db.Column(db.String(255))
@@ -31,6 +60,9 @@ class Palestrante(db.Model):
     linkedin_cargo_atual = db.Column(db.String(100))
     linkedin_empresa_atual = db.Column(db.String(100))
     linkedin_ultima_atualizacao = db.Column(db.DateTime, default=datetime.utcnow)
+    # Falhas seguidas na atualização pelo LinkedIn e quando tentar de novo
+    linkedin_falhas = db.Column(db.Integer, default=0)
+    linkedin_proxima_tentativa = db.Column(db.DateTime)
     
     # Informações adicionais
     ja_participou = db.Column(db.Boolean, default=False)
@@ -47,5 +79,15 @@ class Palestrante(db.Model):
     data_criacao = db.Column(db.DateTime, default=datetime.utcnow)
     data_atualizacao = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Índice da paginação por cursor da listagem
+    __table_args__ = (
+        db.Index('ix_palestrante_nome_id', 'nome', 'id'),
+    )
+    
+    @validates('nome')
+    def _normalizar_nome(self, chave, nome):
+        self.nome_normalizado = normalizar_texto(nome)
+        return nome
+    
     def __repr__(self):
         return f'<Palestrante {self.nome}>'
\ No newline at end of file
@@ -0,0 +1,88 @@
+from app import db
+from datetime import datetime
+import json
+import uuid
+
+class TarefaLinkedIn(db.Model):
+    """Modelo para tarefas do LinkedIn executadas em segundo plano (buscas e atualizações)"""
+    TIPO_BUSCA = 'busca'
+    TIPO_ATUALIZACAO = 'atualizacao'
+
+    STATUS_PENDENTE = 'pendente'
+    STATUS_EXECUTANDO = 'executando'
+    STATUS_CONCLUIDA = 'concluida'
+    STATUS_ERRO = 'erro'
+    STATUS_CANCELADA = 'cancelada'
+
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    tipo = db.Column(db.String(20), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default=STATUS_PENDENTE, index=True)
+
+    # Parâmetros e resultados serializados em JSON
+    parametros = db.Column(db.Text)
+    resultados = db.Column(db.Text)
+    estatisticas = db.Column(db.Text)
+    erro = db.Column(db.Text)
+
+    # Progresso por perfil visitado
+    progresso_atual = db.Column(db.Integer, default=0)
+    progresso_total = db.Column(db.Integer, default=0)
+
+    # Relacionamentos
+    usuario_id = db.Column(db.Integer, db.ForeignKey('usuario.id'))
+    palestrante_id = db.Column(db.Integer, db.ForeignKey('palestrante.id'))
+
+    # Timestamps
+    data_criacao = db.Column(db.DateTime, default=datetime.utcnow)
+    data_inicio = db.Column(db.DateTime)
+    data_conclusao = db.Column(db.DateTime)
+
+    def get_parametros(self):
+        """Retorna os parâmetros da tarefa como dicionário"""
+        return json.loads(self.parametros) if self.parametros else {}
+
+    def set_parametros(self, parametros):
+        """Serializa os parâmetros da tarefa"""
+        self.parametros = json.dumps(parametros, ensure_ascii=False)
+
+    def get_resultados(self):
+        """Retorna os resultados da tarefa (lista de perfis)"""
+        return json.loads(self.resultados) if self.resultados else []
+
+    def set_resultados(self, resultados):
+        """Serializa os resultados da tarefa"""
+        self.resultados = json.dumps(resultados, ensure_ascii=False)
+
+    def get_estatisticas(self):
+        """Retorna as estatísticas da busca (cards, perfis evitados etc.)"""
+        return json.loads(self.estatisticas) if self.estatisticas else {}
+
+    def set_estatisticas(self, estatisticas):
+        """Serializa as estatísticas da busca"""
+        self.estatisticas = json.dumps(estatisticas, ensure_ascii=False)
+
+    @property
+    def finalizada(self):
+        return self.status in (self.STATUS_CONCLUIDA, self.STATUS_ERRO, self.STATUS_CANCELADA)
+
+    def to_dict(self, incluir_resultados=True):
+        """Representação da tarefa para a API de acompanhamento"""
+        dados = {
+            'id': self.id,
+            'tipo': self.tipo,
+            'status': self.status,
+            'progresso_atual': self.progresso_atual or 0,
+            'progresso_total': self.progresso_total or 0,
+            'erro': self.erro,
+            'estatisticas': self.get_estatisticas(),
+            'palestrante_id': self.palestrante_id,
+            'data_criacao': self.data_criacao.isoformat() if self.data_criacao else None,
+            'data_inicio': self.data_inicio.isoformat() if self.data_inicio else None,
+            'data_conclusao': self.data_conclusao.isoformat() if self.data_conclusao else None,
+        }
+        if incluir_resultados and self.status in (self.STATUS_CONCLUIDA, self.STATUS_CANCELADA):
+            dados['resultados'] = self.get_resultados()
+        return dados
+
+    def __repr__(self):
+        return f'<TarefaLinkedIn {self.id} {self.tipo} {self.status}>'
@@ -0,0 +1,237 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, or_
+
+from app import db
+from app.models.palestrante import Palestrante
+from app.models.evento import Evento, palestrante_eventos
+from app.services.crawler_pool import crawler_pool
+from app.services.sincronizacao import aplicar_info_linkedin
+
+logger = logging.getLogger(__name__)
+
+def selecionar_desatualizados(dias=30, limite=None):
+    """
+    Seleciona os palestrantes cujos dados do LinkedIn estão desatualizados
+
+    Palestrantes com eventos futuros vêm primeiro (do evento mais próximo para
+    o mais distante); depois, os atualizados há mais tempo. Os que falharam
+    recentemente ficam de fora até a próxima tentativa (ver registrar_falha).
+
+    Args:
+        dias (int): Idade mínima da última atualização, em dias
+        limite (int): Quantidade máxima de palestrantes (opcional)
+
+    Returns:
+        list: IDs dos palestrantes, em ordem de prioridade
+    """
+    agora = datetime.utcnow()
+    corte = agora - timedelta(days=dias)
+
+    # Data do próximo evento de cada palestrante
+    proximos = db.session.query(
+        palestrante_eventos.c.palestrante_id,
+        func.min(Evento.data_inicio).label('proximo_evento')
+    ).join(
+        Evento, Evento.id == palestrante_eventos.c.evento_id
+    ).filter(
+        Evento.data_inicio >= agora
+    ).group_by(palestrante_eventos.c.palestrante_id).subquery()
+
+    query = db.session.query(Palestrante.id).outerjoin(
+        proximos, proximos.c.palestrante_id == Palestrante.id
+    ).filter(
+        Palestrante.linkedin_url.isnot(None),
+        Palestrante.linkedin_url != '',
+        or_(
+            Palestrante.linkedin_ultima_atualizacao.is_(None),
+            Palestrante.linkedin_ultima_atualizacao < corte
+        ),
+        or_(
+            Palestrante.linkedin_proxima_tentativa.is_(None),
+            Palestrante.linkedin_proxima_tentativa <= agora
+        )
+    ).order_by(
+        proximos.c.proximo_evento.is_(None),
+        proximos.c.proximo_evento,
+        Palestrante.linkedin_ultima_atualizacao
+    )
+
+    if limite:
+        query = query.limit(limite)
+
+    return [id for (id,) in query.all()]
+
+def registrar_falha(palestrante, espera_falha=6.0, espera_maxima=None):
+    """
+    Registra uma tentativa de atualização que falhou e adia a próxima,
+    dobrando a espera a cada falha seguida. Não realiza commit.
+
+    Args:
+        palestrante (Palestrante): Palestrante cujo perfil não pôde ser lido
+        espera_falha (float): Espera após a primeira falha, em horas
+        espera_maxima (timedelta): Limite da espera (opcional)
+    """
+    palestrante.linkedin_falhas = (palestrante.linkedin_falhas or 0) + 1
+    # Limitar o expoente evita estouro com muitas falhas seguidas
+    espera = timedelta(hours=espera_falha * 2 ** min(palestrante.linkedin_falhas - 1, 16))
+    if espera_maxima is not None:
+        espera = min(espera, espera_maxima)
+    palestrante.linkedin_proxima_tentativa = datetime.utcnow() + espera
+
+def _ler_perfil(crawler, linkedin_url):
+    """
+    Visita o perfil, distinguindo falhas do perfil (devolvidas) de problemas
+    do navegador (propagados, para que o pool descarte a sessão)
+
+    Returns:
+        tuple: (dados do perfil, mensagem de erro ou None)
+    """
+    try:
+        info = crawler.obter_info_perfil(linkedin_url, forcar_atualizacao=True)
+    except Exception as e:
+        if not crawler.esta_saudavel():
+            raise
+        return {}, str(e)
+    return info, None if info.get('nome') else 'perfil não pôde ser lido'
+
+def atualizar_desatualizados(dias=30, tamanho_lote=10, limite=None, intervalo=5.0, parar=None, espera_falha=6.0):
+    """
+    Atualiza pelo LinkedIn os palestrantes desatualizados, em lotes
+
+    Cada lote é carregado com uma única consulta e gravado com um único
+    commit. Entre uma visita de perfil e outra há um intervalo mínimo, para
+    não sobrecarregar o LinkedIn. Um perfil que não pôde ser lido tem a
+    tentativa registrada e só volta a ser selecionado depois de uma espera.
+
+    Args:
+        dias (int): Idade mínima da última atualização, em dias
+        tamanho_lote (int): Palestrantes por commit
+        limite (int): Quantidade máxima de palestrantes nesta execução (opcional)
+        intervalo (float): Intervalo mínimo entre visitas de perfil, em segundos
+        parar (threading.Event): Sinal para interromper a execução (opcional)
+        espera_falha (float): Espera após a primeira falha de um perfil, em horas
+
+    Returns:
+        dict: Estatísticas da execução
+    """
+    inicio = time.monotonic()
+    ids = selecionar_desatualizados(dias, limite)
+    estatisticas = {
+        'selecionados': len(ids),
+        'atualizados': 0,
+        'falhas': 0,
+        'lotes': 0,
+        'erros': []
+    }
+
+    if ids:
+        ultima_visita = 0.0
+        interrompido = False
+        for i in range(0, len(ids), tamanho_lote):
+            if interrompido or (parar is not None and parar.is_set()):
+                break
+
+            lote = Palestrante.query.filter(Palestrante.id.in_(ids[i:i + tamanho_lote])).all()
+            atualizados_lote = 0
+
+            for palestrante in lote:
+                if parar is not None and parar.is_set():
+                    break
+
+                # Respeitar o intervalo mínimo entre visitas, sem ocupar uma sessão do pool
+                espera = intervalo - (time.monotonic() - ultima_visita)
+                if espera > 0:
+                    time.sleep(espera)
+                ultima_visita = time.monotonic()
+
+                try:
+                    # A sessão fica emprestada só durante a visita ao perfil
+                    with crawler_pool.sessao() as crawler:
+                        info, erro = _ler_perfil(crawler, palestrante.linkedin_url)
+                except Exception as e:
+                    # Sem sessão disponível ou navegador com problema: gravar o lote e parar
+                    estatisticas['erros'].append(f'sessão do LinkedIn: {e}')
+                    logger.error(f"Atualização do LinkedIn interrompida: {e}")
+                    interrompido = True
+                    break
+
+                if erro:
+                    registrar_falha(palestrante, espera_falha, timedelta(days=dias))
+                    estatisticas['falhas'] += 1
+                    estatisticas['erros'].append(f'{palestrante.id}: {erro}')
+                    continue
+
+                aplicar_info_linkedin(palestrante, info)
+                atualizados_lote += 1
+
+            try:
+                db.session.commit()
+                estatisticas['atualizados'] += atualizados_lote
+            except Exception as e:
+                db.session.rollback()
+                estatisticas['falhas'] += atualizados_lote
+                estatisticas['erros'].append(f'lote {estatisticas["lotes"] + 1}: {e}')
+                logger.error(f"Erro ao gravar lote de atualização do LinkedIn: {e}")
+
+            estatisticas['lotes'] += 1
+
+    duracao = time.monotonic() - inicio
+    estatisticas['duracao_s'] = round(duracao, 1)
+    estatisticas['perfis_por_minuto'] = round(estatisticas['atualizados'] * 60 / duracao, 2) if duracao else 0.0
+
+    logger.info(
+        f"Atualização do LinkedIn: {estatisticas['atualizados']} atualizados, "
+        f"{estatisticas['falhas']} falhas em {estatisticas['duracao_s']}s"
+    )
+    return estatisticas
+
+class AgendadorAtualizacao:
+    """Executa `atualizar_desatualizados` periodicamente em uma thread em segundo plano"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self._parar = threading.Event()
+        self._thread = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions['agendador_atualizacao'] = self
+        if app.config.get('LINKEDIN_AGENDADOR_ATIVO'):
+            self.iniciar()
+
+    def iniciar(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._executar, name='agendador-linkedin', daemon=True)
+        self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+
+    def _executar(self):
+        config = self.app.config
+        while not self._parar.is_set():
+            try:
+                with self.app.app_context():
+                    atualizar_desatualizados(
+                        dias=config.get('LINKEDIN_ATUALIZACAO_DIAS', 30),
+                        tamanho_lote=config.get('LINKEDIN_ATUALIZACAO_LOTE', 10),
+                        limite=config.get('LINKEDIN_ATUALIZACAO_LIMITE'),
+                        intervalo=config.get('LINKEDIN_ATUALIZACAO_INTERVALO', 5.0),
+                        parar=self._parar,
+                        espera_falha=config.get('LINKEDIN_ATUALIZACAO_ESPERA_FALHA', 6.0)
+                    )
+            except Exception as e:
+                logger.error(f"Erro no agendador de atualização do LinkedIn: {e}")
+
+            self._parar.wait(config.get('LINKEDIN_AGENDADOR_PERIODO', 3600))
+
+# Instância única compartilhada pela aplicação
+agendador_atualizacao = AgendadorAtualizacao()
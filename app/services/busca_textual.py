@@ -0,0 +1,314 @@
+import logging
+import re
+import time
+
+from sqlalchemy import Float, Integer, bindparam, event, inspect, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import object_session
+
+from app import db
+from app.models.palestrante import Palestrante, PalavraChave
+from app.models.normalizacao import normalizar_texto
+
+logger = logging.getLogger(__name__)
+
+TABELA_INDICE = 'palestrante_busca'
+
+# Configuração de idioma do PostgreSQL (to_tsvector/to_tsquery)
+CONFIGURACAO_PG = 'portuguese'
+
+# Pesos das colunas no bm25 do SQLite: nome, cargo, empresa, bio, palavras-chave
+PESOS_SQLITE = (10.0, 4.0, 4.0, 1.0, 6.0)
+
+# Atributos de Palestrante que fazem parte do índice (alterações nos demais não o reindexam)
+ATRIBUTOS_INDEXADOS = ('nome', 'linkedin_cargo_atual', 'linkedin_empresa_atual', 'bio', 'palavras_chave')
+
+# Texto das palavras-chave de um palestrante, por dialeto
+_PALAVRAS_CHAVE_SQL = """
+    SELECT {agregacao}
+    FROM palestrante_palavras_chave pk
+    JOIN palavra_chave k ON k.id = pk.palavra_chave_id
+    WHERE pk.palestrante_id = p.id
+"""
+
+_SQLITE = {
+    'criar': [
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS {TABELA_INDICE} USING fts5(
+            nome, cargo, empresa, bio, palavras_chave,
+            tokenize = 'unicode61 remove_diacritics 2'
+        )""",
+    ],
+    'remover': [f"DROP TABLE IF EXISTS {TABELA_INDICE}"],
+    'apagar': f"DELETE FROM {TABELA_INDICE} WHERE rowid IN :ids",
+    'inserir': f"""
+        INSERT INTO {TABELA_INDICE} (rowid, nome, cargo, empresa, bio, palavras_chave)
+        SELECT p.id, coalesce(p.nome, ''), coalesce(p.linkedin_cargo_atual, ''),
+               coalesce(p.linkedin_empresa_atual, ''), coalesce(p.bio, ''),
+               coalesce(({_PALAVRAS_CHAVE_SQL.format(agregacao="group_concat(k.palavra, ' ')")}), '')
+        FROM palestrante p
+    """,
+    'consultar': f"""
+        SELECT rowid AS id, -bm25({TABELA_INDICE}, {', '.join(map(str, PESOS_SQLITE))}) AS relevancia
+        FROM {TABELA_INDICE}
+        WHERE {TABELA_INDICE} MATCH :consulta
+    """,
+}
+
+_POSTGRESQL = {
+    'criar': [
+        f"""CREATE TABLE IF NOT EXISTS {TABELA_INDICE} (
+            palestrante_id INTEGER PRIMARY KEY,
+            documento tsvector NOT NULL
+        )""",
+        f"CREATE INDEX IF NOT EXISTS ix_{TABELA_INDICE}_documento ON {TABELA_INDICE} USING GIN (documento)",
+    ],
+    'remover': [f"DROP TABLE IF EXISTS {TABELA_INDICE}"],
+    'apagar': f"DELETE FROM {TABELA_INDICE} WHERE palestrante_id IN :ids",
+    'inserir': f"""
+        INSERT INTO {TABELA_INDICE} (palestrante_id, documento)
+        SELECT p.id,
+               setweight(to_tsvector('{CONFIGURACAO_PG}', coalesce(p.nome, '')), 'A') ||
+               setweight(to_tsvector('{CONFIGURACAO_PG}', coalesce(({_PALAVRAS_CHAVE_SQL.format(agregacao="string_agg(k.palavra, ' ')")}), '')), 'B') ||
+               setweight(to_tsvector('{CONFIGURACAO_PG}', coalesce(p.linkedin_cargo_atual, '') || ' ' ||
+                                                          coalesce(p.linkedin_empresa_atual, '')), 'C') ||
+               setweight(to_tsvector('{CONFIGURACAO_PG}', coalesce(p.bio, '')), 'D')
+        FROM palestrante p
+    """,
+    'consultar': f"""
+        SELECT palestrante_id AS id, ts_rank_cd(documento, consulta) AS relevancia
+        FROM {TABELA_INDICE}, to_tsquery('{CONFIGURACAO_PG}', :consulta) AS consulta
+        WHERE documento @@ consulta
+    """,
+}
+
+_DIALETOS = {'sqlite': _SQLITE, 'postgresql': _POSTGRESQL}
+
+def _termos(busca):
+    """Palavras da busca, sem pontuação nem operadores"""
+    return re.findall(r'\w+', busca or '')
+
+def montar_consulta(busca, dialeto):
+    """
+    Converte o texto digitado na sintaxe de consulta do índice: todas as
+    palavras precisam aparecer (em qualquer campo), e a última pode estar
+    incompleta ("ana sil" encontra "Ana Silva")
+
+    Returns:
+        str: Consulta, ou '' se não houver palavras
+    """
+    termos = _termos(busca)
+    if not termos:
+        return ''
+    if dialeto == 'postgresql':
+        return ' & '.join(termos[:-1] + [f'{termos[-1]}:*'])
+    return ' '.join([f'"{t}"' for t in termos[:-1]] + [f'"{termos[-1]}"*'])
+
+def incluir_na_migracao(objeto, nome, tipo, refletido, comparado):
+    """
+    Filtro `include_object` do Alembic: a tabela do índice (e as tabelas
+    internas do FTS5) não fazem parte dos modelos e não devem ser removidas
+    pelas migrações geradas automaticamente
+    """
+    return not (tipo == 'table' and refletido and comparado is None and nome.startswith(TABELA_INDICE))
+
+class IndiceBusca:
+    """
+    Índice de busca textual dos palestrantes
+
+    Cobre nome, cargo, empresa, bio e palavras-chave. No SQLite usa uma tabela
+    virtual FTS5 (com ranking bm25), no PostgreSQL uma tabela com um `tsvector`
+    ponderado e índice GIN (ranking ts_rank_cd). Em outros bancos a busca recai
+    em um trecho do nome normalizado (sem acentos e em minúsculas).
+
+    O índice acompanha as gravações pelos eventos do SQLAlchemy: inserções,
+    alterações dos campos indexados (inclusive das palavras-chave) e exclusões
+    de palestrantes e renomeações de palavras-chave são aplicadas no próprio
+    flush, na mesma transação. Atualizações em massa (`query.update`) não
+    disparam esses eventos; depois delas use `flask busca reconstruir`.
+
+    A estrutura do índice é criada (e preenchida) na inicialização da
+    aplicação, junto com as tabelas em `db.create_all` ou por
+    `flask busca reconstruir`, nunca durante uma requisição. Enquanto ela não
+    existir, a busca recai no nome normalizado.
+    """
+
+    def __init__(self, app=None):
+        self._pronto = set()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['indice_busca'] = self
+        if not event.contains(Palestrante, 'after_insert', _marcar_palestrante):
+            event.listen(Palestrante, 'after_insert', _marcar_palestrante)
+            event.listen(Palestrante, 'after_update', _marcar_palestrante_alterado)
+            event.listen(Palestrante, 'after_delete', _marcar_palestrante_removido)
+            event.listen(PalavraChave, 'after_update', _marcar_palavra_chave)
+            event.listen(db.session, 'after_flush', self._sincronizar)
+            # Bancos criados por db.create_all já saem com o índice
+            event.listen(Palestrante.__table__, 'after_create', self._criar_com_tabela)
+
+        with app.app_context():
+            try:
+                with db.engine.begin() as conexao:
+                    self._criar_estrutura(conexao)
+            except SQLAlchemyError as e:
+                logger.warning(f"Índice de busca textual não verificado: {e}")
+
+    def _sql(self, conexao):
+        return _DIALETOS.get(conexao.dialect.name)
+
+    def _criar_estrutura(self, conexao):
+        """Cria o índice se ele ainda não existir, preenchendo-o com os palestrantes já cadastrados"""
+        sql = self._sql(conexao)
+        if sql is None or self._disponivel(conexao):
+            return
+
+        for comando in sql['criar']:
+            conexao.execute(text(comando))
+        if inspect(conexao).has_table('palestrante'):
+            conexao.execute(text(sql['inserir']))
+        logger.info("Índice de busca textual criado")
+
+    def _criar_com_tabela(self, tabela, conexao, **kwargs):
+        """Evento after_create da tabela de palestrantes: índice novo e vazio (descarta um que tenha sobrado)"""
+        sql = self._sql(conexao)
+        if sql is not None:
+            for comando in sql['remover'] + sql['criar']:
+                conexao.execute(text(comando))
+
+    def _disponivel(self, conexao):
+        """
+        Returns:
+            bool: True se o banco tiver suporte a busca textual e o índice já existir
+        """
+        if self._sql(conexao) is None:
+            return False
+        chave = str(conexao.engine.url)
+        if chave in self._pronto:
+            return True
+        if inspect(conexao).has_table(TABELA_INDICE):
+            self._pronto.add(chave)
+            return True
+        return False
+
+    def _sincronizar(self, session, contexto):
+        """Aplica ao índice as alterações do flush (evento after_flush)"""
+        alterados = session.info.pop('busca_alterados', set())
+        removidos = session.info.pop('busca_removidos', set())
+        palavras = session.info.pop('busca_palavras_chave', set())
+        if not (alterados or removidos or palavras):
+            return
+
+        conexao = session.connection()
+        if not self._disponivel(conexao):
+            return
+
+        if palavras:
+            # Palestrantes que têm alguma das palavras-chave renomeadas
+            alterados |= {
+                palestrante_id for (palestrante_id,) in conexao.execute(
+                    text(
+                        "SELECT palestrante_id FROM palestrante_palavras_chave "
+                        "WHERE palavra_chave_id IN :ids"
+                    ).bindparams(bindparam('ids', expanding=True)),
+                    {'ids': list(palavras)}
+                )
+            }
+        self.reindexar(conexao, alterados, removidos)
+
+    def reindexar(self, conexao, alterados, removidos=()):
+        """
+        Atualiza no índice os palestrantes informados, na transação de `conexao`.
+        Para gravações feitas sem o ORM (UPDATE/INSERT diretos nas tabelas).
+
+        Args:
+            conexao: Conexão em uso (ex.: db.session.connection())
+            alterados (iterable): Ids de palestrantes a reindexar
+            removidos (iterable): Ids de palestrantes a retirar do índice
+        """
+        removidos = set(removidos)
+        alterados = set(alterados) - removidos
+        if not (alterados or removidos) or not self._disponivel(conexao):
+            return
+
+        sql = self._sql(conexao)
+        apagar = text(sql['apagar']).bindparams(bindparam('ids', expanding=True))
+        conexao.execute(apagar, {'ids': list(alterados | removidos)})
+        if alterados:
+            conexao.execute(
+                text(sql['inserir'] + ' WHERE p.id IN :ids').bindparams(bindparam('ids', expanding=True)),
+                {'ids': list(alterados)}
+            )
+
+    def filtrar(self, query, busca):
+        """
+        Restringe uma consulta de Palestrante aos que correspondem à busca
+
+        Args:
+            query: Consulta de Palestrante (Palestrante.query...)
+            busca (str): Texto digitado pelo usuário
+
+        Returns:
+            tuple: (consulta filtrada, coluna de relevância para ordenar de
+                forma decrescente, ou None se o banco não tiver busca textual)
+        """
+        # Na conexão da própria sessão: nenhuma outra transação é aberta durante a requisição
+        conexao = db.session.connection()
+        if not self._disponivel(conexao):
+            return query.filter(Palestrante.nome_normalizado.contains(normalizar_texto(busca))), None
+
+        dialeto = conexao.dialect.name
+        consulta = montar_consulta(busca, dialeto)
+        if not consulta:
+            return query, None
+
+        encontrados = text(_DIALETOS[dialeto]['consultar']).bindparams(consulta=consulta).columns(
+            id=Integer, relevancia=Float
+        ).subquery('busca')
+        return query.join(encontrados, encontrados.c.id == Palestrante.id), encontrados.c.relevancia
+
+    def reconstruir(self):
+        """
+        Recria o índice do zero a partir das tabelas de palestrantes e palavras-chave
+
+        Returns:
+            dict: Palestrantes indexados e duração em segundos (ou None se o banco não tiver suporte)
+        """
+        inicio = time.perf_counter()
+        with db.engine.begin() as conexao:
+            sql = self._sql(conexao)
+            if sql is None:
+                return None
+            for comando in sql['remover'] + sql['criar']:
+                conexao.execute(text(comando))
+            indexados = conexao.execute(text(sql['inserir'])).rowcount
+        self._pronto.add(str(db.engine.url))
+        return {'indexados': indexados, 'duracao_s': round(time.perf_counter() - inicio, 2)}
+
+def _marcar_palestrante(mapper, conexao, palestrante):
+    """Anota o palestrante inserido ou alterado para ser reindexado ao fim do flush"""
+    session = object_session(palestrante)
+    if session is not None:
+        session.info.setdefault('busca_alterados', set()).add(palestrante.id)
+
+def _marcar_palestrante_alterado(mapper, conexao, palestrante):
+    """Reindexa o palestrante alterado só se algum campo indexado mudou"""
+    atributos = inspect(palestrante).attrs
+    if any(atributos[nome].history.has_changes() for nome in ATRIBUTOS_INDEXADOS):
+        _marcar_palestrante(mapper, conexao, palestrante)
+
+def _marcar_palestrante_removido(mapper, conexao, palestrante):
+    """Anota o palestrante excluído para ser retirado do índice ao fim do flush"""
+    session = object_session(palestrante)
+    if session is not None:
+        session.info.setdefault('busca_removidos', set()).add(palestrante.id)
+
+def _marcar_palavra_chave(mapper, conexao, palavra_chave):
+    """Anota a palavra-chave renomeada: os palestrantes que a usam são reindexados"""
+    session = object_session(palavra_chave)
+    if session is not None and inspect(palavra_chave).attrs.palavra.history.has_changes():
+        session.info.setdefault('busca_palavras_chave', set()).add(palavra_chave.id)
+
+# Instância única compartilhada pela aplicação
+indice_busca = IndiceBusca()
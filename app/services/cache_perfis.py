@@ -0,0 +1,157 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, unquote
+
+logger = logging.getLogger(__name__)
+
+def normalizar_url_perfil(perfil_url):
+    """
+    Retorna a forma canônica de uma URL de perfil do LinkedIn, usada como chave do cache.
+
+    Remove parâmetros, fragmentos e barras finais, ignora maiúsculas/minúsculas
+    e unifica os subdomínios de idioma (br.linkedin.com, www.linkedin.com...).
+    """
+    partes = urlsplit((perfil_url or '').strip())
+    host = partes.netloc.lower()
+    if host == 'linkedin.com' or host.endswith('.linkedin.com'):
+        host = 'www.linkedin.com'
+    caminho = unquote(partes.path).lower().rstrip('/')
+    return f"https://{host}{caminho}"
+
+class CachePerfis:
+    """
+    Cache persistente (SQLite) das informações de perfis do LinkedIn.
+
+    As entradas expiram após `ttl` segundos e, quando o cache ultrapassa
+    `max_itens`, as menos acessadas recentemente são removidas (LRU).
+    """
+
+    def __init__(self, app=None):
+        self.caminho = None
+        self.ttl = 7 * 24 * 3600
+        self.max_itens = 5000
+        self.acertos = 0
+        self.falhas = 0
+
+        self._conexao = None
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Abre (ou cria) o banco do cache conforme a configuração da aplicação"""
+        self.caminho = app.config.get('LINKEDIN_CACHE_PATH')
+        self.ttl = app.config.get('LINKEDIN_CACHE_TTL', self.ttl)
+        self.max_itens = app.config.get('LINKEDIN_CACHE_MAX_ITENS', self.max_itens)
+        app.extensions['cache_perfis'] = self
+
+    @property
+    def ativo(self):
+        return bool(self.caminho) and self.ttl > 0
+
+    def _conectar(self):
+        if self._conexao is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("""
+                CREATE TABLE IF NOT EXISTS perfis (
+                    url TEXT PRIMARY KEY,
+                    dados TEXT NOT NULL,
+                    criado_em REAL NOT NULL,
+                    acessado_em REAL NOT NULL
+                )
+            """)
+            conexao.execute("CREATE INDEX IF NOT EXISTS ix_perfis_acessado_em ON perfis (acessado_em)")
+            conexao.commit()
+            self._conexao = conexao
+        return self._conexao
+
+    def obter(self, perfil_url):
+        """
+        Busca um perfil no cache
+
+        Returns:
+            dict: Informações do perfil, ou None se ausente/expirado
+        """
+        if not self.ativo:
+            return None
+
+        chave = normalizar_url_perfil(perfil_url)
+        agora = time.time()
+
+        with self._lock:
+            conexao = self._conectar()
+            linha = conexao.execute(
+                "SELECT dados, criado_em FROM perfis WHERE url = ?", (chave,)
+            ).fetchone()
+
+            if linha is None or agora - linha[1] > self.ttl:
+                if linha is not None:
+                    conexao.execute("DELETE FROM perfis WHERE url = ?", (chave,))
+                    conexao.commit()
+                self.falhas += 1
+                return None
+
+            conexao.execute("UPDATE perfis SET acessado_em = ? WHERE url = ?", (agora, chave))
+            conexao.commit()
+            self.acertos += 1
+
+        return json.loads(linha[0])
+
+    def salvar(self, perfil_url, info):
+        """Armazena as informações de um perfil e aplica o limite de tamanho"""
+        if not self.ativo:
+            return
+
+        chave = normalizar_url_perfil(perfil_url)
+        agora = time.time()
+
+        with self._lock:
+            conexao = self._conectar()
+            conexao.execute(
+                "INSERT OR REPLACE INTO perfis (url, dados, criado_em, acessado_em) VALUES (?, ?, ?, ?)",
+                (chave, json.dumps(info, ensure_ascii=False), agora, agora)
+            )
+            # Remover as entradas menos usadas recentemente além do limite
+            conexao.execute(
+                "DELETE FROM perfis WHERE url IN ("
+                "SELECT url FROM perfis ORDER BY acessado_em DESC LIMIT -1 OFFSET ?)",
+                (self.max_itens,)
+            )
+            conexao.commit()
+
+    def invalidar(self, perfil_url):
+        """Remove um perfil do cache"""
+        if not self.ativo:
+            return
+
+        with self._lock:
+            conexao = self._conectar()
+            conexao.execute("DELETE FROM perfis WHERE url = ?", (normalizar_url_perfil(perfil_url),))
+            conexao.commit()
+
+    def estatisticas(self):
+        """Retorna os contadores de acertos/falhas e o tamanho atual do cache"""
+        itens = 0
+        if self.ativo:
+            with self._lock:
+                itens = self._conectar().execute("SELECT COUNT(*) FROM perfis").fetchone()[0]
+
+        consultas = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': round(self.acertos / consultas, 3) if consultas else 0.0,
+            'itens': itens,
+            'max_itens': self.max_itens,
+            'ttl': self.ttl
+        }
+
+# Instância única compartilhada pela aplicação
+cache_perfis = CachePerfis()
@@ -0,0 +1,300 @@
+import math
+import re
+from collections import Counter, defaultdict
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.orm import aliased
+
+from app import db
+from app.models.normalizacao import normalizar_texto
+from app.models.palestrante import AliasPalavraChave, PalavraChave, palestrante_palavras_chave
+
+def chave_comparacao(texto):
+    """
+    Forma usada para comparar palavras-chave: normalizada, sem qualificadores
+    entre parênteses nem pontuação e com as palavras em ordem alfabética
+    ("Python (Programming Language)" -> "python", "Inteligência Artificial" ->
+    "artificial inteligencia")
+
+    Os sinais que fazem parte do nome de tecnologias são mantidos: "+", "#"
+    e o ponto no meio ou no início da palavra ("C++", "C#", ".NET", "Node.js").
+    """
+    texto = re.sub(r'\([^)]*\)', ' ', normalizar_texto(texto) or '')
+    texto = re.sub(r'\s+(?=[+#])', '', texto)  # "c ++" -> "c++"
+    palavras = (p.rstrip('.') for p in re.findall(r'[\w.+#]+', texto))
+    return ' '.join(sorted(p for p in palavras if re.search(r'\w', p)))
+
+def _sem_simbolos(chave):
+    """Chave sem "+" e "#", que distinguem linguagens diferentes ("C", "C++", "C#")"""
+    return re.sub(r'[+#]', '', chave)
+
+def trigramas(chave):
+    """Conjunto de trigramas de caracteres da chave (com bordas marcadas por espaços)"""
+    chave = f'  {chave} '
+    return {chave[i:i + 3] for i in range(len(chave) - 2)}
+
+def similaridade(a, b):
+    """Índice de Jaccard entre dois conjuntos de trigramas"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class _UniaoBusca:
+    """Conjuntos disjuntos (union-find) com compressão de caminho"""
+
+    def __init__(self, tamanho):
+        self.pai = list(range(tamanho))
+
+    def raiz(self, i):
+        while self.pai[i] != i:
+            self.pai[i] = self.pai[self.pai[i]]
+            i = self.pai[i]
+        return i
+
+    def unir(self, a, b):
+        raiz_a, raiz_b = self.raiz(a), self.raiz(b)
+        if raiz_a != raiz_b:
+            self.pai[max(raiz_a, raiz_b)] = min(raiz_a, raiz_b)
+
+def agrupar_semelhantes(textos, limiar=0.8):
+    """
+    Agrupa textos cujas chaves de comparação têm similaridade de trigramas >= `limiar`
+
+    Em vez de comparar todos os pares, usa um índice invertido de trigramas
+    com filtragem por prefixo: os trigramas de cada texto são ordenados do
+    mais raro para o mais comum, e só os primeiros
+    `n - ceil(limiar * n) + 1` são indexados e consultados. Dois conjuntos com
+    Jaccard >= limiar necessariamente compartilham um trigrama desses
+    prefixos, então nenhum par é perdido, e trigramas comuns (" de", "cao")
+    quase nunca geram candidatos. Os pares encontrados são unidos
+    transitivamente (union-find). Chaves que só diferem por "+" e "#" nunca
+    são unidas ("C" e "C++" são linguagens diferentes).
+
+    Args:
+        textos (list): Textos a agrupar
+        limiar (float): Similaridade mínima entre 0 e 1
+
+    Returns:
+        list: Grupos com mais de um elemento, cada um uma lista de índices de `textos`
+    """
+    chaves = [chave_comparacao(t) for t in textos]
+    conjuntos = [trigramas(chave) if chave else set() for chave in chaves]
+    frequencia = Counter(g for conjunto in conjuntos for g in conjunto)
+    uniao = _UniaoBusca(len(textos))
+
+    indice = defaultdict(list)
+    for i, conjunto in enumerate(conjuntos):
+        if not conjunto:
+            continue
+        ordenados = sorted(conjunto, key=lambda g: (frequencia[g], g))
+        prefixo = ordenados[:len(ordenados) - math.ceil(limiar * len(ordenados)) + 1]
+
+        candidatos = set()
+        for g in prefixo:
+            candidatos.update(indice[g])
+            indice[g].append(i)
+
+        for j in candidatos:
+            # Filtro por tamanho: o Jaccard não passa de menor/maior
+            menor, maior = sorted((len(conjunto), len(conjuntos[j])))
+            if menor < limiar * maior or similaridade(conjunto, conjuntos[j]) < limiar:
+                continue
+            if chaves[i] != chaves[j] and _sem_simbolos(chaves[i]) == _sem_simbolos(chaves[j]):
+                continue
+            uniao.unir(i, j)
+
+    grupos = defaultdict(list)
+    for i in range(len(textos)):
+        grupos[uniao.raiz(i)].append(i)
+    return [grupo for grupo in grupos.values() if len(grupo) > 1]
+
+def propor_fusoes(limiar=0.8):
+    """
+    Propõe fusões de palavras-chave quase duplicadas
+
+    A canônica de cada grupo é a usada por mais palestrantes (no empate, a
+    de grafia mais curta e depois a mais antiga).
+
+    Returns:
+        list: Dicionários {'grupo': número a partir de 1, 'canonica': PalavraChave,
+            'variantes': [PalavraChave], 'usos': {id da palavra-chave: palestrantes}},
+            dos grupos maiores para os menores
+    """
+    palavras = PalavraChave.query.order_by(PalavraChave.id).all()
+    usos = dict(db.session.query(
+        palestrante_palavras_chave.c.palavra_chave_id, func.count()
+    ).group_by(palestrante_palavras_chave.c.palavra_chave_id))
+
+    fusoes = [
+        _montar_fusao([palavras[i] for i in grupo], usos)
+        for grupo in agrupar_semelhantes([p.palavra for p in palavras], limiar)
+    ]
+    fusoes.sort(key=lambda f: (-sum(f['usos'].values()), f['canonica'].palavra))
+    for numero, fusao in enumerate(fusoes, 1):
+        fusao['grupo'] = numero
+    return fusoes
+
+def _montar_fusao(membros, usos):
+    """Fusão de um grupo: a canônica e as variantes, na ordem de preferência"""
+    membros = sorted(membros, key=lambda p: (-usos.get(p.id, 0), len(p.palavra), p.id))
+    return {
+        'canonica': membros[0],
+        'variantes': membros[1:],
+        'usos': {p.id: usos.get(p.id, 0) for p in membros},
+    }
+
+def filtrar_fusoes(fusoes, grupos=(), palavras=()):
+    """
+    Retira das fusões propostas os grupos e as palavras-chave que não devem ser fundidos
+
+    Uma palavra-chave retirada fica como está; se era a canônica, o grupo
+    escolhe outra, e o grupo que fica com uma só palavra-chave é descartado.
+
+    Args:
+        fusoes (list): Resultado de propor_fusoes
+        grupos (iterable): Números dos grupos a ignorar (chave 'grupo')
+        palavras (iterable): Textos das palavras-chave a manter fora das fusões
+
+    Returns:
+        list: Fusões restantes, com a numeração original
+    """
+    grupos = set(grupos)
+    mantidas = {normalizar_texto(p) for p in palavras}
+
+    filtradas = []
+    for fusao in fusoes:
+        if fusao['grupo'] in grupos:
+            continue
+        membros = [
+            p for p in [fusao['canonica']] + fusao['variantes']
+            if (p.palavra_normalizada or normalizar_texto(p.palavra)) not in mantidas
+        ]
+        if len(membros) > 1:
+            filtradas.append(dict(_montar_fusao(membros, fusao['usos']), grupo=fusao['grupo']))
+    return filtradas
+
+def aplicar_fusao(canonica, variantes):
+    """
+    Funde as variantes na palavra-chave canônica com operações em conjunto
+    sobre a tabela de associação, sem carregar os palestrantes:
+
+    1. UPDATE: uma associação com variante por palestrante (a de menor id)
+       passa a apontar para a canônica, se o palestrante ainda não a tiver;
+    2. DELETE: as associações com variantes que sobraram (duplicariam a canônica);
+    3. aliases: a grafia de cada variante (e os aliases que apontavam para
+       ela) passam a levar à canônica nas próximas importações;
+    4. DELETE das variantes.
+
+    Não realiza commit.
+
+    Returns:
+        set: Ids dos palestrantes afetados
+    """
+    ids_variantes = [v.id for v in variantes]
+    associacao = palestrante_palavras_chave
+    outra = associacao.alias('outra')
+
+    afetados = {
+        palestrante_id for (palestrante_id,) in db.session.execute(
+            select(associacao.c.palestrante_id).where(associacao.c.palavra_chave_id.in_(ids_variantes)).distinct()
+        )
+    }
+
+    menor_variante = select(func.min(outra.c.palavra_chave_id)).where(
+        outra.c.palestrante_id == associacao.c.palestrante_id,
+        outra.c.palavra_chave_id.in_(ids_variantes)
+    ).scalar_subquery()
+    ja_tem_canonica = exists().where(
+        outra.c.palestrante_id == associacao.c.palestrante_id,
+        outra.c.palavra_chave_id == canonica.id
+    )
+    db.session.execute(
+        update(associacao).where(
+            associacao.c.palavra_chave_id.in_(ids_variantes),
+            associacao.c.palavra_chave_id == menor_variante,
+            ~ja_tem_canonica
+        ).values(palavra_chave_id=canonica.id)
+    )
+    db.session.execute(delete(associacao).where(associacao.c.palavra_chave_id.in_(ids_variantes)))
+
+    # Aliases: os que apontavam para variantes e as grafias das próprias variantes
+    db.session.execute(
+        update(AliasPalavraChave).where(
+            AliasPalavraChave.palavra_chave_id.in_(ids_variantes)
+        ).values(palavra_chave_id=canonica.id)
+    )
+    grafias = {v.palavra_normalizada or normalizar_texto(v.palavra) for v in variantes}
+    grafias.discard(canonica.palavra_normalizada)
+    if grafias:
+        existentes = {
+            alias for (alias,) in db.session.query(AliasPalavraChave.alias_normalizado).filter(
+                AliasPalavraChave.alias_normalizado.in_(grafias)
+            )
+        }
+        db.session.execute(
+            update(AliasPalavraChave).where(
+                AliasPalavraChave.alias_normalizado.in_(existentes)
+            ).values(palavra_chave_id=canonica.id)
+        )
+        db.session.add_all([
+            AliasPalavraChave(alias_normalizado=grafia, palavra_chave_id=canonica.id)
+            for grafia in sorted(grafias - existentes)
+        ])
+
+    db.session.execute(
+        delete(PalavraChave).where(PalavraChave.id.in_(ids_variantes)),
+        execution_options={'synchronize_session': False}
+    )
+    for variante in variantes:
+        db.session.expunge(variante)
+    return afetados
+
+def aplicar_fusoes(fusoes):
+    """
+    Aplica as fusões propostas (ver propor_fusoes) em uma única transação e
+    atualiza o índice de busca dos palestrantes afetados
+
+    Returns:
+        dict: Grupos fundidos, palavras-chave removidas e palestrantes afetados
+    """
+    from app.services.busca_textual import indice_busca
+    from app.services.recomendacao import motor_recomendacao
+
+    afetados = set()
+    removidas = 0
+    for fusao in fusoes:
+        if fusao['variantes']:
+            afetados |= aplicar_fusao(fusao['canonica'], fusao['variantes'])
+            removidas += len(fusao['variantes'])
+
+    db.session.flush()
+    indice_busca.reindexar(db.session.connection(), afetados)
+    db.session.commit()
+    motor_recomendacao.invalidar()
+
+    return {'grupos': len(fusoes), 'palavras_chave_removidas': removidas, 'palestrantes_afetados': len(afetados)}
+
+def resolver_palavras_chave(textos):
+    """
+    Palavras-chave já cadastradas para os textos informados, pela forma
+    normalizada ou por um alias. Duas consultas, qualquer que seja a quantidade.
+
+    Returns:
+        dict: Texto normalizado -> PalavraChave (só os encontrados)
+    """
+    normalizados = {normalizar_texto(t) for t in textos} - {None, ''}
+    if not normalizados:
+        return {}
+
+    encontradas = {
+        p.palavra_normalizada: p
+        for p in PalavraChave.query.filter(PalavraChave.palavra_normalizada.in_(normalizados))
+    }
+    faltantes = normalizados - set(encontradas)
+    if faltantes:
+        canonica = aliased(PalavraChave)
+        for alias, palavra in db.session.query(AliasPalavraChave.alias_normalizado, canonica).join(
+            canonica, canonica.id == AliasPalavraChave.palavra_chave_id
+        ).filter(AliasPalavraChave.alias_normalizado.in_(faltantes)):
+            encontradas[alias] = palavra
+    return encontradas
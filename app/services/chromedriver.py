@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import shutil
+import subprocess
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Caminho do chromedriver já resolvido neste processo
+_chromedriver = None
+_lock = threading.Lock()
+
+def _executavel(caminho):
+    return bool(caminho) and os.path.isfile(caminho) and os.access(caminho, os.X_OK)
+
+def _versao(caminho):
+    """Versão informada pelo próprio binário (ex.: '120.0.6099.109'), ou None"""
+    try:
+        saida = subprocess.run([caminho, '--version'], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    partes = saida.split()
+    return partes[1] if len(partes) > 1 else None
+
+class RegistroChromedriver:
+    """
+    Registro, em um arquivo JSON na pasta instance, do chromedriver resolvido.
+
+    Guarda o caminho, a versão, a data de modificação e o tamanho do binário.
+    Nas execuções seguintes o registro é validado apenas com um `stat`, sem
+    executar o binário nem acessar a rede.
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+
+    def carregar(self):
+        """
+        Returns:
+            str: Caminho do chromedriver registrado, se ele ainda for o mesmo binário; senão None
+        """
+        try:
+            with open(self.caminho, encoding='utf-8') as f:
+                dados = json.load(f)
+            estado = os.stat(dados['caminho'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if estado.st_mtime != dados.get('mtime') or estado.st_size != dados.get('tamanho'):
+            return None
+        return dados['caminho'] if _executavel(dados['caminho']) else None
+
+    def salvar(self, caminho_driver):
+        estado = os.stat(caminho_driver)
+        dados = {
+            'caminho': caminho_driver,
+            'versao': _versao(caminho_driver),
+            'mtime': estado.st_mtime,
+            'tamanho': estado.st_size,
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+            temporario = f'{self.caminho}.{os.getpid()}.tmp'
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(dados, f, indent=2)
+            os.replace(temporario, self.caminho)
+        except OSError as e:
+            logger.warning(f"Não foi possível registrar o chromedriver em {self.caminho}: {e}")
+
+    def apagar(self):
+        try:
+            os.remove(self.caminho)
+        except FileNotFoundError:
+            pass
+
+def obter_chromedriver(config, revalidar=False):
+    """
+    Resolve o caminho do chromedriver uma única vez por processo
+
+    A ordem de busca é: CHROMEDRIVER_PATH, o registro em CHROMEDRIVER_CACHE_PATH,
+    o chromedriver do PATH do sistema e, só então, o download pelo
+    webdriver_manager. Com um driver já presente, nada é feito pela rede.
+
+    Args:
+        config (dict): Configuração da aplicação
+        revalidar (bool): Descartar o caminho resolvido (ex.: o Chrome foi
+            atualizado e o driver deixou de ser compatível) e baixar outro
+
+    Returns:
+        str: Caminho do executável do chromedriver
+    """
+    global _chromedriver
+
+    with _lock:
+        registro = None
+        if config.get('CHROMEDRIVER_CACHE_PATH'):
+            registro = RegistroChromedriver(config['CHROMEDRIVER_CACHE_PATH'])
+
+        if revalidar:
+            _chromedriver = None
+            if registro is not None:
+                registro.apagar()
+        elif _chromedriver is not None:
+            return _chromedriver
+
+        caminho = None
+        if not revalidar:
+            configurado = config.get('CHROMEDRIVER_PATH')
+            if configurado:
+                if not _executavel(configurado):
+                    raise ValueError(f"CHROMEDRIVER_PATH não aponta para um executável: {configurado}")
+                caminho = configurado
+            if caminho is None and registro is not None:
+                caminho = registro.carregar()
+            if caminho is None:
+                caminho = shutil.which('chromedriver')
+
+        novo = caminho is None
+        if novo:
+            # Último recurso: resolver a versão e baixar o driver (requer rede)
+            from webdriver_manager.chrome import ChromeDriverManager
+            caminho = ChromeDriverManager().install()
+
+        if registro is not None and (novo or registro.carregar() != caminho):
+            registro.salvar(caminho)
+
+        logger.info(f"Usando o chromedriver em {caminho}")
+        _chromedriver = caminho
+        return caminho
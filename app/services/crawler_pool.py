@@ -0,0 +1,149 @@
+import atexit
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+from app.services.linkedin_crawler import LinkedInCrawler
+
+logger = logging.getLogger(__name__)
+
+class CrawlerPool:
+    """
+    Pool de sessões do LinkedInCrawler compartilhado por todo o processo.
+
+    Cada sessão corresponde a um navegador já autenticado no LinkedIn. As
+    requisições pegam uma sessão emprestada com `sessao()` e a devolvem ao
+    final, evitando abrir o Chrome e refazer o login a cada clique. Sessões
+    que não respondem, que já carregaram páginas demais ou cuja memória
+    cresceu além do limite são descartadas e recriadas sob demanda.
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self.tamanho = 2
+        self.timeout = 60
+        self.max_paginas = 200
+        self.max_memoria_mb = 1024
+
+        self._livres = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._criadas = 0
+        self._encerrado = False
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Lê as configurações do pool a partir da aplicação"""
+        self.app = app
+        self.tamanho = app.config.get('CRAWLER_POOL_SIZE', self.tamanho)
+        self.timeout = app.config.get('CRAWLER_POOL_TIMEOUT', self.timeout)
+        self.max_paginas = app.config.get('CRAWLER_MAX_PAGINAS', self.max_paginas)
+        self.max_memoria_mb = app.config.get('CRAWLER_MAX_MEMORIA_MB', self.max_memoria_mb)
+
+        app.extensions['crawler_pool'] = self
+        atexit.register(self.encerrar)
+
+    @contextmanager
+    def sessao(self, timeout=None):
+        """
+        Empresta uma sessão do pool durante o bloco `with`
+
+        Args:
+            timeout (float): Tempo máximo de espera por uma sessão livre
+                (padrão: CRAWLER_POOL_TIMEOUT; 0 para não esperar)
+
+        Yields:
+            LinkedInCrawler: Crawler autenticado pronto para uso
+        """
+        crawler = self._obter(self.timeout if timeout is None else timeout)
+        descartar = False
+        try:
+            yield crawler
+        except Exception:
+            # Em caso de erro não sabemos em que estado o navegador ficou
+            descartar = not crawler.esta_saudavel()
+            raise
+        finally:
+            self._devolver(crawler, descartar)
+
+    def _obter(self, timeout):
+        """Retorna uma sessão livre, criando uma nova se houver vaga no pool"""
+        while True:
+            try:
+                crawler = self._livres.get_nowait()
+            except queue.Empty:
+                crawler = None
+
+            if crawler is None:
+                with self._lock:
+                    pode_criar = self._criadas < self.tamanho
+                    if pode_criar:
+                        self._criadas += 1
+
+                if pode_criar:
+                    try:
+                        return self._criar()
+                    except Exception:
+                        with self._lock:
+                            self._criadas -= 1
+                        raise
+
+                # Pool cheio: aguardar uma sessão ser devolvida
+                try:
+                    crawler = self._livres.get(timeout=timeout)
+                except queue.Empty:
+                    raise RuntimeError("Nenhuma sessão do LinkedIn disponível no momento. Tente novamente em instantes.")
+
+            if crawler.esta_saudavel():
+                return crawler
+
+            logger.info("Sessão do LinkedIn não responde; descartando.")
+            self._descartar(crawler)
+
+    def _criar(self):
+        """Cria uma nova sessão autenticada"""
+        logger.info("Criando nova sessão do LinkedIn para o pool.")
+        with self.app.app_context():
+            return LinkedInCrawler()
+
+    def _precisa_reciclar(self, crawler):
+        """Verifica se a sessão atingiu algum dos limites de uso"""
+        if self.max_paginas and crawler.paginas_visitadas >= self.max_paginas:
+            logger.info(f"Reciclando sessão após {crawler.paginas_visitadas} páginas.")
+            return True
+
+        if self.max_memoria_mb:
+            memoria = crawler.memoria_mb()
+            if memoria > self.max_memoria_mb:
+                logger.info(f"Reciclando sessão com {memoria:.0f} MB de memória.")
+                return True
+
+        return False
+
+    def _devolver(self, crawler, descartar=False):
+        """Devolve a sessão ao pool ou a encerra se não puder ser reaproveitada"""
+        if descartar or self._encerrado or self._precisa_reciclar(crawler):
+            self._descartar(crawler)
+        else:
+            self._livres.put(crawler)
+
+    def _descartar(self, crawler):
+        """Encerra a sessão e libera sua vaga no pool"""
+        crawler.fechar()
+        with self._lock:
+            self._criadas -= 1
+
+    def encerrar(self):
+        """Encerra todas as sessões livres (chamado na saída do processo)"""
+        self._encerrado = True
+        while True:
+            try:
+                crawler = self._livres.get_nowait()
+            except queue.Empty:
+                break
+            self._descartar(crawler)
+
+# Instância única compartilhada pela aplicação
+crawler_pool = CrawlerPool()
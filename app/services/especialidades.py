@@ -0,0 +1,76 @@
+from sqlalchemy import func
+
+from app import db
+from app.models.palestrante import Palestrante, PalavraChave, palestrante_palavras_chave
+from app.models.normalizacao import normalizar_texto
+
+MODO_QUALQUER = 'qualquer'
+MODO_TODAS = 'todas'
+MODOS = (MODO_QUALQUER, MODO_TODAS)
+
+def interpretar_especialidades(valores):
+    """
+    Especialidades pedidas na listagem: aceita o parâmetro repetido e/ou
+    valores separados por vírgula, sem repetições nem diferença de acentos e maiúsculas
+
+    Returns:
+        list: Especialidades normalizadas, na ordem em que apareceram
+    """
+    especialidades = (normalizar_texto(e) for valor in valores for e in (valor or '').split(','))
+    return list(dict.fromkeys(e for e in especialidades if e))
+
+def filtrar_especialidades(query, especialidades, modo=MODO_QUALQUER):
+    """
+    Restringe uma consulta de Palestrante aos que têm alguma (modo 'qualquer')
+    ou todas (modo 'todas') as especialidades pedidas
+
+    A seleção é feita por uma única subconsulta agrupada sobre a tabela de
+    associação (JOIN com palavra_chave, GROUP BY palestrante, HAVING COUNT),
+    juntada à consulta original.
+
+    Args:
+        query: Consulta de Palestrante
+        especialidades (list): Resultado de interpretar_especialidades
+        modo (str): 'qualquer' ou 'todas'
+    """
+    if not especialidades:
+        return query
+
+    associacao = palestrante_palavras_chave
+    palavra = PalavraChave.palavra_normalizada
+    selecionados = db.session.query(associacao.c.palestrante_id).join(
+        PalavraChave, PalavraChave.id == associacao.c.palavra_chave_id
+    ).filter(
+        palavra.in_(especialidades)
+    ).group_by(associacao.c.palestrante_id)
+
+    if modo == MODO_TODAS:
+        selecionados = selecionados.having(func.count(func.distinct(palavra)) == len(especialidades))
+
+    selecionados = selecionados.subquery('especialidades')
+    return query.join(selecionados, selecionados.c.palestrante_id == Palestrante.id)
+
+def contar_especialidades(query, limite=20):
+    """
+    Facetas da listagem: quantos palestrantes do resultado têm cada palavra-chave
+
+    Args:
+        query: Consulta de Palestrante já filtrada (a ordenação é ignorada)
+        limite (int): Quantidade máxima de palavras-chave
+
+    Returns:
+        list: Pares (palavra-chave, quantidade), das mais frequentes para as menos
+    """
+    associacao = palestrante_palavras_chave
+    ids = query.order_by(None).with_entities(Palestrante.id).subquery('resultado')
+    quantidade = func.count(associacao.c.palestrante_id)
+
+    return db.session.query(PalavraChave.palavra, quantidade).join(
+        associacao, associacao.c.palavra_chave_id == PalavraChave.id
+    ).join(
+        ids, ids.c.id == associacao.c.palestrante_id
+    ).group_by(
+        PalavraChave.id, PalavraChave.palavra
+    ).order_by(
+        quantidade.desc(), PalavraChave.palavra
+    ).limit(limite).all()
@@ -0,0 +1,126 @@
+import time
+import logging
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+logger = logging.getLogger(__name__)
+
+# Registra no navegador o instante da última alteração do DOM
+_SCRIPT_OBSERVAR_MUTACOES = """
+if (!window.__observadorMutacoes) {
+    window.__ultimaMutacao = performance.now();
+    window.__observadorMutacoes = new MutationObserver(function () {
+        window.__ultimaMutacao = performance.now();
+    });
+    window.__observadorMutacoes.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return performance.now() - window.__ultimaMutacao;
+"""
+
+_SCRIPT_ROLAR_E_CONTAR = """
+window.scrollTo(0, document.body.scrollHeight);
+return document.querySelectorAll(arguments[0]).length;
+"""
+
+_SCRIPT_CONTAR = "return document.querySelectorAll(arguments[0]).length;"
+
+class EsperaAdaptativa:
+    """
+    Esperas guiadas por condições da página, em substituição a `time.sleep` fixos.
+
+    Em vez de dormir um tempo fixo, acompanha as mutações do DOM e a quantidade
+    de resultados na página e segue adiante assim que o conteúdo estabiliza,
+    respeitando sempre um tempo máximo. A duração real de cada espera fica
+    registrada para consulta em `estatisticas()`.
+    """
+
+    def __init__(self, driver, tempo_maximo=10, tempo_quieto=0.5, tempo_crescimento=2.0,
+                 max_rolagens=10, intervalo=0.1):
+        """
+        Args:
+            driver: WebDriver do Selenium
+            tempo_maximo (float): Limite de cada espera, em segundos
+            tempo_quieto (float): Tempo sem mutações no DOM para considerar a página estável
+            tempo_crescimento (float): Tempo de espera por novos resultados após cada rolagem
+            max_rolagens (int): Número máximo de rolagens na página de busca
+            intervalo (float): Intervalo entre verificações, em segundos
+        """
+        self.driver = driver
+        self.tempo_maximo = tempo_maximo
+        self.tempo_quieto = tempo_quieto
+        self.tempo_crescimento = tempo_crescimento
+        self.max_rolagens = max_rolagens
+        self.intervalo = intervalo
+        self.registro = {}
+
+    def _registrar(self, nome, inicio):
+        duracao = time.monotonic() - inicio
+        tempos = self.registro.setdefault(nome, [])
+        tempos.append(duracao)
+        # Manter apenas as medições mais recentes
+        del tempos[:-200]
+        logger.debug(f"Espera '{nome}' levou {duracao:.2f}s")
+        return duracao
+
+    def aguardar_estabilizacao(self, nome='dom'):
+        """
+        Aguarda até o DOM ficar `tempo_quieto` segundos sem alterações
+
+        Returns:
+            float: Duração real da espera, em segundos
+        """
+        inicio = time.monotonic()
+        quieto_ms = self.tempo_quieto * 1000
+        try:
+            WebDriverWait(self.driver, self.tempo_maximo, poll_frequency=self.intervalo).until(
+                lambda d: d.execute_script(_SCRIPT_OBSERVAR_MUTACOES) >= quieto_ms
+            )
+        except TimeoutException:
+            logger.debug(f"Espera '{nome}' atingiu o limite de {self.tempo_maximo}s")
+        return self._registrar(nome, inicio)
+
+    def rolar_ate_estabilizar(self, seletor, nome='rolagem'):
+        """
+        Rola a página até o fim enquanto novos elementos de `seletor` continuarem aparecendo
+
+        Returns:
+            int: Quantidade de elementos encontrados ao final
+        """
+        inicio = time.monotonic()
+        quantidade = self.driver.execute_script(_SCRIPT_CONTAR, seletor)
+
+        for _ in range(self.max_rolagens):
+            if time.monotonic() - inicio > self.tempo_maximo:
+                break
+
+            anterior = quantidade
+            quantidade = self.driver.execute_script(_SCRIPT_ROLAR_E_CONTAR, seletor)
+            if quantidade > anterior:
+                continue
+
+            def novos_resultados(driver):
+                atual = driver.execute_script(_SCRIPT_CONTAR, seletor)
+                return atual if atual > anterior else False
+
+            # Aguardar os resultados carregados pela rolagem
+            try:
+                quantidade = WebDriverWait(self.driver, self.tempo_crescimento, poll_frequency=self.intervalo).until(
+                    novos_resultados
+                )
+            except TimeoutException:
+                # Nenhum resultado novo: a lista terminou de carregar
+                break
+
+        self._registrar(nome, inicio)
+        return quantidade
+
+    def estatisticas(self):
+        """Retorna, por tipo de espera, a quantidade e as durações média e máxima"""
+        return {
+            nome: {
+                'quantidade': len(tempos),
+                'media': round(sum(tempos) / len(tempos), 3),
+                'maximo': round(max(tempos), 3)
+            }
+            for nome, tempos in self.registro.items() if tempos
+        }
@@ -0,0 +1,65 @@
+import logging
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import inspect
+
+from app import db
+
+logger = logging.getLogger(__name__)
+
+# Nomes para as restrições sem nome: sem eles a recriação da tabela no SQLite descartaria os UNIQUE
+_NOMES_RESTRICOES = {'uq': 'uq_%(table_name)s_%(column_0_name)s'}
+
+def atualizar_esquema():
+    """
+    Leva um banco criado por uma versão anterior (via `db.create_all`) ao
+    esquema atual dos modelos, sem apagar dados: cria as tabelas e os índices
+    que faltam, acrescenta as colunas novas (sempre anuláveis, o preenchimento
+    fica por conta de quem chama) e torna anuláveis as colunas que deixaram de
+    ser obrigatórias.
+
+    `db.create_all` não altera tabelas existentes. As alterações usam as
+    operações em lote do Alembic, que no SQLite recriam a tabela quando o
+    ALTER TABLE não basta (ex.: remover um NOT NULL).
+
+    Returns:
+        list: Descrição de cada alteração aplicada (vazia se o banco já estava atualizado)
+    """
+    alteracoes = []
+    with db.engine.begin() as conexao:
+        existentes = set(inspect(conexao).get_table_names())
+        operacoes = Operations(MigrationContext.configure(conexao, opts={'render_as_batch': True}))
+
+        for tabela in db.metadata.sorted_tables:
+            if tabela.name not in existentes:
+                tabela.create(conexao)
+                alteracoes.append(f"tabela {tabela.name} criada")
+                continue
+
+            inspetor = inspect(conexao)
+            colunas = {c['name']: c for c in inspetor.get_columns(tabela.name)}
+            novas = [c for c in tabela.columns if c.name not in colunas]
+            anulaveis = [
+                c for c in tabela.columns
+                if c.name in colunas and c.nullable and not c.primary_key and not colunas[c.name]['nullable']
+            ]
+            if novas or anulaveis:
+                with operacoes.batch_alter_table(tabela.name, naming_convention=_NOMES_RESTRICOES) as lote:
+                    for coluna in novas:
+                        lote.add_column(db.Column(coluna.name, coluna.type, nullable=True))
+                        alteracoes.append(f"coluna {tabela.name}.{coluna.name} criada")
+                    for coluna in anulaveis:
+                        lote.alter_column(coluna.name, existing_type=coluna.type, nullable=True)
+                        alteracoes.append(f"coluna {tabela.name}.{coluna.name} agora aceita nulos")
+                inspetor = inspect(conexao)
+
+            indices = {i['name'] for i in inspetor.get_indexes(tabela.name)}
+            for indice in tabela.indexes:
+                if indice.name not in indices:
+                    indice.create(conexao)
+                    alteracoes.append(f"índice {indice.name} criado")
+
+    for alteracao in alteracoes:
+        logger.info(f"Esquema: {alteracao}")
+    return alteracoes
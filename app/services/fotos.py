@@ -0,0 +1,210 @@
+import hashlib
+import io
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from flask import url_for
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+# Formatos aceitos para as fotos originais e extensão com que são gravadas
+EXTENSOES = {'JPEG': 'jpg', 'PNG': 'png', 'GIF': 'gif', 'WEBP': 'webp'}
+
+# Formatos das miniaturas: (formato do Pillow, tipo MIME, opções de gravação)
+FORMATOS_MINIATURA = {
+    'webp': ('WEBP', 'image/webp', {'quality': 80, 'method': 4}),
+    'jpg': ('JPEG', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+class AcervoFotos:
+    """
+    Acervo local das fotos dos palestrantes.
+
+    Cada foto (upload ou avatar baixado do LinkedIn) é gravada uma única vez,
+    com o nome dado pelo hash do conteúdo, em FOTOS_FOLDER. As miniaturas de
+    tamanho fixo (FOTOS_TAMANHOS) são geradas sob demanda, em WebP ou JPEG, e
+    regeneradas quando faltam ou ficam mais antigas que a original.
+    """
+
+    def __init__(self, app=None):
+        self.pasta = None
+        self.url_base = '/static/fotos'
+        self.tamanhos = {'mini': 80, 'media': 240, 'grande': 600}
+        self.tamanho_maximo = 5 * 1024 * 1024
+        self.timeout = 5
+        self.prazo_lote = 8
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.pasta = app.config.get('FOTOS_FOLDER') or os.path.join(app.static_folder, 'fotos')
+        self.url_base = app.config.get('FOTOS_URL') or '/static/fotos'
+        self.tamanhos = dict(app.config.get('FOTOS_TAMANHOS') or self.tamanhos)
+        self.tamanho_maximo = app.config.get('FOTOS_TAMANHO_MAXIMO', self.tamanho_maximo)
+        self.timeout = app.config.get('FOTOS_TIMEOUT', self.timeout)
+        self.prazo_lote = app.config.get('FOTOS_PRAZO_LOTE', self.prazo_lote)
+        os.makedirs(os.path.join(self.pasta, 'miniaturas'), exist_ok=True)
+
+        app.extensions['acervo_fotos'] = self
+        # Nos templates: {{ miniatura_foto(palestrante.foto_url, 'mini') }}
+        app.add_template_global(self.url_miniatura, 'miniatura_foto')
+
+    def _caminho_original(self, hash_foto):
+        for extensao in EXTENSOES.values():
+            caminho = os.path.join(self.pasta, f'{hash_foto}.{extensao}')
+            if os.path.exists(caminho):
+                return caminho
+        return None
+
+    def hash_da_url(self, foto_url):
+        """
+        Returns:
+            str: Hash da foto, se `foto_url` apontar para o acervo; senão None
+        """
+        correspondencia = re.fullmatch(rf'{re.escape(self.url_base)}/([0-9a-f]{{32}})\.\w+', foto_url or '')
+        return correspondencia.group(1) if correspondencia else None
+
+    def armazenar(self, conteudo):
+        """
+        Grava uma foto no acervo (se ainda não estiver lá)
+
+        Args:
+            conteudo (bytes): Conteúdo do arquivo de imagem
+
+        Returns:
+            str: URL da foto original no acervo
+
+        Raises:
+            ValueError: Se o conteúdo não for uma imagem em formato aceito
+        """
+        try:
+            with Image.open(io.BytesIO(conteudo)) as imagem:
+                formato = imagem.format
+                imagem.verify()
+        except (UnidentifiedImageError, OSError, SyntaxError) as e:
+            raise ValueError(f"Arquivo de imagem inválido: {e}")
+        if formato not in EXTENSOES:
+            raise ValueError(f"Formato de imagem não suportado: {formato}")
+
+        hash_foto = hashlib.sha256(conteudo).hexdigest()[:32]
+        nome = f'{hash_foto}.{EXTENSOES[formato]}'
+        caminho = os.path.join(self.pasta, nome)
+
+        if not os.path.exists(caminho):
+            temporario = f'{caminho}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temporario, 'wb') as f:
+                f.write(conteudo)
+            os.replace(temporario, caminho)
+
+        return f'{self.url_base}/{nome}'
+
+    def armazenar_upload(self, arquivo):
+        """Grava no acervo um arquivo enviado por formulário (FileStorage)"""
+        return self.armazenar(arquivo.read())
+
+    def espelhar(self, foto_url, prazo=None):
+        """
+        Baixa uma foto remota (ex.: avatar do LinkedIn) para o acervo
+
+        O download inteiro (não só cada leitura) é limitado a FOTOS_TIMEOUT
+        segundos. Uma foto que não pôde ser copiada mantém a URL remota e pode
+        ser copiada depois com `flask fotos espelhar`.
+
+        Args:
+            foto_url (str): URL da foto
+            prazo (float): Instante limite (time.monotonic()) para terminar o download (opcional)
+
+        Returns:
+            str: URL local da foto, ou a própria `foto_url` se ela já for local
+                ou não puder ser baixada
+        """
+        if not foto_url or not foto_url.startswith(('http://', 'https://')):
+            return foto_url
+
+        limite = time.monotonic() + self.timeout
+        if prazo is not None:
+            limite = min(limite, prazo)
+
+        try:
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                raise ValueError("prazo para baixar as fotos esgotado")
+            with requests.get(foto_url, timeout=restante, stream=True) as resposta:
+                resposta.raise_for_status()
+                conteudo = bytearray()
+                # Blocos pequenos, para verificar o prazo mesmo em uma conexão lenta
+                for bloco in resposta.iter_content(1024):
+                    conteudo += bloco
+                    if len(conteudo) > self.tamanho_maximo:
+                        raise ValueError("foto maior que FOTOS_TAMANHO_MAXIMO")
+                    if time.monotonic() > limite:
+                        raise ValueError("download excedeu FOTOS_TIMEOUT")
+            return self.armazenar(bytes(conteudo))
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Não foi possível espelhar a foto {foto_url}: {e}")
+            return foto_url
+
+    def espelhar_lote(self, fotos_urls, workers=4):
+        """
+        Espelha várias fotos em paralelo (espera de rede, não de CPU), todas
+        dentro de FOTOS_PRAZO_LOTE segundos no total: as que não couberem no
+        prazo mantêm a URL remota
+
+        Returns:
+            list: URLs resultantes, na ordem recebida
+        """
+        prazo = time.monotonic() + self.prazo_lote
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda url: self.espelhar(url, prazo), fotos_urls))
+
+    def miniatura(self, hash_foto, tamanho, formato='webp'):
+        """
+        Caminho da miniatura da foto, gerando-a se não existir ou estiver desatualizada
+
+        Returns:
+            str: Caminho do arquivo, ou None se a foto ou o tamanho não existirem
+        """
+        if tamanho not in self.tamanhos or formato not in FORMATOS_MINIATURA:
+            return None
+        original = self._caminho_original(hash_foto)
+        if original is None:
+            return None
+
+        caminho = os.path.join(self.pasta, 'miniaturas', f'{hash_foto}-{tamanho}.{formato}')
+        if os.path.exists(caminho) and os.path.getmtime(caminho) >= os.path.getmtime(original):
+            return caminho
+
+        with self._lock:
+            formato_pil, _, opcoes = FORMATOS_MINIATURA[formato]
+            lado = self.tamanhos[tamanho]
+            with Image.open(original) as imagem:
+                imagem = ImageOps.exif_transpose(imagem).convert('RGB')
+                # Recorte quadrado e centralizado, como exibido nas páginas (object-fit: cover)
+                imagem = ImageOps.fit(imagem, (lado, lado), Image.LANCZOS)
+                temporario = f'{caminho}.{os.getpid()}.tmp'
+                imagem.save(temporario, formato_pil, **opcoes)
+            os.replace(temporario, caminho)
+
+        return caminho
+
+    def url_miniatura(self, foto_url, tamanho='mini'):
+        """
+        URL a usar nos templates para exibir a foto no tamanho informado
+
+        Fotos do acervo são servidas pela miniatura; fotos externas ainda não
+        espelhadas continuam com a URL original.
+        """
+        hash_foto = self.hash_da_url(foto_url)
+        if hash_foto is None:
+            return foto_url
+        return url_for('fotos.miniatura', hash_foto=hash_foto, tamanho=tamanho)
+
+# Instância única compartilhada pela aplicação
+acervo_fotos = AcervoFotos()
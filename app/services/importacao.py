@@ -0,0 +1,104 @@
+from datetime import datetime
+
+from app import db
+from app.models.palestrante import Palestrante, PalavraChave
+from app.models.normalizacao import normalizar_texto
+from app.services.canonicalizacao import resolver_palavras_chave
+from app.services.fotos import acervo_fotos
+
+def _habilidades(perfil):
+    """Habilidades do perfil como lista (aceita lista ou texto separado por vírgulas)"""
+    habilidades = perfil.get('habilidades') or []
+    if isinstance(habilidades, str):
+        habilidades = habilidades.split(',')
+    return [h.strip() for h in habilidades if h and h.strip()]
+
+def importar_perfis(perfis, espelhar_fotos=True):
+    """
+    Importa de uma vez vários perfis do LinkedIn como palestrantes
+
+    Todas as habilidades são resolvidas com consultas `IN` em lote, as
+    palavras-chave que faltam são inseridas em lote, as URLs já cadastradas
+    são verificadas com uma única consulta e tudo é gravado em um único commit.
+
+    Args:
+        perfis (list): Dicionários no formato de LinkedInCrawler.obter_info_perfil
+        espelhar_fotos (bool): Copiar as fotos para o acervo local
+
+    Returns:
+        dict: Contagens de criados, ignorados (já cadastrados ou repetidos),
+            inválidos e palavras-chave criadas, mais os palestrantes criados
+    """
+    resultado = {'criados': 0, 'ignorados': 0, 'invalidos': 0, 'palavras_chave_criadas': 0, 'palestrantes': []}
+
+    # Descartar perfis incompletos e repetidos no próprio lote
+    validos = {}
+    for perfil in perfis:
+        perfil_url = (perfil.get('perfil_url') or '').strip()
+        if not perfil_url or not (perfil.get('nome') or '').strip():
+            resultado['invalidos'] += 1
+        elif perfil_url in validos:
+            resultado['ignorados'] += 1
+        else:
+            validos[perfil_url] = perfil
+
+    if not validos:
+        return resultado
+
+    # Perfis já cadastrados: uma consulta
+    existentes = {
+        url for (url,) in db.session.query(Palestrante.linkedin_url).filter(
+            Palestrante.linkedin_url.in_(list(validos))
+        )
+    }
+    resultado['ignorados'] += len(existentes)
+    novos = [perfil for url, perfil in validos.items() if url not in existentes]
+    if not novos:
+        return resultado
+
+    # Palavras-chave: consultas em lote para as existentes, inserção em lote das que faltam.
+    # A comparação é pela forma normalizada ("Inovação" e "inovacao" são a mesma) e
+    # pelos aliases das palavras fundidas; uma palavra nova é gravada como apareceu
+    # pela primeira vez no lote.
+    todas = {}
+    for perfil in novos:
+        for h in _habilidades(perfil):
+            todas.setdefault(normalizar_texto(h), h)
+    palavras = {}
+    if todas:
+        palavras = resolver_palavras_chave(list(todas))
+        faltantes = [PalavraChave(palavra=todas[n]) for n in sorted(set(todas) - set(palavras))]
+        db.session.add_all(faltantes)
+        palavras.update((p.palavra_normalizada, p) for p in faltantes)
+        resultado['palavras_chave_criadas'] = len(faltantes)
+
+    # Fotos baixadas em paralelo, com prazo total limitado (a importação roda na requisição)
+    fotos = [perfil.get('foto_url', '') for perfil in novos]
+    if espelhar_fotos:
+        fotos = acervo_fotos.espelhar_lote(fotos)
+
+    agora = datetime.utcnow()
+    for perfil, foto_url in zip(novos, fotos):
+        palestrante = Palestrante(
+            nome=perfil['nome'].strip(),
+            email=perfil.get('email') or None,
+            linkedin_url=perfil['perfil_url'].strip(),
+            linkedin_cargo_atual=perfil.get('cargo_atual'),
+            linkedin_empresa_atual=perfil.get('empresa_atual'),
+            bio=perfil.get('bio', ''),
+            foto_url=foto_url,
+            linkedin_seguidores=perfil.get('seguidores', 0),
+            linkedin_ultima_atualizacao=agora
+        )
+        # Sem repetir a mesma palavra-chave no palestrante
+        # (grafias diferentes podem levar à mesma palavra-chave canônica)
+        palestrante.palavras_chave = list(dict.fromkeys(
+            palavras[normalizar_texto(h)] for h in _habilidades(perfil)
+        ))
+        resultado['palestrantes'].append(palestrante)
+
+    db.session.add_all(resultado['palestrantes'])
+    db.session.commit()
+
+    resultado['criados'] = len(resultado['palestrantes'])
+    return resultado
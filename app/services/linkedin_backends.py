@@ -0,0 +1,492 @@
+import logging
+from urllib.parse import urljoin
+
+import psutil
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, SessionNotCreatedException
+
+from app.services.chromedriver import obter_chromedriver
+from app.services.esperas import EsperaAdaptativa
+from app.services.seletores import registro_seletores
+from app.services.linkedin_extracao import (
+    SELETOR_RESULTADOS_BUSCA, SELETOR_PERFIL_CARREGADO, SELETOR_VER_MAIS,
+    SELETORES_PERFIL, SELETORES_CARD, SCRIPT_EXTRAIR_PERFIL, SCRIPT_EXTRAIR_CARDS,
+    SCRIPT_PREPARAR_PERFIL, extrair_perfil_html, extrair_cards_html
+)
+
+logger = logging.getLogger(__name__)
+
+# Padrões de URL (sintaxe de Network.setBlockedURLs) de cada tipo de recurso
+# que o crawler não precisa baixar: só o texto e o atributo src da foto são lidos
+RECURSOS_BLOQUEAVEIS = {
+    'imagens': ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.ico', '*media.licdn.com/dms/image*'],
+    'fontes': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'midia': ['*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ts', '*dms.licdn.com/playlist*'],
+    'rastreamento': ['*/li/track*', '*/tscp-serving/*', '*px.ads.linkedin.com*', '*doubleclick.net*',
+                     '*google-analytics.com*', '*googletagmanager.com*'],
+}
+
+# Flags do Chrome que reduzem memória e tráfego em segundo plano
+FLAGS_ECONOMIA_MEMORIA = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-component-update",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--mute-audio",
+    "--no-first-run",
+    "--renderer-process-limit=2",
+    "--js-flags=--max-old-space-size=256",
+]
+
+def _lista_config(valor):
+    """Converte uma configuração "a, b, c" (ou lista) em lista sem itens vazios"""
+    if isinstance(valor, str):
+        valor = valor.split(',')
+    return [item.strip() for item in (valor or []) if item and item.strip()]
+
+def padroes_bloqueados(config):
+    """
+    Padrões de URL bloqueados no modo leve, conforme a configuração
+
+    Returns:
+        list: Padrões para Network.setBlockedURLs (vazia se o modo leve estiver desativado)
+    """
+    if not config.get('CRAWLER_BLOQUEAR_RECURSOS', True):
+        return []
+
+    permitidos = set(_lista_config(config.get('CRAWLER_RECURSOS_PERMITIDOS')))
+    padroes = []
+    for tipo, padroes_tipo in RECURSOS_BLOQUEAVEIS.items():
+        if tipo not in permitidos:
+            padroes.extend(padroes_tipo)
+    return padroes + _lista_config(config.get('CRAWLER_URLS_BLOQUEADAS'))
+
+# Tempo até o DOM e bytes transferidos na última navegação (Navigation/Resource Timing)
+SCRIPT_METRICAS_NAVEGACAO = """
+var navegacao = performance.getEntriesByType('navigation')[0];
+if (!navegacao) {
+    return null;
+}
+var recursos = performance.getEntriesByType('resource');
+var bytes = navegacao.transferSize || 0;
+for (var i = 0; i < recursos.length; i++) {
+    bytes += recursos[i].transferSize || 0;
+}
+return {
+    tempo_dom_ms: navegacao.domContentLoadedEventEnd - navegacao.startTime,
+    bytes_transferidos: bytes,
+    recursos: recursos.length
+};
+"""
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36"
+
+class BackendLinkedIn:
+    """
+    Interface dos backends de acesso ao LinkedIn usados pelo LinkedInCrawler.
+
+    Um backend sabe autenticar, listar os perfis de uma página de busca e
+    extrair os campos brutos de um perfil (no formato de SELETORES_PERFIL).
+    Os seletores são tentados na ordem indicada pelo registro_seletores.
+    """
+
+    def __init__(self, config):
+        self.base_url = (config.get('LINKEDIN_BASE_URL') or 'https://www.linkedin.com').rstrip('/')
+
+        # Contador de páginas carregadas (usado pelo pool para reciclar sessões)
+        self.paginas_visitadas = 0
+
+    def login(self, username, password):
+        """Autentica a sessão no LinkedIn; deve lançar exceção em caso de falha"""
+        raise NotImplementedError
+
+    def exportar_cookies(self):
+        """
+        Returns:
+            list: Cookies da sessão no formato do Selenium (name, value, domain, path, expiry...)
+        """
+        raise NotImplementedError
+
+    def restaurar_cookies(self, cookies):
+        """Carrega na sessão cookies exportados anteriormente"""
+        raise NotImplementedError
+
+    def sessao_valida(self):
+        """Verifica, com uma única requisição, se a sessão está autenticada"""
+        raise NotImplementedError
+
+    def listar_resultados_busca(self, search_url):
+        """
+        Returns:
+            list: Valores brutos de cada card da página de busca, na ordem
+                exibida (ver SELETORES_CARD), mais o texto do card em 'texto'
+        """
+        raise NotImplementedError
+
+    def extrair_perfil(self, perfil_url):
+        """
+        Returns:
+            dict: Valores brutos dos campos do perfil (ver SELETORES_PERFIL)
+        """
+        raise NotImplementedError
+
+    def _registrar_extracao(self, pagina, campos, extraido):
+        """
+        Registra no RegistroSeletores quais seletores acertaram
+
+        Returns:
+            dict: Valores brutos extraídos
+        """
+        registro_seletores.registrar(pagina, campos, extraido['seletores'], extraido.get('tempos'))
+        return extraido['dados']
+
+    def metricas_navegacao(self):
+        """
+        Returns:
+            dict: Métricas da última página carregada (tempo até o DOM, bytes
+                transferidos), quando o backend consegue medi-las
+        """
+        return {}
+
+    def esta_saudavel(self):
+        """Verifica se a sessão ainda pode ser usada"""
+        return True
+
+    def memoria_mb(self):
+        """Memória ocupada pelos processos externos da sessão, em MB"""
+        return 0.0
+
+    def fechar(self):
+        """Libera os recursos da sessão"""
+
+class BackendSelenium(BackendLinkedIn):
+    """Backend que controla um Chrome headless pelo Selenium"""
+
+    def __init__(self, config):
+        super().__init__(config)
+
+        # Configurações do Chrome
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")  # Executar em modo headless
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
+        # Não esperar pelo carregamento de todos os recursos: as esperas são guiadas pelo DOM
+        chrome_options.page_load_strategy = config.get('CRAWLER_PAGE_LOAD_STRATEGY') or 'normal'
+
+        # Modo leve: menos memória e nenhum download de imagens, fontes e mídia
+        self.padroes_bloqueados = padroes_bloqueados(config)
+        if self.padroes_bloqueados:
+            for flag in FLAGS_ECONOMIA_MEMORIA:
+                chrome_options.add_argument(flag)
+            if 'imagens' not in _lista_config(config.get('CRAWLER_RECURSOS_PERMITIDOS')):
+                # Imagens não são baixadas, mas o atributo src (foto_url) continua no DOM
+                chrome_options.add_experimental_option('prefs', {
+                    'profile.managed_default_content_settings.images': 2
+                })
+
+        # Inicializar o driver (o chromedriver é resolvido uma vez por processo)
+        try:
+            service = Service(obter_chromedriver(config))
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        except SessionNotCreatedException as e:
+            # Driver incompatível com o Chrome instalado (ex.: Chrome atualizado)
+            logger.warning(f"chromedriver incompatível com o Chrome; obtendo outro: {e}")
+            service = Service(obter_chromedriver(config, revalidar=True))
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+
+        if self.padroes_bloqueados:
+            # Fontes, mídia e rastreadores são barrados pelo DevTools antes da requisição
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.padroes_bloqueados})
+
+        # Esperas guiadas pelo estado da página
+        self.esperas = EsperaAdaptativa(
+            self.driver,
+            tempo_maximo=config.get('CRAWLER_ESPERA_MAXIMA', 10),
+            tempo_quieto=config.get('CRAWLER_ESPERA_QUIETO', 0.5),
+            tempo_crescimento=config.get('CRAWLER_ESPERA_CRESCIMENTO', 2.0),
+            max_rolagens=config.get('CRAWLER_MAX_ROLAGENS', 10)
+        )
+
+    def _navegar(self, url):
+        """Carrega uma URL no driver e contabiliza a página visitada"""
+        self.driver.get(url)
+        self.paginas_visitadas += 1
+
+    def login(self, username, password):
+        self._navegar(f"{self.base_url}/login")
+
+        # Preencher credenciais
+        email_field = WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.ID, "username"))
+        )
+        password_field = self.driver.find_element(By.ID, "password")
+
+        email_field.send_keys(username)
+        password_field.send_keys(password)
+
+        # Clicar no botão de login
+        login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+        login_button.click()
+
+        # Aguardar login completo (verificando se a página inicial carregou)
+        WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.ID, "global-nav"))
+        )
+
+    def exportar_cookies(self):
+        return self.driver.get_cookies()
+
+    def restaurar_cookies(self, cookies):
+        # Via DevTools, para não precisar abrir uma página do domínio antes
+        cookies_cdp = []
+        for cookie in cookies:
+            cookie_cdp = {
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'domain': cookie.get('domain'),
+                'path': cookie.get('path', '/'),
+                'secure': cookie.get('secure', False),
+                'httpOnly': cookie.get('httpOnly', False),
+            }
+            if cookie.get('expiry'):
+                cookie_cdp['expires'] = cookie['expiry']
+            if not cookie_cdp['domain']:
+                del cookie_cdp['domain']
+                cookie_cdp['url'] = self.base_url
+            cookies_cdp.append(cookie_cdp)
+        self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies_cdp})
+
+    def sessao_valida(self):
+        self._navegar(f"{self.base_url}/feed/")
+        try:
+            # Sem sessão válida o LinkedIn redireciona para o formulário de login
+            WebDriverWait(self.driver, 5).until(
+                EC.any_of(
+                    EC.presence_of_element_located((By.ID, "global-nav")),
+                    EC.presence_of_element_located((By.ID, "username"))
+                )
+            )
+        except TimeoutException:
+            return False
+        return bool(self.driver.find_elements(By.ID, "global-nav"))
+
+    def listar_resultados_busca(self, search_url):
+        self._navegar(search_url)
+
+        # Aguardar carregamento dos resultados
+        WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, SELETOR_RESULTADOS_BUSCA))
+        )
+
+        # Scroll para carregar mais resultados, até não surgirem novos
+        self.esperas.rolar_ate_estabilizar(SELETOR_RESULTADOS_BUSCA, nome='busca')
+
+        # Extrair todos os cards em uma única chamada ao navegador
+        campos = registro_seletores.ordenar('card', SELETORES_CARD)
+        extraidos = self.driver.execute_script(SCRIPT_EXTRAIR_CARDS, SELETOR_RESULTADOS_BUSCA, campos) or []
+        return [self._registrar_extracao('card', campos, extraido) for extraido in extraidos]
+
+    def extrair_perfil(self, perfil_url):
+        # Acessar a página do perfil
+        self._navegar(perfil_url)
+
+        # Aguardar carregamento do perfil
+        WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, SELETOR_PERFIL_CARREGADO))
+        )
+
+        # Expandir seções "ver mais" e rolar até as habilidades
+        self.driver.execute_script(SCRIPT_PREPARAR_PERFIL, SELETOR_VER_MAIS)
+        self.esperas.aguardar_estabilizacao('perfil')
+
+        # Extrair todos os campos em uma única chamada ao navegador
+        campos = registro_seletores.ordenar('perfil', SELETORES_PERFIL)
+        return self._registrar_extracao('perfil', campos, self.driver.execute_script(SCRIPT_EXTRAIR_PERFIL, campos))
+
+    def metricas_navegacao(self):
+        try:
+            return self.driver.execute_script(SCRIPT_METRICAS_NAVEGACAO) or {}
+        except Exception:
+            return {}
+
+    def esta_saudavel(self):
+        try:
+            self.driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def memoria_mb(self):
+        """
+        Retorna a memória residente (RSS) do chromedriver e de todos os processos
+        do Chrome iniciados por ele, em MB
+        """
+        try:
+            processo = psutil.Process(self.driver.service.process.pid)
+            processos = [processo] + processo.children(recursive=True)
+            total = 0
+            for p in processos:
+                try:
+                    total += p.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    def fechar(self):
+        driver = getattr(self, 'driver', None)
+        if driver is None:
+            return
+        self.driver = None
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Erro ao encerrar o driver do LinkedIn: {e}")
+
+class BackendHTTP(BackendLinkedIn):
+    """
+    Backend leve baseado em requests + BeautifulSoup, sem navegador.
+
+    Usa uma `requests.Session` com pool de conexões keep-alive, o que permite
+    muito mais buscas simultâneas por host com uma fração da memória do Chrome.
+    Só enxerga o HTML entregue pelo servidor (não executa JavaScript).
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.timeout = config.get('LINKEDIN_HTTP_TIMEOUT', 15)
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8'
+        })
+
+        tamanho_pool = config.get('LINKEDIN_HTTP_POOL_MAXSIZE', 10)
+        adapter = HTTPAdapter(
+            pool_connections=tamanho_pool,
+            pool_maxsize=tamanho_pool,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _obter(self, url, **kwargs):
+        """Faz um GET e contabiliza a página visitada"""
+        resposta = self.session.get(url, timeout=self.timeout, **kwargs)
+        self.paginas_visitadas += 1
+        resposta.raise_for_status()
+        return resposta
+
+    def login(self, username, password):
+        resposta = self._obter(f"{self.base_url}/login")
+
+        # Reaproveitar os campos ocultos do formulário (tokens CSRF etc.)
+        soup = BeautifulSoup(resposta.text, 'html.parser')
+        campo_usuario = soup.find(id='username')
+        formulario = campo_usuario.find_parent('form') if campo_usuario else soup.find('form')
+        if formulario is None:
+            raise ValueError("Formulário de login do LinkedIn não encontrado.")
+
+        dados = {
+            campo.get('name'): campo.get('value', '')
+            for campo in formulario.find_all('input') if campo.get('name')
+        }
+        dados[campo_usuario.get('name', 'session_key') if campo_usuario else 'session_key'] = username
+        campo_senha = formulario.find(id='password')
+        dados[campo_senha.get('name', 'session_password') if campo_senha else 'session_password'] = password
+
+        acao = urljoin(resposta.url, formulario.get('action') or resposta.url)
+        resposta = self.session.post(acao, data=dados, timeout=self.timeout)
+        self.paginas_visitadas += 1
+        resposta.raise_for_status()
+
+        # Verificar se a página inicial autenticada carregou
+        if BeautifulSoup(resposta.text, 'html.parser').find(id='global-nav') is None:
+            raise ValueError("Não foi possível confirmar o login no LinkedIn.")
+
+    def exportar_cookies(self):
+        cookies = []
+        for cookie in self.session.cookies:
+            dados = {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'secure': cookie.secure,
+            }
+            if cookie.expires:
+                dados['expiry'] = cookie.expires
+            cookies.append(dados)
+        return cookies
+
+    def restaurar_cookies(self, cookies):
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/'),
+                secure=cookie.get('secure', False),
+                expires=cookie.get('expiry')
+            )
+
+    def sessao_valida(self):
+        try:
+            resposta = self._obter(f"{self.base_url}/feed/")
+        except requests.RequestException:
+            return False
+        return BeautifulSoup(resposta.text, 'html.parser').find(id='global-nav') is not None
+
+    def listar_resultados_busca(self, search_url):
+        campos = registro_seletores.ordenar('card', SELETORES_CARD)
+        cards = [
+            self._registrar_extracao('card', campos, extraido)
+            for extraido in extrair_cards_html(self._obter(search_url).text, campos)
+        ]
+        for card in cards:
+            if card.get('perfil_url'):
+                card['perfil_url'] = urljoin(search_url, card['perfil_url'])
+        return cards
+
+    def extrair_perfil(self, perfil_url):
+        resposta = self._obter(perfil_url)
+        campos = registro_seletores.ordenar('perfil', SELETORES_PERFIL)
+        return self._registrar_extracao('perfil', campos, extrair_perfil_html(resposta.text, campos))
+
+    def fechar(self):
+        self.session.close()
+
+BACKENDS = {
+    'selenium': BackendSelenium,
+    'http': BackendHTTP,
+}
+
+def criar_backend(config):
+    """
+    Cria o backend configurado em LINKEDIN_BACKEND ('selenium' ou 'http')
+
+    Args:
+        config (dict): Configuração da aplicação
+    """
+    nome = (config.get('LINKEDIN_BACKEND') or 'selenium').lower()
+    if nome not in BACKENDS:
+        raise ValueError(f"Backend do LinkedIn desconhecido: {nome}. Use um de: {', '.join(BACKENDS)}.")
+    return BACKENDS[nome](config)
@@ -1,15 +1,13 @@
-import time
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from flask import current_app
-import re
+from app.services.cache_perfis import cache_perfis, normalizar_url_perfil
+from app.services.linkedin_backends import criar_backend
+from app.services.linkedin_extracao import montar_info_perfil, interpretar_card
+from app.services.sessao_linkedin import criar_armazem_cookies
 
 logger = logging.getLogger(__name__)
 
@@ -18,22 +16,18 @@ class LinkedInCrawler:
     Classe para realizar crawler no LinkedIn para buscar perfis de profissionais.
     Nota: O uso de crawlers pode violar os termos de serviço do LinkedIn.
     Em um ambiente de produção, seria recomendável utilizar a API oficial.
+    
+    O acesso às páginas é delegado a um backend (ver linkedin_backends),
+    escolhido pela configuração LINKEDIN_BACKEND.
     """
     
-    def __init__(self):
-        """Inicializa o crawler do LinkedIn"""
-        # Configurações do Chrome
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Executar em modo headless
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
-        
-        # Inicializar o driver
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+    def __init__(self, backend=None):
+        """
+        Inicializa o crawler do LinkedIn
         
+        Args:
+            backend (BackendLinkedIn): Backend a ser usado (padrão: o configurado em LINKEDIN_BACKEND)
+        """
         # Verificar se as credenciais estão disponíveis
         self.username = current_app.config.get('LINKEDIN_USERNAME')
         self.password = current_app.config.get('LINKEDIN_PASSWORD')
@@ -41,38 +35,79 @@ class LinkedInCrawler:
         if not self.username or not self.password:
             raise ValueError("Credenciais do LinkedIn não configuradas. Configure LINKEDIN_USERNAME e LINKEDIN_PASSWORD.")
         
+        # Inicializar o backend (navegador ou cliente HTTP)
+        self.backend = backend or criar_backend(current_app.config)
+        
+        # Cookies de sessões anteriores, para evitar refazer o login
+        self.armazem_cookies = criar_armazem_cookies(current_app.config)
+        
+        # Estatísticas da última busca (ver buscar_profissionais)
+        self.estatisticas_busca = {}
+        self._perfis_carregados = 0
+        self._ordem_busca = []
+        
         # Realizar login no LinkedIn
         self._login()
     
+    @property
+    def paginas_visitadas(self):
+        """Número de páginas carregadas por esta sessão"""
+        return self.backend.paginas_visitadas
+    
+    def esta_saudavel(self):
+        """Verifica se a sessão ainda responde a comandos"""
+        return self.backend is not None and self.backend.esta_saudavel()
+    
+    def memoria_mb(self):
+        """Memória ocupada pela sessão (processos do navegador), em MB"""
+        return self.backend.memoria_mb() if self.backend is not None else 0.0
+    
+    def _restaurar_sessao(self):
+        """
+        Tenta reaproveitar os cookies salvos de um login anterior
+        
+        Returns:
+            bool: True se a sessão restaurada estiver autenticada
+        """
+        if self.armazem_cookies is None:
+            return False
+        
+        cookies = self.armazem_cookies.carregar(self.username)
+        if not cookies:
+            return False
+        
+        try:
+            self.backend.restaurar_cookies(cookies)
+            if self.backend.sessao_valida():
+                return True
+        except Exception as e:
+            logger.warning(f"Erro ao restaurar a sessão do LinkedIn: {e}")
+        
+        logger.info("Cookies salvos do LinkedIn expirados; refazendo o login.")
+        self.armazem_cookies.apagar()
+        return False
+    
     def _login(self):
-        """Realiza login no LinkedIn"""
+        """Realiza login no LinkedIn, reaproveitando a sessão salva quando possível"""
+        if self._restaurar_sessao():
+            logger.info("Sessão do LinkedIn restaurada a partir dos cookies salvos.")
+            return
+        
         try:
-            self.driver.get("https://www.linkedin.com/login")
-            
-            # Preencher credenciais
-            email_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            password_field = self.driver.find_element(By.ID, "password")
-            
-            email_field.send_keys(self.username)
-            password_field.send_keys(self.password)
-            
-            # Clicar no botão de login
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            login_button.click()
-            
-            # Aguardar login completo (verificando se a página inicial carregou)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "global-nav"))
-            )
-            
+            self.backend.login(self.username, self.password)
             logger.info("Login no LinkedIn realizado com sucesso!")
         except Exception as e:
             logger.error(f"Erro ao fazer login no LinkedIn: {e}")
             raise
+        
+        if self.armazem_cookies is not None:
+            try:
+                self.armazem_cookies.salvar(self.username, self.backend.exportar_cookies())
+            except Exception as e:
+                logger.warning(f"Erro ao salvar os cookies do LinkedIn: {e}")
     
-    def buscar_profissionais(self, palavras_chave, min_seguidores=0, localizacao=None, max_resultados=10):
+    def buscar_profissionais(self, palavras_chave, min_seguidores=0, localizacao=None, max_resultados=10,
+                             pool=None, workers=1, progresso=None, por_palavra=False):
         """
         Busca profissionais no LinkedIn com base em palavras-chave
         
@@ -81,70 +116,337 @@ class LinkedInCrawler:
             min_seguidores (int): Número mínimo de seguidores
             localizacao (str): Localização para filtrar (opcional)
             max_resultados (int): Número máximo de resultados a retornar
+            pool (CrawlerPool): Pool de onde emprestar sessões extras para
+                visitar os perfis em paralelo (opcional)
+            workers (int): Número máximo de navegadores visitando perfis ao
+                mesmo tempo, incluindo esta sessão
+            progresso (callable): Função chamada como `progresso(atual, total, perfil_url)`
+                a cada perfil visitado (opcional)
+            por_palavra (bool): Fazer uma busca por palavra-chave, em paralelo,
+                em vez de uma única busca com todas; os candidatos são
+                ranqueados pelo número de palavras-chave em que aparecem e
+                pelos seguidores, e só os melhores são visitados
             
         Returns:
-            list: Lista de dicionários com informações dos perfis encontrados
+            list: Lista de dicionários com informações dos perfis encontrados,
+                na ordem dos resultados da busca (ou do ranking)
         """
         resultados = []
+        for info in self.iterar_profissionais(palavras_chave, min_seguidores, localizacao, max_resultados,
+                                              pool, workers, progresso, por_palavra=por_palavra):
+            resultados.append(info)
+        
+        # Com vários workers os perfis chegam fora de ordem
+        ordem = {url: i for i, url in enumerate(self._ordem_busca)}
+        resultados.sort(key=lambda info: ordem.get(info.get('perfil_url'), len(ordem)))
+        return resultados
+    
+    def iterar_profissionais(self, palavras_chave, min_seguidores=0, localizacao=None, max_resultados=10,
+                             pool=None, workers=1, progresso=None, cancelar=None, por_palavra=False):
+        """
+        Gerador que busca profissionais no LinkedIn e entrega cada perfil
+        qualificado assim que ele é extraído
         
-        # Montar a consulta de busca
-        query = " ".join(palavras_chave)
+        Recebe os mesmos argumentos de `buscar_profissionais`, mais `cancelar`
+        (threading.Event). Quando o evento é sinalizado, ou o gerador é
+        fechado, nenhum perfil novo é visitado e as sessões emprestadas do pool
+        são devolvidas assim que terminam a página em andamento.
+        
+        Yields:
+            dict: Informações de cada perfil qualificado, na ordem em que são extraídos
+        """
         if isinstance(palavras_chave, str):
-            query = palavras_chave
-            
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={query}&origin=GLOBAL_SEARCH_HEADER"
+            palavras_chave = [palavras_chave]
         
-        if localizacao:
-            search_url += f"&locationId={localizacao}"
+        if por_palavra and len(palavras_chave) > 1:
+            # Uma busca por palavra-chave, com os candidatos combinados e ranqueados
+            buscas = self._listar_cards_por_palavra(palavras_chave, localizacao, pool, workers)
+        else:
+            cards = []
+            search_url = self._montar_url_busca(" ".join(palavras_chave), localizacao)
+            try:
+                cards = self.backend.listar_resultados_busca(search_url)
+            except Exception as e:
+                logger.error(f"Erro na busca de profissionais: {e}")
+            buscas = [(" ".join(palavras_chave), cards)]
+        
+        candidatos = self._pre_filtrar_cards(buscas, min_seguidores)
+        if len(buscas) > 1:
+            candidatos = self._ranquear_candidatos(candidatos)
+        self._ordem_busca = list(candidatos)
+        encontrados = 0
         
         try:
-            self.driver.get(search_url)
-            
-            # Aguardar carregamento dos resultados
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".search-result__info, .reusable-search__result-container"))
-            )
-            
-            # Scroll para carregar mais resultados
-            for _ in range(3):  # Ajuste conforme necessário
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-            
-            # Adaptar seletores baseado na versão atual do LinkedIn
-            resultados_elementos = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                ".search-result__info, .reusable-search__result-container"
+            with closing(self._iterar_perfis(list(candidatos), pool, workers, progresso, cancelar)) as perfis:
+                for info in perfis:
+                    if info is None or info.get('seguidores', 0) < min_seguidores:
+                        continue
+                    
+                    # Completar com os dados do card o que o perfil não trouxe
+                    card = candidatos.get(info.get('perfil_url'), {})
+                    info['nome'] = info.get('nome') or card.get('nome', '')
+                    info['cargo_atual'] = info.get('cargo_atual') or card.get('cargo', '')
+                    info.setdefault('localizacao', card.get('localizacao', ''))
+                    if len(buscas) > 1:
+                        info['palavras_chave_encontradas'] = card.get('palavras_chave', [])
+                    
+                    yield info
+                    encontrados += 1
+                    if encontrados >= max_resultados:
+                        break
+        finally:
+            self.estatisticas_busca['perfis_carregados'] = self._perfis_carregados
+            logger.info(
+                f"Busca no LinkedIn: {self.estatisticas_busca['cards']} cards, "
+                f"{self.estatisticas_busca['duplicados']} duplicados, "
+                f"{self.estatisticas_busca['descartados_previamente']} descartados pelo card, "
+                f"{self.estatisticas_busca['perfis_carregados']} perfis carregados"
             )
-            
-            for i, elemento in enumerate(resultados_elementos):
-                if i >= max_resultados:
+    
+    def _montar_url_busca(self, query, localizacao=None):
+        """URL da busca de pessoas do LinkedIn para a consulta informada"""
+        search_url = f"{self.backend.base_url}/search/results/people/?keywords={query}&origin=GLOBAL_SEARCH_HEADER"
+        if localizacao:
+            search_url += f"&locationId={localizacao}"
+        return search_url
+    
+    def _listar_cards_por_palavra(self, palavras_chave, localizacao=None, pool=None, workers=1):
+        """
+        Faz uma busca por palavra-chave, distribuindo as buscas entre esta
+        sessão e até `workers - 1` sessões emprestadas do pool
+        
+        Returns:
+            list: Pares (palavra-chave, cards da busca), na ordem das palavras-chave
+        """
+        cards_por_palavra = {}
+        pendentes = iter(palavras_chave)
+        lock = threading.Lock()
+        
+        def proxima_palavra():
+            with lock:
+                return next(pendentes, None)
+        
+        def trabalhar(crawler):
+            while True:
+                palavra = proxima_palavra()
+                if palavra is None:
                     break
-                
                 try:
-                    # Extrair link do perfil
-                    link_element = elemento.find_element(By.CSS_SELECTOR, "a.app-aware-link")
-                    perfil_url = link_element.get_attribute("href").split("?")[0]
-                    
-                    # Obter mais informações do perfil
-                    info_perfil = self.obter_info_perfil(perfil_url)
-                    
-                    # Verificar número de seguidores
-                    seguidores = info_perfil.get('seguidores', 0)
-                    if seguidores >= min_seguidores:
-                        resultados.append(info_perfil)
-                
+                    cards = crawler.backend.listar_resultados_busca(self._montar_url_busca(palavra, localizacao))
                 except Exception as e:
-                    logger.warning(f"Erro ao processar perfil: {e}")
+                    logger.error(f"Erro na busca de profissionais por '{palavra}': {e}")
+                    cards = []
+                cards_por_palavra[palavra] = cards
+        
+        def trabalhar_com_pool():
+            try:
+                with pool.sessao(timeout=0) as crawler:
+                    trabalhar(crawler)
+            except RuntimeError:
+                pass
+        
+        extras = min(workers, len(palavras_chave)) - 1 if pool is not None else 0
+        if extras <= 0:
+            trabalhar(self)
+        else:
+            with ThreadPoolExecutor(max_workers=extras) as executor:
+                futuros = [executor.submit(trabalhar_com_pool) for _ in range(extras)]
+                trabalhar(self)
+                for futuro in futuros:
+                    if futuro.exception() is not None:
+                        logger.warning(f"Erro em sessão de busca: {futuro.exception()}")
+        
+        return [(palavra, cards_por_palavra.get(palavra, [])) for palavra in palavras_chave]
+    
+    def _pre_filtrar_cards(self, buscas, min_seguidores):
+        """
+        Combina os cards das buscas e descarta, antes de abrir os perfis, os
+        duplicados e os que certamente não atingem o mínimo de seguidores
+        
+        Um card só é descartado quando informa os seguidores e o limite superior
+        da contagem exibida fica abaixo de `min_seguidores`. Cards sem essa
+        informação (ou só com o número de conexões) seguem para a visita.
+        
+        Args:
+            buscas (list): Pares (palavra-chave, cards da busca)
+            min_seguidores (int): Número mínimo de seguidores
+        
+        Returns:
+            dict: Dados do card de cada perfil que ainda pode se qualificar,
+                indexados pela URL do perfil, na ordem da busca. Em
+                'palavras_chave' ficam as buscas em que o perfil apareceu.
+        """
+        por_chave = {}
+        descartados = set()
+        total_cards = duplicados = 0
+        
+        for palavra, cards in buscas:
+            total_cards += len(cards)
+            for dados in cards:
+                card = interpretar_card(dados, self.backend.base_url)
+                if not card['perfil_url']:
+                    continue
+                
+                chave = normalizar_url_perfil(card['perfil_url'])
+                if chave in por_chave or chave in descartados:
+                    duplicados += 1
+                    if chave in por_chave and palavra not in por_chave[chave]['palavras_chave']:
+                        por_chave[chave]['palavras_chave'].append(palavra)
+                    continue
+                
+                if card['seguidores_max'] is not None and card['seguidores_max'] < min_seguidores:
+                    descartados.add(chave)
                     continue
+                
+                card['palavras_chave'] = [palavra]
+                por_chave[chave] = card
         
-        except Exception as e:
-            logger.error(f"Erro na busca de profissionais: {e}")
+        self._perfis_carregados = 0
+        self.estatisticas_busca = {
+            'buscas': len(buscas),
+            'cards': total_cards,
+            'duplicados': duplicados,
+            'descartados_previamente': len(descartados),
+            'perfis_evitados': duplicados + len(descartados),
+            'perfis_carregados': 0,
+        }
+        return {card['perfil_url']: card for card in por_chave.values()}
+    
+    def _ranquear_candidatos(self, candidatos):
+        """
+        Ordena os candidatos de buscas combinadas: primeiro os que apareceram
+        em mais palavras-chave, depois os com mais seguidores no card (os sem
+        essa informação vão por último). Empates mantêm a ordem das buscas.
         
-        return resultados
+        Returns:
+            dict: Os mesmos candidatos, na ordem do ranking
+        """
+        ordenados = sorted(
+            candidatos.values(),
+            key=lambda card: (-len(card['palavras_chave']), -(card['seguidores_max'] or -1))
+        )
+        return {card['perfil_url']: card for card in ordenados}
+    
+    def _iterar_perfis(self, perfis_urls, pool=None, workers=1, progresso=None, cancelar=None):
+        """
+        Visita os perfis encontrados na busca, entregando cada um assim que é extraído
+        
+        Com um pool e mais de um worker, as URLs são distribuídas entre esta
+        sessão e até `workers - 1` sessões emprestadas do pool. Ao fechar o
+        gerador, as sessões param de pegar novas URLs e só então ele retorna.
+        
+        Yields:
+            dict: Informações de cada perfil (ou None, se a visita falhou)
+        """
+        def cancelado():
+            return cancelar is not None and cancelar.is_set()
+        
+        total = len(perfis_urls)
+        if progresso:
+            progresso(0, total, None)
+        
+        if pool is None or workers <= 1 or total <= 1:
+            for i, perfil_url in enumerate(perfis_urls):
+                if cancelado():
+                    return
+                info = self.obter_info_perfil(perfil_url)
+                if progresso:
+                    progresso(i + 1, total, perfil_url)
+                yield info
+            return
+        
+        fila = queue.Queue()
+        pendentes = iter(perfis_urls)
+        lock = threading.Lock()
+        parar = threading.Event()
+        
+        def proxima_url():
+            with lock:
+                return next(pendentes, None)
+        
+        def trabalhar(crawler):
+            carregados_antes = crawler._perfis_carregados
+            try:
+                while not parar.is_set() and not cancelado():
+                    perfil_url = proxima_url()
+                    if perfil_url is None:
+                        break
+                    try:
+                        info = crawler.obter_info_perfil(perfil_url)
+                    except Exception as e:
+                        logger.warning(f"Erro ao processar perfil {perfil_url}: {e}")
+                        info = None
+                    fila.put((perfil_url, info))
+            finally:
+                # Contabilizar nesta sessão os perfis carregados pelas sessões emprestadas
+                if crawler is not self:
+                    with lock:
+                        self._perfis_carregados += crawler._perfis_carregados - carregados_antes
+        
+        def trabalhar_com_pool():
+            # Não esperar por sessões ocupadas: esta sessão segue trabalhando
+            try:
+                with pool.sessao(timeout=0) as crawler:
+                    trabalhar(crawler)
+            except RuntimeError:
+                pass
+        
+        extras = min(workers, total) - 1
+        executor = ThreadPoolExecutor(max_workers=extras + 1)
+        futuros = [executor.submit(trabalhar, self)]
+        futuros += [executor.submit(trabalhar_com_pool) for _ in range(extras)]
+        
+        recebidos = 0
+        try:
+            while recebidos < total and not cancelado():
+                try:
+                    perfil_url, info = fila.get(timeout=0.5)
+                except queue.Empty:
+                    if all(futuro.done() for futuro in futuros) and fila.empty():
+                        break
+                    continue
+                
+                recebidos += 1
+                if progresso:
+                    progresso(recebidos, total, perfil_url)
+                yield info
+        finally:
+            parar.set()
+            executor.shutdown(wait=True)
+            for futuro in futuros:
+                if futuro.exception() is not None:
+                    logger.warning(f"Erro em sessão de enriquecimento: {futuro.exception()}")
+    
+    def obter_info_perfil(self, perfil_url, forcar_atualizacao=False):
+        """
+        Obtém informações detalhadas de um perfil do LinkedIn, consultando
+        antes o cache de perfis
+        
+        Args:
+            perfil_url (str): URL do perfil do LinkedIn
+            forcar_atualizacao (bool): Ignorar o cache e visitar o perfil
+            
+        Returns:
+            dict: Dicionário com informações do perfil
+        """
+        if not forcar_atualizacao:
+            info = cache_perfis.obter(perfil_url)
+            if info is not None:
+                info['perfil_url'] = perfil_url
+                return info
+        
+        info = self._extrair_info_perfil(perfil_url)
+        self._perfis_carregados += 1
+        
+        # Só armazenar extrações bem-sucedidas
+        if info.get('nome'):
+            cache_perfis.salvar(perfil_url, info)
+        
+        return info
     
-    def obter_info_perfil(self, perfil_url):
+    def _extrair_info_perfil(self, perfil_url):
         """
-        Obtém informações detalhadas de um perfil do LinkedIn
+        Visita o perfil pelo backend e extrai suas informações
         
         Args:
             perfil_url (str): URL do perfil do LinkedIn
@@ -165,99 +467,21 @@ class LinkedInCrawler:
         }
         
         try:
-            # Acessar a página do perfil
-            self.driver.get(perfil_url)
-            
-            # Aguardar carregamento do perfil
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".pv-top-card, .profile-background-image"))
-            )
-            
-            # Nome
-            try:
-                nome_element = self.driver.find_element(By.CSS_SELECTOR, ".text-heading-xlarge, .pv-top-card--list-bullet > li:first-child")
-                info['nome'] = nome_element.text.strip()
-            except NoSuchElementException:
-                try:
-                    # Alternativa para o layout mais recente
-                    nome_element = self.driver.find_element(By.CSS_SELECTOR, "h1.text-heading-xlarge")
-                    info['nome'] = nome_element.text.strip()
-                except:
-                    pass
-            
-            # Cargo atual
-            try:
-                cargo_element = self.driver.find_element(By.CSS_SELECTOR, ".text-body-medium, .pv-top-card--experience-list-item")
-                info['cargo_atual'] = cargo_element.text.strip()
-            except:
-                pass
-            
-            # Empresa atual
-            try:
-                empresa_elements = self.driver.find_elements(By.CSS_SELECTOR, ".pv-top-card--experience-list-item, .inline-show-more-text")
-                if len(empresa_elements) > 1:
-                    info['empresa_atual'] = empresa_elements[1].text.strip()
-            except:
-                pass
-            
-            # Bio/Sobre
-            try:
-                # Tentar expandir seção "sobre"
-                try:
-                    ver_mais = self.driver.find_element(By.CSS_SELECTOR, ".lt-line-clamp__more, .inline-show-more-button")
-                    ver_mais.click()
-                    time.sleep(1)
-                except:
-                    pass
-                
-                bio_element = self.driver.find_element(By.CSS_SELECTOR, ".pv-about-section, .display-flex.ph5.pv3")
-                info['bio'] = bio_element.text.strip()
-            except:
-                pass
-            
-            # Extrair número de seguidores
-            try:
-                seguidores_text = self.driver.find_element(By.CSS_SELECTOR, ".pv-recent-activity-section__follower-count, .text-body-small").text
-                # Extrair apenas os números usando regex
-                seguidores_match = re.search(r'(\d+(?:,\d+)?)', seguidores_text)
-                if seguidores_match:
-                    seguidores_str = seguidores_match.group(1).replace(',', '')
-                    info['seguidores'] = int(seguidores_str)
-            except:
-                pass
-            
-            # URL da foto de perfil
-            try:
-                foto_element = self.driver.find_element(By.CSS_SELECTOR, ".pv-top-card__photo img, .profile-photo-edit__preview")
-                info['foto_url'] = foto_element.get_attribute("src")
-            except:
-                pass
-            
-            # Scroll para ver habilidades
-            self.driver.execute_script("window.scrollTo(0, 2000);")
-            time.sleep(2)
-            
-            # Tentar clicar no botão "Ver mais" nas habilidades
-            try:
-                ver_mais_skills = self.driver.find_element(By.CSS_SELECTOR, ".pv-skills-section__additional-skills, .inline-show-more-button")
-                ver_mais_skills.click()
-                time.sleep(1)
-            except:
-                pass
-            
-            # Habilidades (Skills)
-            try:
-                habilidades_elements = self.driver.find_elements(By.CSS_SELECTOR, ".pv-skill-category-entity__name-text, .display-flex.align-items-center.mr1.hoverable-link-text")
-                info['habilidades'] = [elem.text.strip() for elem in habilidades_elements if elem.text.strip()]
-            except:
-                pass
+            info.update(montar_info_perfil(self.backend.extrair_perfil(perfil_url)))
             
         except Exception as e:
             logger.error(f"Erro ao obter informações do perfil {perfil_url}: {e}")
         
         return info
     
+    def fechar(self):
+        """Encerra a sessão do backend e todos os processos associados"""
+        backend = getattr(self, 'backend', None)
+        if backend is None:
+            return
+        self.backend = None
+        backend.fechar()
+    
     def __del__(self):
         """Fechar o driver ao destruir o objeto"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
\ No newline at end of file
+        self.fechar()
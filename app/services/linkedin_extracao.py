@@ -0,0 +1,239 @@
+import os
+import re
+import time
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+
+# Contêineres de resultado na página de busca e link para o perfil dentro deles
+SELETOR_RESULTADOS_BUSCA = ".search-result__info, .reusable-search__result-container"
+SELETOR_LINK_PERFIL = "a.app-aware-link"
+
+# Campos exibidos em cada card de resultado da busca (mesmo formato de SELETORES_PERFIL)
+SELETORES_CARD = {
+    'perfil_url': {
+        'tipo': 'atributo',
+        'atributo': 'href',
+        'seletores': [SELETOR_LINK_PERFIL]
+    },
+    'nome': {
+        'tipo': 'texto',
+        'seletores': ['.entity-result__title-text span[aria-hidden="true"]', '.entity-result__title-text', '.actor-name']
+    },
+    'cargo': {
+        'tipo': 'texto',
+        'seletores': ['.entity-result__primary-subtitle', '.subline-level-1']
+    },
+    'localizacao': {
+        'tipo': 'texto',
+        'seletores': ['.entity-result__secondary-subtitle', '.subline-level-2']
+    },
+}
+
+# Seletor que indica que a página de perfil terminou de carregar
+SELETOR_PERFIL_CARREGADO = ".pv-top-card, .profile-background-image"
+
+# Botões "ver mais" da seção sobre e das habilidades
+SELETOR_VER_MAIS = ".lt-line-clamp__more, .inline-show-more-button, .pv-skills-section__additional-skills"
+
+# Campos do perfil e seus seletores, em ordem de preferência.
+# Tipos: 'texto' (texto do primeiro elemento), 'atributo', 'lista' (texto de
+# todos os elementos) e 'indice' (texto do elemento na posição `indice`).
+SELETORES_PERFIL = {
+    'nome': {
+        'tipo': 'texto',
+        'seletores': ['.text-heading-xlarge', '.pv-top-card--list-bullet > li:first-child', 'h1.text-heading-xlarge']
+    },
+    'cargo_atual': {
+        'tipo': 'texto',
+        'seletores': ['.text-body-medium', '.pv-top-card--experience-list-item']
+    },
+    'empresa_atual': {
+        'tipo': 'indice',
+        'indice': 1,
+        'seletores': ['.pv-top-card--experience-list-item, .inline-show-more-text']
+    },
+    'bio': {
+        'tipo': 'texto',
+        'seletores': ['.pv-about-section', '.display-flex.ph5.pv3']
+    },
+    'seguidores': {
+        'tipo': 'texto',
+        'seletores': ['.pv-recent-activity-section__follower-count', '.text-body-small']
+    },
+    'foto_url': {
+        'tipo': 'atributo',
+        'atributo': 'src',
+        'seletores': ['.pv-top-card__photo img', '.profile-photo-edit__preview']
+    },
+    'habilidades': {
+        'tipo': 'lista',
+        'seletores': ['.pv-skill-category-entity__name-text', '.display-flex.align-items-center.mr1.hoverable-link-text']
+    },
+}
+
+def _carregar_script(nome):
+    """Lê um script JavaScript da pasta services/scripts"""
+    with open(os.path.join(os.path.dirname(__file__), 'scripts', nome), encoding='utf-8') as f:
+        return f.read()
+
+SCRIPT_EXTRAIR_PERFIL = _carregar_script('extrair_perfil.js') + "\nreturn extrairPerfil(document, arguments[0]);"
+
+# Extrai todos os cards da busca em uma única chamada: arguments[0] é o seletor
+# dos cards e arguments[1] a descrição dos campos (SELETORES_CARD)
+SCRIPT_EXTRAIR_CARDS = _carregar_script('extrair_perfil.js') + """
+var cards = document.querySelectorAll(arguments[0]);
+var resultado = [];
+for (var i = 0; i < cards.length; i++) {
+    var extraido = extrairPerfil(cards[i], arguments[1]);
+    extraido.dados.texto = (cards[i].innerText || cards[i].textContent || '').trim();
+    resultado.push(extraido);
+}
+return resultado;
+"""
+
+SCRIPT_PREPARAR_PERFIL = """
+var botoes = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < botoes.length; i++) {
+    try { botoes[i].click(); } catch (e) {}
+}
+window.scrollTo(0, 2000);
+"""
+
+def extrair_numero_seguidores(texto):
+    """Extrai o número de seguidores de um texto como "1,234 seguidores" """
+    seguidores_match = re.search(r'(\d+(?:,\d+)?)', texto or '')
+    if seguidores_match:
+        return int(seguidores_match.group(1).replace(',', ''))
+    return 0
+
+def montar_info_perfil(dados):
+    """
+    Converte os valores brutos extraídos da página (ver SELETORES_PERFIL)
+    nos campos do dicionário de perfil, omitindo os que não foram encontrados
+    """
+    info = {}
+    for campo in ('nome', 'cargo_atual', 'empresa_atual', 'bio', 'foto_url'):
+        if dados.get(campo):
+            info[campo] = dados[campo].strip()
+    if dados.get('seguidores'):
+        info['seguidores'] = extrair_numero_seguidores(dados['seguidores'])
+    if dados.get('habilidades'):
+        info['habilidades'] = [h.strip() for h in dados['habilidades'] if h.strip()]
+    return info
+
+def _texto_elemento(elemento):
+    return elemento.get_text('\n', strip=True)
+
+def extrair_campos(raiz, campos):
+    """
+    Equivalente em Python (BeautifulSoup) de extrairPerfil em scripts/extrair_perfil.js
+
+    Args:
+        raiz: Documento ou elemento do BeautifulSoup onde procurar
+        campos (dict): Descrição dos campos (ver SELETORES_PERFIL)
+
+    Returns:
+        dict: {'dados': {campo: valor}, 'seletores': {campo: índice do seletor usado ou -1},
+            'tempos': {campo: milissegundos gastos na extração do campo}}
+    """
+    resultado = {'dados': {}, 'seletores': {}, 'tempos': {}}
+
+    for nome, campo in campos.items():
+        valor, indice_usado = None, -1
+        inicio = time.perf_counter()
+
+        for i, seletor in enumerate(campo['seletores']):
+            try:
+                if campo['tipo'] == 'lista':
+                    valor = [t for t in (_texto_elemento(e) for e in raiz.select(seletor)) if t] or None
+                elif campo['tipo'] == 'indice':
+                    elementos = raiz.select(seletor)
+                    if len(elementos) > campo['indice']:
+                        valor = _texto_elemento(elementos[campo['indice']])
+                else:
+                    elemento = raiz.select_one(seletor)
+                    if elemento is not None:
+                        if campo['tipo'] == 'atributo':
+                            valor = elemento.get(campo['atributo']) or ''
+                        else:
+                            valor = _texto_elemento(elemento)
+            except Exception:
+                # Seletor não suportado: tentar o próximo
+                valor = None
+
+            if valor:
+                indice_usado = i
+                break
+
+        resultado['dados'][nome] = valor or None
+        resultado['seletores'][nome] = indice_usado
+        resultado['tempos'][nome] = (time.perf_counter() - inicio) * 1000
+
+    return resultado
+
+def extrair_perfil_html(html, campos=SELETORES_PERFIL):
+    """
+    Extrai os campos de uma página de perfil obtida sem navegador
+
+    Returns:
+        dict: Resultado de extrair_campos
+    """
+    return extrair_campos(BeautifulSoup(html, 'html.parser'), campos)
+
+def extrair_cards_html(html, campos=SELETORES_CARD):
+    """
+    Extrai os dados de cada card de resultado de uma página de busca obtida sem navegador
+
+    Returns:
+        list: Resultado de extrair_campos para cada card, com o texto completo
+            do card em dados['texto']
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    cards = []
+    for elemento in soup.select(SELETOR_RESULTADOS_BUSCA):
+        extraido = extrair_campos(elemento, campos)
+        extraido['dados']['texto'] = elemento.get_text(' ', strip=True)
+        cards.append(extraido)
+    return cards
+
+def _interpretar_numero(numero, sufixo):
+    """Converte "15,838", "15.838", "1,2" + "mil", "12" + "K" etc. em número"""
+    multiplicador = {'mil': 1000, 'k': 1000, 'mi': 1000000, 'm': 1000000}.get((sufixo or '').lower(), 1)
+    if multiplicador > 1 and re.fullmatch(r'\d+[.,]\d{1,2}', numero):
+        return float(numero.replace(',', '.')) * multiplicador
+    return int(re.sub(r'[.,]', '', numero)) * multiplicador
+
+def interpretar_card(dados, base_url=None):
+    """
+    Converte os valores brutos de um card de busca no resumo usado pela pré-filtragem
+
+    Quando o card informa os seguidores de forma abreviada ("1,2 mil"),
+    `seguidores_max` traz uma estimativa pelo limite superior do arredondamento,
+    para que nenhum perfil que possa se qualificar seja descartado.
+
+    Returns:
+        dict: perfil_url, nome, cargo, localizacao, seguidores_max (ou None) e conexoes_min (ou None)
+    """
+    texto = dados.get('texto') or ''
+    card = {
+        'perfil_url': urljoin(base_url or '', dados.get('perfil_url') or '').split('?')[0],
+        'nome': (dados.get('nome') or '').strip(),
+        'cargo': (dados.get('cargo') or '').strip(),
+        'localizacao': (dados.get('localizacao') or '').strip(),
+        'seguidores_max': None,
+        'conexoes_min': None,
+    }
+
+    seguidores = re.search(r'(\d+(?:[.,]\d+)*)\s*(mil|mi|k|m)?\s*(?:seguidores|followers)', texto, re.IGNORECASE)
+    if seguidores:
+        valor = _interpretar_numero(seguidores.group(1), seguidores.group(2))
+        if seguidores.group(2):
+            # Abreviado: margem para o arredondamento da exibição
+            valor = valor * 1.1
+        card['seguidores_max'] = int(valor)
+
+    conexoes = re.search(r'(\d+(?:[.,]\d+)*)\+?\s*(?:conexões|conexoes|connections)', texto, re.IGNORECASE)
+    if conexoes:
+        card['conexoes_min'] = int(_interpretar_numero(conexoes.group(1), None))
+
+    return card
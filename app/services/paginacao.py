@@ -0,0 +1,209 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from flask import current_app
+from itsdangerous import BadData, URLSafeSerializer
+from sqlalchemy import and_, or_
+
+DEPOIS = 'd'
+ANTES = 'a'
+
+class PaginaCursor:
+    """
+    Página de uma listagem paginada por cursor (ver paginar_por_cursor)
+
+    Os cursores são opacos: basta repassá-los no parâmetro `cursor` da URL
+    para obter a página seguinte ou a anterior.
+
+    Ao contrário da Pagination do Flask-SQLAlchemy, não há número de página
+    (`page`, `next_num`, `iter_pages`): só se navega para a página seguinte
+    ou a anterior. `pages` é calculado a partir do total, quando informado.
+    """
+
+    def __init__(self, itens, por_pagina, proximo_cursor=None, anterior_cursor=None, total=None):
+        self.itens = itens
+        self.por_pagina = por_pagina
+        self.proximo_cursor = proximo_cursor
+        self.anterior_cursor = anterior_cursor
+        self.total = total
+
+    @property
+    def tem_proxima(self):
+        return self.proximo_cursor is not None
+
+    @property
+    def tem_anterior(self):
+        return self.anterior_cursor is not None
+
+    # Nomes da Pagination do Flask-SQLAlchemy, para os templates
+    @property
+    def items(self):
+        return self.itens
+
+    @property
+    def has_next(self):
+        return self.tem_proxima
+
+    @property
+    def has_prev(self):
+        return self.tem_anterior
+
+    @property
+    def pages(self):
+        """Quantidade de páginas, ou None se o total não foi contado"""
+        if self.total is None:
+            return None
+        return max(1, math.ceil(self.total / self.por_pagina))
+
+def _serializador():
+    return URLSafeSerializer(current_app.config['SECRET_KEY'], salt='paginacao')
+
+def _codificar_valor(valor):
+    return {'dt': valor.isoformat()} if isinstance(valor, datetime) else valor
+
+def _decodificar_valor(valor):
+    return datetime.fromisoformat(valor['dt']) if isinstance(valor, dict) else valor
+
+def gerar_cursor(valores, direcao):
+    """Cursor opaco (e assinado) para a posição `valores` da ordenação"""
+    return _serializador().dumps([direcao, [_codificar_valor(v) for v in valores]])
+
+def interpretar_cursor(cursor, quantidade_colunas):
+    """
+    Returns:
+        tuple: (direção, valores), ou None se o cursor for inválido ou adulterado
+    """
+    if not cursor:
+        return None
+    try:
+        direcao, valores = _serializador().loads(cursor)
+    except (BadData, TypeError, ValueError):
+        return None
+    if direcao not in (DEPOIS, ANTES) or not isinstance(valores, list) or len(valores) != quantidade_colunas:
+        return None
+    try:
+        return direcao, [_decodificar_valor(v) for v in valores]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def _condicao_apos(ordem, valores):
+    """
+    Condição "vem depois de `valores`" na ordenação, expandida em OR/AND
+    (equivalente a uma comparação de tuplas, mas com direção por coluna):
+    a > x OR (a = x AND b > y) OR ...
+    """
+    alternativas = []
+    for i, (coluna, decrescente) in enumerate(ordem):
+        iguais = [c == v for (c, _), v in zip(ordem[:i], valores[:i])]
+        seguinte = coluna < valores[i] if decrescente else coluna > valores[i]
+        alternativas.append(and_(*iguais, seguinte))
+    return or_(*alternativas)
+
+class _CacheTotais:
+    """
+    Totais das listagens, reaproveitados por alguns segundos
+
+    A chave são os parâmetros normalizados do filtro, informados por quem
+    pagina (nada é compilado a cada requisição). No máximo `max_entradas`
+    totais ficam guardados: ao passar do limite saem os expirados e, se
+    ainda faltar espaço, os usados há mais tempo.
+    """
+
+    def __init__(self, max_entradas=256):
+        self.max_entradas = max_entradas
+        self._totais = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obter(self, chave, query, validade):
+        agora = time.monotonic()
+        with self._lock:
+            registro = self._totais.get(chave)
+            if registro is not None and agora - registro[1] < validade:
+                self._totais.move_to_end(chave)
+                return registro[0]
+
+        total = query.order_by(None).count()
+        with self._lock:
+            self._totais[chave] = (total, agora)
+            self._totais.move_to_end(chave)
+            if len(self._totais) > self.max_entradas:
+                for expirada in [c for c, (_, momento) in self._totais.items() if agora - momento >= validade]:
+                    del self._totais[expirada]
+                while len(self._totais) > self.max_entradas:
+                    self._totais.popitem(last=False)
+        return total
+
+_cache_totais = _CacheTotais()
+
+def paginar_por_cursor(query, ordem, cursor=None, por_pagina=10, chave_total=None):
+    """
+    Pagina uma consulta por cursor (keyset), sem OFFSET
+
+    Cada página é buscada com uma condição sobre as colunas de ordenação a
+    partir da última (ou da primeira) linha da página anterior, então a
+    página 5000 custa o mesmo que a primeira, desde que haja um índice com as
+    colunas de `ordem`. A última coluna deve ser única (normalmente o id).
+
+    O total é opcional: quando `chave_total` é informada, é contado uma vez e
+    reaproveitado por PAGINACAO_TOTAL_TTL segundos para a mesma chave (0
+    desativa a contagem).
+
+    Args:
+        query: Consulta sem ordenação
+        ordem (list): Pares (coluna, decrescente), ex.: [(Palestrante.nome, False), (Palestrante.id, False)]
+        cursor (str): Cursor recebido da página anterior (None para a primeira página)
+        por_pagina (int): Itens por página
+        chave_total (tuple): Identifica a listagem e seus filtros normalizados, ex.:
+            ('palestrantes', busca, especialidades); None para não informar o total
+
+    Returns:
+        PaginaCursor
+    """
+    ordem = list(ordem)
+    posicao = interpretar_cursor(cursor, len(ordem))
+    direcao, valores = posicao if posicao else (DEPOIS, None)
+
+    total = None
+    validade = current_app.config.get('PAGINACAO_TOTAL_TTL', 60)
+    if chave_total is not None and validade:
+        total = _cache_totais.obter(chave_total, query, validade)
+
+    # Rótulos para ler os valores das colunas em cada linha
+    rotulos = [(coluna.label(f'_cursor_{i}'), decrescente) for i, (coluna, decrescente) in enumerate(ordem)]
+    consulta = query.add_columns(*[rotulo for rotulo, _ in rotulos])
+
+    if direcao == ANTES:
+        # Página anterior: percorrer a ordenação ao contrário e inverter o resultado
+        ordem_busca = [(coluna, not decrescente) for coluna, decrescente in ordem]
+    else:
+        ordem_busca = ordem
+    if valores is not None:
+        consulta = consulta.filter(_condicao_apos(ordem_busca, valores))
+    consulta = consulta.order_by(*[coluna.desc() if decrescente else coluna.asc()
+                                   for coluna, decrescente in ordem_busca])
+
+    linhas = consulta.limit(por_pagina + 1).all()
+    mais = len(linhas) > por_pagina
+    linhas = linhas[:por_pagina]
+    if direcao == ANTES:
+        linhas.reverse()
+
+    itens = [linha[0] for linha in linhas]
+    chaves = [[getattr(linha, rotulo.key) for rotulo, _ in rotulos] for linha in linhas]
+
+    proximo = anterior = None
+    if chaves:
+        if direcao == DEPOIS:
+            if mais:
+                proximo = gerar_cursor(chaves[-1], DEPOIS)
+            if valores is not None:
+                anterior = gerar_cursor(chaves[0], ANTES)
+        else:
+            proximo = gerar_cursor(chaves[-1], DEPOIS)
+            if mais:
+                anterior = gerar_cursor(chaves[0], ANTES)
+
+    return PaginaCursor(itens, por_pagina, proximo, anterior, total)
@@ -0,0 +1,450 @@
+import copy
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import event, func
+from sqlalchemy.orm import object_session
+
+from app import db
+from app.models.evento import Evento, palestrante_eventos
+from app.models.normalizacao import normalizar_texto
+from app.models.palestrante import Palestrante, PalavraChave, palestrante_palavras_chave
+
+logger = logging.getLogger(__name__)
+
+# Peso de cada sinal na pontuação final (todos os sinais vão de 0 a 1)
+PESOS_PADRAO = {
+    'palavras_chave': 0.6,  # similaridade de cosseno TF-IDF com as palavras-chave pedidas
+    'avaliacao': 0.15,      # avaliacao_media (0 a 10)
+    'seguidores': 0.1,      # linkedin_seguidores, em escala logarítmica
+    'participacao': 0.05,   # ja_participou
+    'recencia': 0.1,        # data do último evento do palestrante (decaimento exponencial)
+}
+
+# Palavras-chave com mais palavras que isto não são procuradas na descrição
+MAX_PALAVRAS_POR_PALAVRA_CHAVE = 4
+
+class MatrizPalestrantes:
+    """
+    Matriz palestrante × palavra-chave e sinais por palestrante, em arrays NumPy
+
+    A matriz é binária e guardada em formato de coordenadas (pares linha,
+    coluna), o que permite trocar as palavras-chave de um palestrante sem
+    reconstruí-la: as entradas antigas são anuladas (coluna -1) e as novas
+    acrescentadas ao fim; quando as anuladas passam da metade, a matriz é
+    compactada. O IDF e a norma TF-IDF de cada linha são recalculados de forma
+    vetorizada quando a matriz muda.
+    """
+
+    def __init__(self):
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.ativo = np.zeros(0, dtype=bool)
+        self.avaliacao = np.zeros(0, dtype=np.float32)
+        self.seguidores = np.zeros(0, dtype=np.float32)
+        self.participou = np.zeros(0, dtype=np.float32)
+        self.ultimo_evento = np.zeros(0, dtype=np.float64)  # timestamp, NaN se nunca participou
+
+        self.coo_linha = np.zeros(0, dtype=np.int32)
+        self.coo_coluna = np.zeros(0, dtype=np.int32)
+        self.documentos = np.zeros(0, dtype=np.int64)  # palestrantes ativos por coluna
+
+        self.linha_por_id = {}
+        self.coluna_por_palavra_id = {}
+        self.colunas_por_texto = {}
+        self._anuladas = 0
+        self._idf = None
+        self._normas = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def copiar(self):
+        """Cópia independente, para alterar sem afetar quem está lendo esta"""
+        return copy.deepcopy(self)
+
+    def registrar_palavras(self, palavras):
+        """
+        Acrescenta colunas para palavras-chave ainda desconhecidas
+
+        Args:
+            palavras (iterable): Pares (id da palavra-chave, texto normalizado)
+        """
+        novas = 0
+        for palavra_id, texto in palavras:
+            coluna = self.coluna_por_palavra_id.get(palavra_id)
+            if coluna is None:
+                coluna = len(self.coluna_por_palavra_id)
+                self.coluna_por_palavra_id[palavra_id] = coluna
+                novas += 1
+            if texto:
+                self.colunas_por_texto.setdefault(texto, set()).add(coluna)
+        if novas:
+            self.documentos = np.concatenate([self.documentos, np.zeros(novas, dtype=np.int64)])
+
+    def atualizar(self, palestrantes, associacoes, removidos=()):
+        """
+        Insere ou substitui palestrantes na matriz
+
+        Args:
+            palestrantes (list): Tuplas (id, avaliacao_media, linkedin_seguidores,
+                ja_participou, timestamp do último evento ou None)
+            associacoes (list): Pares (id do palestrante, id da palavra-chave) de
+                todos os palestrantes em `palestrantes` (as palavras já registradas)
+            removidos (iterable): Ids de palestrantes excluídos
+        """
+        novos = [p for p in palestrantes if p[0] not in self.linha_por_id]
+        if novos:
+            inicio = len(self.ids)
+            for i, p in enumerate(novos):
+                self.linha_por_id[p[0]] = inicio + i
+            self.ids = np.concatenate([self.ids, np.array([p[0] for p in novos], dtype=np.int64)])
+            self.ativo = np.concatenate([self.ativo, np.zeros(len(novos), dtype=bool)])
+            for nome, tipo in (('avaliacao', np.float32), ('seguidores', np.float32),
+                               ('participou', np.float32), ('ultimo_evento', np.float64)):
+                setattr(self, nome, np.concatenate([getattr(self, nome), np.zeros(len(novos), dtype=tipo)]))
+
+        linhas = np.array([self.linha_por_id[p[0]] for p in palestrantes], dtype=np.int64)
+        if len(linhas):
+            self.ativo[linhas] = True
+            self.avaliacao[linhas] = [min(max((p[1] or 0.0) / 10.0, 0.0), 1.0) for p in palestrantes]
+            self.seguidores[linhas] = np.log1p([max(p[2] or 0, 0) for p in palestrantes])
+            self.participou[linhas] = [1.0 if p[3] else 0.0 for p in palestrantes]
+            self.ultimo_evento[linhas] = [np.nan if p[4] is None else p[4] for p in palestrantes]
+
+        removidas = np.array([self.linha_por_id[i] for i in removidos if i in self.linha_por_id], dtype=np.int64)
+        if len(removidas):
+            self.ativo[removidas] = False
+
+        # Anular as entradas antigas das linhas alteradas ou removidas
+        afetadas = np.concatenate([linhas, removidas])
+        if len(afetadas) and len(self.coo_linha):
+            antigas = np.isin(self.coo_linha, afetadas) & (self.coo_coluna >= 0)
+            if antigas.any():
+                self.documentos -= np.bincount(self.coo_coluna[antigas], minlength=len(self.documentos))
+                self.coo_coluna[antigas] = -1
+                self._anuladas += int(antigas.sum())
+
+        # Acrescentar as entradas atuais
+        pares = {
+            (self.linha_por_id[palestrante_id], self.coluna_por_palavra_id[palavra_id])
+            for palestrante_id, palavra_id in associacoes
+            if palestrante_id in self.linha_por_id and palavra_id in self.coluna_por_palavra_id
+        }
+        if pares:
+            novas_linhas, novas_colunas = (np.array(v, dtype=np.int32) for v in zip(*sorted(pares)))
+            self.coo_linha = np.concatenate([self.coo_linha, novas_linhas])
+            self.coo_coluna = np.concatenate([self.coo_coluna, novas_colunas])
+            self.documentos += np.bincount(novas_colunas, minlength=len(self.documentos))
+
+        if self._anuladas > len(self.coo_coluna) // 2:
+            validas = self.coo_coluna >= 0
+            self.coo_linha = self.coo_linha[validas]
+            self.coo_coluna = self.coo_coluna[validas]
+            self._anuladas = 0
+
+        self._idf = self._normas = None
+
+    def _calcular_pesos(self):
+        """IDF de cada coluna e norma TF-IDF de cada linha (calculados uma vez por alteração)"""
+        if self._idf is None:
+            total = int(self.ativo.sum())
+            self._idf = (np.log((1.0 + total) / (1.0 + self.documentos)) + 1.0).astype(np.float32)
+            validas = self.coo_coluna >= 0
+            quadrados = np.bincount(
+                self.coo_linha[validas], weights=self._idf[self.coo_coluna[validas]] ** 2, minlength=len(self.ids)
+            )
+            self._normas = np.sqrt(quadrados).astype(np.float32)
+        return self._idf, self._normas
+
+    def colunas_da_consulta(self, descricao='', palavras_chave=()):
+        """
+        Colunas das palavras-chave pedidas explicitamente ou citadas na descrição
+        (procuradas por sequências de até MAX_PALAVRAS_POR_PALAVRA_CHAVE palavras)
+        """
+        colunas = set()
+        for palavra in palavras_chave:
+            colunas |= self.colunas_por_texto.get(normalizar_texto(palavra) or '', set())
+
+        termos = re.findall(r'\w+', normalizar_texto(descricao or ''))
+        for tamanho in range(1, MAX_PALAVRAS_POR_PALAVRA_CHAVE + 1):
+            for inicio in range(len(termos) - tamanho + 1):
+                colunas |= self.colunas_por_texto.get(' '.join(termos[inicio:inicio + tamanho]), set())
+        return sorted(colunas)
+
+    def pontuar(self, colunas, pesos, meia_vida_dias, agora=None):
+        """
+        Pontua todos os palestrantes de uma vez
+
+        Returns:
+            dict: Arrays por linha: 'pontuacao' e cada sinal ('palavras_chave',
+                'avaliacao', 'seguidores', 'participacao', 'recencia')
+        """
+        idf, normas = self._calcular_pesos()
+        n = len(self.ids)
+
+        afinidade = np.zeros(n, dtype=np.float32)
+        if colunas:
+            colunas = np.asarray(colunas, dtype=np.int32)
+            consulta = np.zeros(len(idf), dtype=np.float32)
+            consulta[colunas] = idf[colunas] / np.linalg.norm(idf[colunas])
+            entradas = np.isin(self.coo_coluna, colunas)
+            colunas_entradas = self.coo_coluna[entradas]
+            produto = np.bincount(
+                self.coo_linha[entradas], weights=consulta[colunas_entradas] * idf[colunas_entradas], minlength=n
+            )
+            np.divide(produto, normas, out=afinidade, where=normas > 0, casting='unsafe')
+
+        maximo = self.seguidores[self.ativo].max() if self.ativo.any() else 0.0
+        seguidores = self.seguidores / maximo if maximo > 0 else np.zeros(n, dtype=np.float32)
+
+        agora = time.time() if agora is None else agora
+        dias = np.maximum(agora - self.ultimo_evento, 0) / 86400.0
+        recencia = np.nan_to_num(np.exp2(-dias / meia_vida_dias), nan=0.0).astype(np.float32)
+
+        sinais = {
+            'palavras_chave': afinidade,
+            'avaliacao': self.avaliacao,
+            'seguidores': seguidores,
+            'participacao': self.participou,
+            'recencia': recencia,
+        }
+        pontuacao = np.zeros(n, dtype=np.float32)
+        for nome, valores in sinais.items():
+            pontuacao += np.float32(pesos.get(nome, 0.0)) * valores
+        sinais['pontuacao'] = pontuacao
+        return sinais
+
+    def melhores(self, pontuacao, candidatos, k):
+        """Linhas dos `k` candidatos de maior pontuação, em ordem decrescente"""
+        linhas = np.flatnonzero(candidatos)
+        if len(linhas) > k:
+            linhas = linhas[np.argpartition(-pontuacao[linhas], k - 1)[:k]]
+        return linhas[np.argsort(-pontuacao[linhas], kind='stable')]
+
+class MotorRecomendacao:
+    """
+    Recomenda palestrantes para um evento a partir da descrição e/ou de palavras-chave
+
+    A matriz (ver MatrizPalestrantes) é carregada na primeira recomendação e
+    mantida em memória. Palestrantes gravados por esta aplicação (e os
+    palestrantes dos eventos gravados) são anotados pelos eventos do
+    SQLAlchemy e recarregados na recomendação seguinte ao commit, com poucas
+    consultas. A matriz é recarregada por inteiro a cada
+    RECOMENDACAO_RECARGA segundos, o que também traz as alterações feitas por
+    outros processos e as exclusões de eventos.
+
+    Uma matriz publicada nunca é alterada: recargas e atualizações montam uma
+    nova (ou uma cópia) fora do lock, uma thread por vez, e só a troca da
+    referência é feita sob o lock. Enquanto isso as recomendações seguem com
+    a matriz anterior.
+    """
+
+    def __init__(self, app=None):
+        self.pesos = dict(PESOS_PADRAO)
+        self.recarga = 3600
+        self.meia_vida_dias = 365
+
+        self._matriz = None
+        self._carregada_em = 0.0
+        self._palestrantes_pendentes = set()
+        self._eventos_pendentes = set()
+        self._geracao = 0
+        self._lock = threading.Lock()
+        self._lock_montagem = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.pesos = dict(PESOS_PADRAO, **app.config.get('RECOMENDACAO_PESOS', {}))
+        self.recarga = app.config.get('RECOMENDACAO_RECARGA', self.recarga)
+        self.meia_vida_dias = app.config.get('RECOMENDACAO_MEIA_VIDA_DIAS', self.meia_vida_dias)
+        app.extensions['motor_recomendacao'] = self
+
+        if not event.contains(Palestrante, 'after_insert', _marcar_palestrante):
+            for nome_evento in ('after_insert', 'after_update', 'after_delete'):
+                event.listen(Palestrante, nome_evento, _marcar_palestrante)
+                event.listen(Evento, nome_evento, _marcar_evento)
+            event.listen(db.session, 'after_commit', self._receber_alteracoes)
+            event.listen(db.session, 'after_rollback', _descartar_alteracoes)
+
+    def _receber_alteracoes(self, session):
+        """Passa para a fila de recarga o que foi gravado na transação confirmada"""
+        palestrantes = session.info.pop('recomendacao_palestrantes', set())
+        eventos = session.info.pop('recomendacao_eventos', set())
+        if palestrantes or eventos:
+            with self._lock:
+                self._palestrantes_pendentes |= palestrantes
+                self._eventos_pendentes |= eventos
+
+    def _consultar_palestrantes(self, ids=None):
+        """Linhas de palestrantes e associações no formato de MatrizPalestrantes.atualizar"""
+        ultimo_evento = db.session.query(
+            palestrante_eventos.c.palestrante_id, func.max(Evento.data_inicio)
+        ).join(Evento, Evento.id == palestrante_eventos.c.evento_id).group_by(palestrante_eventos.c.palestrante_id)
+        palestrantes = db.session.query(
+            Palestrante.id, Palestrante.avaliacao_media, Palestrante.linkedin_seguidores, Palestrante.ja_participou
+        )
+        associacoes = db.session.query(
+            palestrante_palavras_chave.c.palestrante_id, palestrante_palavras_chave.c.palavra_chave_id
+        )
+        if ids is not None:
+            ultimo_evento = ultimo_evento.filter(palestrante_eventos.c.palestrante_id.in_(ids))
+            palestrantes = palestrantes.filter(Palestrante.id.in_(ids))
+            associacoes = associacoes.filter(palestrante_palavras_chave.c.palestrante_id.in_(ids))
+
+        # Datas gravadas em UTC sem fuso (datetime.utcnow)
+        epoca = datetime(1970, 1, 1)
+        datas = {palestrante_id: (data - epoca).total_seconds() for palestrante_id, data in ultimo_evento if data}
+        return (
+            [(p.id, p.avaliacao_media, p.linkedin_seguidores, p.ja_participou, datas.get(p.id))
+             for p in palestrantes],
+            associacoes.all()
+        )
+
+    def _carregar(self):
+        """Monta a matriz completa a partir do banco"""
+        inicio = time.perf_counter()
+        matriz = MatrizPalestrantes()
+        matriz.registrar_palavras(db.session.query(PalavraChave.id, PalavraChave.palavra_normalizada))
+        palestrantes, associacoes = self._consultar_palestrantes()
+        matriz.atualizar(palestrantes, associacoes)
+        logger.info(
+            f"Matriz de recomendação carregada: {len(palestrantes)} palestrantes, "
+            f"{len(associacoes)} associações em {time.perf_counter() - inicio:.2f} s"
+        )
+        return matriz
+
+    def _atualizar_pendentes(self, matriz, palestrantes, eventos):
+        """Recarrega na matriz só os palestrantes alterados (e os dos eventos alterados)"""
+        ids = set(palestrantes)
+        if eventos:
+            ids |= {
+                palestrante_id for (palestrante_id,) in db.session.query(palestrante_eventos.c.palestrante_id).filter(
+                    palestrante_eventos.c.evento_id.in_(eventos)
+                )
+            }
+        if not ids:
+            return
+
+        linhas, associacoes = self._consultar_palestrantes(ids)
+        desconhecidas = {palavra_id for _, palavra_id in associacoes} - set(matriz.coluna_por_palavra_id)
+        if desconhecidas:
+            matriz.registrar_palavras(db.session.query(PalavraChave.id, PalavraChave.palavra_normalizada).filter(
+                PalavraChave.id.in_(desconhecidas)
+            ))
+        encontrados = {linha[0] for linha in linhas}
+        matriz.atualizar(linhas, associacoes, removidos=ids - encontrados)
+
+    def _matriz_atual(self):
+        """Matriz em dia com as gravações confirmadas (recarregada se estiver velha)"""
+        with self._lock:
+            matriz = self._matriz
+            velha = matriz is None or time.monotonic() - self._carregada_em >= self.recarga
+            if not (velha or self._palestrantes_pendentes or self._eventos_pendentes):
+                return matriz
+
+        # Uma montagem por vez; quem já tem uma matriz segue com ela em vez de esperar
+        if not self._lock_montagem.acquire(blocking=matriz is None):
+            return matriz
+        try:
+            with self._lock:
+                palestrantes, self._palestrantes_pendentes = self._palestrantes_pendentes, set()
+                eventos, self._eventos_pendentes = self._eventos_pendentes, set()
+                matriz, geracao = self._matriz, self._geracao
+                velha = matriz is None or time.monotonic() - self._carregada_em >= self.recarga
+            if not (velha or palestrantes or eventos):
+                return matriz
+
+            try:
+                if velha:
+                    nova = self._carregar()
+                else:
+                    nova = matriz.copiar()
+                    self._atualizar_pendentes(nova, palestrantes, eventos)
+                nova._calcular_pesos()
+            except Exception:
+                # Devolver as pendências para a próxima tentativa
+                with self._lock:
+                    self._palestrantes_pendentes |= palestrantes
+                    self._eventos_pendentes |= eventos
+                raise
+
+            with self._lock:
+                # Uma invalidação durante a montagem vale mais que esta matriz
+                if geracao == self._geracao:
+                    self._matriz = nova
+                    if velha:
+                        self._carregada_em = time.monotonic()
+            return nova
+        finally:
+            self._lock_montagem.release()
+
+    def invalidar(self):
+        """Força a recarga completa da matriz na próxima recomendação (após gravações feitas sem o ORM)"""
+        with self._lock:
+            self._matriz = None
+            self._geracao += 1
+
+    def recomendar(self, descricao='', palavras_chave=(), k=10, excluir=()):
+        """
+        Palestrantes mais indicados para um evento
+
+        Args:
+            descricao (str): Descrição do evento; palavras-chave citadas nela são usadas
+            palavras_chave (list): Palavras-chave pedidas explicitamente
+            k (int): Quantidade de recomendações
+            excluir (list): Ids de palestrantes a deixar de fora (ex.: já selecionados)
+
+        Returns:
+            dict: 'palavras_chave' (palavras reconhecidas) e 'recomendacoes', lista
+                de dicionários com palestrante_id, pontuacao e o valor de cada sinal.
+                Quando alguma palavra-chave é reconhecida, só entram palestrantes
+                que tenham pelo menos uma delas.
+        """
+        matriz = self._matriz_atual()
+        colunas = matriz.colunas_da_consulta(descricao, palavras_chave)
+        sinais = matriz.pontuar(colunas, self.pesos, self.meia_vida_dias)
+
+        candidatos = matriz.ativo.copy()
+        if colunas:
+            candidatos &= sinais['palavras_chave'] > 0
+        excluidas = [matriz.linha_por_id[i] for i in excluir if i in matriz.linha_por_id]
+        candidatos[excluidas] = False
+
+        linhas = matriz.melhores(sinais['pontuacao'], candidatos, max(k, 1))
+        palavras_por_coluna = {c: t for t, cs in matriz.colunas_por_texto.items() for c in cs if c in colunas}
+
+        return {
+            'palavras_chave': sorted(set(palavras_por_coluna.values())),
+            'recomendacoes': [
+                dict(
+                    {nome: round(float(valores[linha]), 4) for nome, valores in sinais.items()},
+                    palestrante_id=int(matriz.ids[linha])
+                )
+                for linha in linhas
+            ],
+        }
+
+def _marcar_palestrante(mapper, conexao, palestrante):
+    """Anota o palestrante gravado para ser recarregado na matriz após o commit"""
+    session = object_session(palestrante)
+    if session is not None:
+        session.info.setdefault('recomendacao_palestrantes', set()).add(palestrante.id)
+
+def _marcar_evento(mapper, conexao, evento):
+    """Anota o evento gravado: os palestrantes dele são recarregados após o commit"""
+    session = object_session(evento)
+    if session is not None:
+        session.info.setdefault('recomendacao_eventos', set()).add(evento.id)
+
+def _descartar_alteracoes(session):
+    """Esquece as anotações de uma transação desfeita"""
+    session.info.pop('recomendacao_palestrantes', None)
+    session.info.pop('recomendacao_eventos', None)
+
+# Instância única compartilhada pela aplicação
+motor_recomendacao = MotorRecomendacao()
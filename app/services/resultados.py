@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from app.models.tarefa import TarefaLinkedIn
+
+def formatar_id_resultado(busca_id, indice):
+    """Identificador de um perfil nos resultados de uma busca: '<id da busca>-<índice>'"""
+    return f'{busca_id}-{indice}'
+
+def interpretar_id_resultado(id_resultado):
+    """
+    Returns:
+        tuple: (id da busca, índice), ou None se o identificador for inválido
+    """
+    busca_id, _, indice = (id_resultado or '').rpartition('-')
+    if not busca_id or not indice.isdigit():
+        return None
+    return busca_id, int(indice)
+
+def _validade():
+    return timedelta(seconds=current_app.config.get('LINKEDIN_RESULTADOS_TTL', 24 * 3600))
+
+def obter_resultados(ids_resultados, usuario_id=None):
+    """
+    Recupera perfis guardados nos resultados das buscas, sem reenviá-los pelo navegador
+
+    As buscas são carregadas com uma única consulta; as que ainda estão em
+    andamento neste processo têm os perfis lidos da memória. Resultados
+    expirados, de buscas de outro usuário ou com identificador inválido são ignorados.
+
+    Args:
+        ids_resultados (list): Identificadores (ver formatar_id_resultado)
+        usuario_id (int): Usuário que está importando (opcional)
+
+    Returns:
+        dict: Perfil de cada identificador encontrado, na ordem pedida
+    """
+    pedidos = {}
+    for id_resultado in ids_resultados:
+        partes = interpretar_id_resultado(id_resultado)
+        if partes is not None:
+            pedidos[id_resultado] = partes
+    if not pedidos:
+        return {}
+
+    corte = datetime.utcnow() - _validade()
+    query = TarefaLinkedIn.query.filter(
+        TarefaLinkedIn.id.in_({busca_id for busca_id, _ in pedidos.values()}),
+        TarefaLinkedIn.tipo == TarefaLinkedIn.TIPO_BUSCA,
+        TarefaLinkedIn.data_criacao >= corte
+    )
+    if usuario_id is not None:
+        query = query.filter(TarefaLinkedIn.usuario_id == usuario_id)
+
+    from app.services.tarefas import executor_tarefas
+
+    resultados_por_busca = {}
+    for tarefa in query:
+        # Busca em andamento: os perfis só são gravados no banco ao final
+        transmissao = None if tarefa.finalizada else executor_tarefas.transmissao(tarefa.id)
+        resultados_por_busca[tarefa.id] = list(transmissao.perfis) if transmissao is not None else tarefa.get_resultados()
+
+    encontrados = {}
+    for id_resultado, (busca_id, indice) in pedidos.items():
+        resultados = resultados_por_busca.get(busca_id)
+        if resultados is not None and indice < len(resultados):
+            encontrados[id_resultado] = resultados[indice]
+    return encontrados
+
+def expirar_resultados():
+    """
+    Descarta os resultados das buscas mais antigas que LINKEDIN_RESULTADOS_TTL
+    (a tarefa continua registrada, só sem os perfis). Não realiza commit.
+
+    Returns:
+        int: Número de buscas cujos resultados foram descartados
+    """
+    corte = datetime.utcnow() - _validade()
+    return TarefaLinkedIn.query.filter(
+        TarefaLinkedIn.tipo == TarefaLinkedIn.TIPO_BUSCA,
+        TarefaLinkedIn.data_criacao < corte,
+        TarefaLinkedIn.resultados.isnot(None)
+    ).update({'resultados': None}, synchronize_session=False)
@@ -0,0 +1,76 @@
+/*
+ * Extração dos dados de um perfil do LinkedIn em uma única chamada.
+ *
+ * Recebe a descrição dos campos (LinkedInCrawler.SELETORES_PERFIL) e tenta,
+ * para cada campo, os seletores na ordem informada até encontrar um valor.
+ * Não depende do Selenium: pode ser executado sobre um HTML salvo (jsdom,
+ * navegador etc.) chamando extrairPerfil(document, campos).
+ *
+ * Retorna {dados: {campo: valor}, seletores: {campo: índice do seletor usado ou -1},
+ * tempos: {campo: milissegundos gastos na extração do campo}}.
+ */
+function extrairPerfil(raiz, campos) {
+    function texto(elemento) {
+        var valor = elemento.innerText !== undefined ? elemento.innerText : elemento.textContent;
+        return (valor || '').trim();
+    }
+
+    function extrairCampo(campo) {
+        for (var i = 0; i < campo.seletores.length; i++) {
+            var valor = null;
+            var elementos;
+
+            try {
+                if (campo.tipo === 'lista') {
+                    elementos = raiz.querySelectorAll(campo.seletores[i]);
+                    valor = [];
+                    for (var j = 0; j < elementos.length; j++) {
+                        var item = texto(elementos[j]);
+                        if (item) {
+                            valor.push(item);
+                        }
+                    }
+                    if (!valor.length) {
+                        valor = null;
+                    }
+                } else if (campo.tipo === 'indice') {
+                    elementos = raiz.querySelectorAll(campo.seletores[i]);
+                    if (elementos.length > campo.indice) {
+                        valor = texto(elementos[campo.indice]);
+                    }
+                } else {
+                    var elemento = raiz.querySelector(campo.seletores[i]);
+                    if (elemento) {
+                        valor = campo.tipo === 'atributo'
+                            ? (elemento.getAttribute(campo.atributo) || '')
+                            : texto(elemento);
+                    }
+                }
+            } catch (e) {
+                // Seletor inválido: tentar o próximo
+                valor = null;
+            }
+
+            if (valor) {
+                return {valor: valor, indice: i};
+            }
+        }
+        return {valor: null, indice: -1};
+    }
+
+    function agora() {
+        return typeof performance !== 'undefined' ? performance.now() : Date.now();
+    }
+
+    var resultado = {dados: {}, seletores: {}, tempos: {}};
+    for (var nome in campos) {
+        if (Object.prototype.hasOwnProperty.call(campos, nome)) {
+            var inicio = agora();
+            var extraido = extrairCampo(campos[nome]);
+            resultado.dados[nome] = extraido.valor;
+            resultado.seletores[nome] = extraido.indice;
+            resultado.tempos[nome] = agora() - inicio;
+        }
+    }
+    return resultado;
+}
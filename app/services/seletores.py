@@ -0,0 +1,175 @@
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class RegistroSeletores:
+    """
+    Acompanha, por página e campo, quais seletores de extração acertam.
+
+    Para cada seletor guarda a taxa de acerto recente (média móvel
+    exponencial) e, para cada campo, a taxa de acerto, uma taxa de referência
+    (média bem mais lenta) e o tempo médio de extração. `ordenar` devolve os
+    campos com os seletores reordenados para que o que está funcionando seja
+    tentado primeiro. Quando a taxa recente de um campo cai abaixo de
+    `limiar_alerta` vezes a de referência (campos que costumam ser
+    encontrados e deixaram de ser), o campo é sinalizado e um aviso é
+    registrado no log.
+
+    As estatísticas são gravadas periodicamente em um arquivo JSON, para
+    sobreviverem a reinícios da aplicação.
+    """
+
+    def __init__(self, app=None):
+        self.caminho = None
+        self.peso = 0.05
+        self.limiar_alerta = 0.5
+        self.min_amostras = 20
+        self.intervalo_gravacao = 60
+
+        self._paginas = {}
+        self._gravado_em = 0.0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.caminho = app.config.get('LINKEDIN_SELETORES_PATH')
+        self.peso = app.config.get('LINKEDIN_SELETORES_PESO', self.peso)
+        self.limiar_alerta = app.config.get('LINKEDIN_SELETORES_LIMIAR_ALERTA', self.limiar_alerta)
+        self.min_amostras = app.config.get('LINKEDIN_SELETORES_MIN_AMOSTRAS', self.min_amostras)
+        app.extensions['registro_seletores'] = self
+        self._carregar()
+
+    def _carregar(self):
+        if not self.caminho or not os.path.exists(self.caminho):
+            return
+        try:
+            with open(self.caminho, encoding='utf-8') as f:
+                self._paginas = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Não foi possível ler as estatísticas de seletores: {e}")
+
+    def _gravar(self):
+        """Grava as estatísticas no arquivo (chamado com o lock adquirido)"""
+        if not self.caminho:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+            temporario = f'{self.caminho}.{os.getpid()}.tmp'
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(self._paginas, f, ensure_ascii=False)
+            os.replace(temporario, self.caminho)
+            self._gravado_em = time.monotonic()
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar as estatísticas de seletores: {e}")
+
+    def _media(self, atual, valor, peso=None):
+        return valor if atual is None else atual + (peso or self.peso) * (valor - atual)
+
+    def ordenar(self, pagina, campos):
+        """
+        Retorna uma cópia de `campos` com os seletores de cada campo ordenados
+        pela taxa de acerto recente (seletores sem histórico mantêm a posição original)
+
+        Args:
+            pagina (str): Nome da página ('perfil', 'card'...)
+            campos (dict): Descrição dos campos (ver SELETORES_PERFIL)
+        """
+        with self._lock:
+            estatisticas = self._paginas.get(pagina, {})
+            ordenados = {}
+            for nome, campo in campos.items():
+                taxas = estatisticas.get(nome, {}).get('seletores', {})
+                seletores = sorted(
+                    campo['seletores'],
+                    key=lambda s: -taxas[s]['taxa'] if s in taxas else -1.0
+                )
+                ordenados[nome] = dict(campo, seletores=seletores)
+            return ordenados
+
+    def registrar(self, pagina, campos, seletores_usados, tempos=None):
+        """
+        Registra o resultado de uma extração
+
+        Args:
+            pagina (str): Nome da página
+            campos (dict): Campos na ordem em que foram tentados (retorno de `ordenar`)
+            seletores_usados (dict): Índice do seletor que acertou em cada campo, ou -1
+            tempos (dict): Milissegundos gastos em cada campo (opcional)
+        """
+        tempos = tempos or {}
+        alertas = []
+
+        with self._lock:
+            estatisticas = self._paginas.setdefault(pagina, {})
+            for nome, campo in campos.items():
+                indice = seletores_usados.get(nome, -1)
+                if indice is None:
+                    indice = -1
+
+                registro = estatisticas.setdefault(nome, {
+                    'amostras': 0, 'taxa': None, 'taxa_referencia': None, 'tempo_ms': None,
+                    'alerta': False, 'seletores': {}
+                })
+                acerto = 1.0 if indice >= 0 else 0.0
+                registro['amostras'] += 1
+                registro['taxa'] = self._media(registro['taxa'], acerto)
+                registro['taxa_referencia'] = self._media(registro['taxa_referencia'], acerto, self.peso / 10)
+                if nome in tempos:
+                    registro['tempo_ms'] = self._media(registro['tempo_ms'], float(tempos[nome]))
+
+                # Seletores tentados antes do que acertou (ou todos, se nenhum acertou) erraram
+                tentados = campo['seletores'] if indice < 0 else campo['seletores'][:indice + 1]
+                for i, seletor in enumerate(tentados):
+                    por_seletor = registro['seletores'].setdefault(seletor, {'tentativas': 0, 'taxa': None})
+                    por_seletor['tentativas'] += 1
+                    por_seletor['taxa'] = self._media(por_seletor['taxa'], 1.0 if i == indice else 0.0)
+
+                # Sinalizar campos cuja taxa de acerto desabou
+                em_alerta = (
+                    registro['amostras'] >= self.min_amostras
+                    and registro['taxa'] < self.limiar_alerta * registro['taxa_referencia']
+                )
+                if em_alerta and not registro['alerta']:
+                    alertas.append((nome, registro['taxa']))
+                registro['alerta'] = em_alerta
+
+            if time.monotonic() - self._gravado_em >= self.intervalo_gravacao:
+                self._gravar()
+
+        for nome, taxa in alertas:
+            logger.warning(
+                f"Seletores do campo '{nome}' ({pagina}) com taxa de acerto de {taxa:.0%}: "
+                f"o layout do LinkedIn pode ter mudado"
+            )
+
+    def alertas(self):
+        """
+        Returns:
+            list: Pares (página, campo) com a taxa de acerto abaixo do limiar
+        """
+        with self._lock:
+            return [
+                (pagina, nome)
+                for pagina, campos in self._paginas.items()
+                for nome, registro in campos.items()
+                if registro.get('alerta')
+            ]
+
+    def estatisticas(self):
+        """Taxas de acerto e tempos por página, campo e seletor, mais os alertas"""
+        with self._lock:
+            paginas = json.loads(json.dumps(self._paginas))
+        return {'paginas': paginas, 'alertas': [f'{p}.{c}' for p, c in self.alertas()]}
+
+    def gravar(self):
+        """Força a gravação das estatísticas no arquivo"""
+        with self._lock:
+            self._gravar()
+
+# Instância única compartilhada pela aplicação
+registro_seletores = RegistroSeletores()
@@ -0,0 +1,94 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from app.config import SECRET_KEY_PADRAO
+
+logger = logging.getLogger(__name__)
+
+class ArmazemCookies:
+    """
+    Guarda os cookies de uma sessão autenticada do LinkedIn em um arquivo criptografado.
+
+    O conteúdo é cifrado com Fernet, usando uma chave derivada da chave
+    secreta da aplicação, e fica associado ao usuário do LinkedIn que fez o
+    login: cookies de outra conta nunca são restaurados.
+    """
+
+    def __init__(self, caminho, chave_secreta):
+        self.caminho = caminho
+        chave = hashlib.sha256(f'linkedin-cookies:{chave_secreta}'.encode('utf-8')).digest()
+        self._fernet = Fernet(base64.urlsafe_b64encode(chave))
+
+    def salvar(self, username, cookies):
+        """Grava os cookies do usuário de forma atômica e legível apenas pelo dono do arquivo"""
+        conteudo = json.dumps({
+            'username': username,
+            'salvo_em': time.time(),
+            'cookies': cookies
+        }).encode('utf-8')
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+        temporario = f'{self.caminho}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temporario, 'wb') as f:
+            f.write(self._fernet.encrypt(conteudo))
+        os.chmod(temporario, 0o600)
+        os.replace(temporario, self.caminho)
+
+    def carregar(self, username):
+        """
+        Returns:
+            list: Cookies salvos para o usuário, ou None se não houver cookies válidos
+        """
+        if not os.path.exists(self.caminho):
+            return None
+
+        try:
+            with open(self.caminho, 'rb') as f:
+                dados = json.loads(self._fernet.decrypt(f.read()))
+        except (InvalidToken, ValueError, OSError) as e:
+            logger.warning(f"Não foi possível ler os cookies salvos do LinkedIn: {e}")
+            return None
+
+        if dados.get('username') != username:
+            return None
+
+        # Descartar cookies já expirados
+        agora = time.time()
+        return [c for c in dados.get('cookies', []) if not c.get('expiry') or c['expiry'] > agora] or None
+
+    def apagar(self):
+        """Remove o arquivo de cookies (ex.: quando a sessão deixou de ser válida)"""
+        try:
+            os.remove(self.caminho)
+        except FileNotFoundError:
+            pass
+
+def criar_armazem_cookies(config):
+    """
+    Cria o armazém de cookies configurado em LINKEDIN_COOKIES_PATH
+
+    A chave vem de LINKEDIN_COOKIES_CHAVE ou, na falta dela, de SECRET_KEY. Se
+    nenhuma das duas tiver sido definida (SECRET_KEY com o valor padrão, que é
+    público), os cookies não são salvos nem carregados.
+
+    Returns:
+        ArmazemCookies: Armazém, ou None se a persistência estiver desativada
+    """
+    caminho = config.get('LINKEDIN_COOKIES_PATH')
+    if not caminho:
+        return None
+
+    chave = config.get('LINKEDIN_COOKIES_CHAVE') or config.get('SECRET_KEY')
+    if not chave or chave == SECRET_KEY_PADRAO:
+        logger.warning(
+            "Cookies do LinkedIn não serão salvos: defina LINKEDIN_COOKIES_CHAVE ou uma SECRET_KEY própria"
+        )
+        return None
+    return ArmazemCookies(caminho, chave)
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from app import db
+from app.models.palestrante import PalavraChave
+from app.models.normalizacao import normalizar_texto
+from app.services.canonicalizacao import resolver_palavras_chave
+from app.services.fotos import acervo_fotos
+
+def aplicar_info_linkedin(palestrante, info):
+    """
+    Atualiza um palestrante com os dados obtidos do LinkedIn.
+    Não realiza commit; isso fica a cargo de quem chama.
+
+    Args:
+        palestrante (Palestrante): Palestrante a ser atualizado
+        info (dict): Dicionário retornado por LinkedInCrawler.obter_info_perfil
+    """
+    # Atualizar dados do palestrante
+    if info.get('nome'):
+        palestrante.nome = info['nome']
+    if info.get('cargo_atual'):
+        palestrante.linkedin_cargo_atual = info['cargo_atual']
+    if info.get('empresa_atual'):
+        palestrante.linkedin_empresa_atual = info['empresa_atual']
+    if info.get('bio'):
+        palestrante.bio = info['bio']
+    if info.get('foto_url'):
+        # Guardar uma cópia local: as URLs do CDN do LinkedIn expiram
+        palestrante.foto_url = acervo_fotos.espelhar(info['foto_url'])
+    if info.get('seguidores'):
+        palestrante.linkedin_seguidores = info['seguidores']
+
+    # Atualizar habilidades como palavras-chave
+    if info.get('habilidades'):
+        habilidades = [hab.strip() for hab in info['habilidades'] if hab and hab.strip()]
+        # Palavras-chave existentes (pela forma normalizada ou por alias) de uma vez
+        palavras = resolver_palavras_chave(habilidades)
+        for hab in habilidades:
+            chave = normalizar_texto(hab)
+            palavra = palavras.get(chave)
+            if palavra is None:
+                palavra = palavras[chave] = PalavraChave(palavra=hab)
+                db.session.add(palavra)
+
+            # Adicionar ao palestrante se ainda não tiver
+            if palavra not in palestrante.palavras_chave:
+                palestrante.palavras_chave.append(palavra)
+
+    # Atualizar timestamp e zerar as falhas de atualização
+    palestrante.linkedin_ultima_atualizacao = datetime.utcnow()
+    palestrante.linkedin_falhas = 0
+    palestrante.linkedin_proxima_tentativa = None
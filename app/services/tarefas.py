@@ -0,0 +1,315 @@
+import atexit
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+from app.models.tarefa import TarefaLinkedIn
+from app.models.palestrante import Palestrante
+from app.services.crawler_pool import crawler_pool
+from app.services.resultados import formatar_id_resultado, expirar_resultados
+from app.services.sincronizacao import aplicar_info_linkedin
+
+logger = logging.getLogger(__name__)
+
+class Transmissao:
+    """
+    Perfis e progresso de uma tarefa em andamento, mantidos em memória para a
+    transmissão à página (SSE): quem acompanha espera por novidades sem
+    consultar o banco
+    """
+
+    def __init__(self):
+        self.perfis = []
+        self.progresso = (0, 0)
+        self.finalizada = False
+        self._versao = 0
+        self._condicao = threading.Condition()
+
+    def publicar(self, perfil=None, progresso=None, finalizada=False):
+        """Registra um perfil extraído, o progresso ou o fim da tarefa e acorda quem espera"""
+        with self._condicao:
+            if perfil is not None:
+                self.perfis.append(perfil)
+            if progresso is not None:
+                self.progresso = progresso
+            if finalizada:
+                self.finalizada = True
+            self._versao += 1
+            self._condicao.notify_all()
+
+    def aguardar(self, versao, enviados, timeout):
+        """
+        Espera até haver novidades em relação a `versao` (ou até `timeout` segundos)
+
+        Args:
+            versao (int): Versão devolvida pela chamada anterior (-1 na primeira)
+            enviados (int): Perfis já enviados
+            timeout (float): Espera máxima, em segundos
+
+        Returns:
+            tuple: (versão atual, perfis novos a partir de `enviados`, progresso, finalizada)
+        """
+        with self._condicao:
+            self._condicao.wait_for(lambda: self._versao != versao, timeout)
+            return self._versao, self.perfis[enviados:], self.progresso, self.finalizada
+
+class ExecutorTarefas:
+    """
+    Executa buscas e atualizações do LinkedIn fora da thread da requisição.
+
+    O estado de cada tarefa fica registrado no banco (TarefaLinkedIn), de
+    modo que a página pode consultar o progresso e exibir os resultados já
+    armazenados sem precisar refazer o crawler. Enquanto a tarefa executa, os
+    perfis extraídos ficam em memória (Transmissao) e só são gravados no banco
+    ao final.
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._executor = None
+        # Sinais de cancelamento e transmissões das tarefas em andamento, por id
+        self._cancelamentos = {}
+        self._transmissoes = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Cria o executor com o número de threads configurado"""
+        self.app = app
+        self._executor = ThreadPoolExecutor(
+            max_workers=app.config.get('LINKEDIN_TAREFAS_WORKERS', 2),
+            thread_name_prefix='tarefas-linkedin'
+        )
+        app.extensions['executor_tarefas'] = self
+        atexit.register(self._executor.shutdown, wait=False)
+        if app.config.get('LINKEDIN_TAREFAS_RECUPERAR', True):
+            self._encerrar_orfas()
+
+    def _encerrar_orfas(self):
+        """
+        Marca como erro as tarefas que estavam pendentes ou em execução quando
+        a aplicação parou: nenhuma thread vai concluí-las, e a página ficaria
+        aguardando indefinidamente
+
+        Returns:
+            int: Quantidade de tarefas encerradas
+        """
+        with self.app.app_context():
+            try:
+                encerradas = TarefaLinkedIn.query.filter(
+                    TarefaLinkedIn.status.in_([TarefaLinkedIn.STATUS_PENDENTE, TarefaLinkedIn.STATUS_EXECUTANDO])
+                ).update({
+                    'status': TarefaLinkedIn.STATUS_ERRO,
+                    'erro': 'Tarefa interrompida pela reinicialização da aplicação.',
+                    'data_conclusao': datetime.utcnow()
+                }, synchronize_session=False)
+                db.session.commit()
+            except SQLAlchemyError as e:
+                # Banco ainda sem as tabelas (antes de `flask db upgrade`)
+                db.session.rollback()
+                logger.debug(f"Tarefas órfãs não verificadas: {e}")
+                return 0
+            finally:
+                db.session.remove()
+
+        if encerradas:
+            logger.warning(f"{encerradas} tarefa(s) do LinkedIn interrompida(s) pela reinicialização marcada(s) como erro")
+        return encerradas
+
+    def enviar_busca(self, parametros, usuario_id=None):
+        """
+        Registra e agenda uma busca de profissionais no LinkedIn
+
+        Args:
+            parametros (dict): Argumentos para LinkedInCrawler.buscar_profissionais
+            usuario_id (int): Usuário que solicitou a busca
+
+        Returns:
+            TarefaLinkedIn: Tarefa criada
+        """
+        tarefa = TarefaLinkedIn(tipo=TarefaLinkedIn.TIPO_BUSCA, usuario_id=usuario_id)
+        tarefa.set_parametros(parametros)
+        return self._enviar(tarefa)
+
+    def enviar_atualizacao(self, palestrante_id, usuario_id=None):
+        """
+        Registra e agenda a atualização de um palestrante a partir do LinkedIn
+
+        Returns:
+            TarefaLinkedIn: Tarefa criada
+        """
+        tarefa = TarefaLinkedIn(
+            tipo=TarefaLinkedIn.TIPO_ATUALIZACAO,
+            palestrante_id=palestrante_id,
+            usuario_id=usuario_id
+        )
+        return self._enviar(tarefa)
+
+    def cancelar(self, tarefa_id):
+        """
+        Interrompe uma tarefa pendente ou em andamento
+
+        Uma busca em andamento para de visitar perfis novos, mantém os
+        resultados já obtidos e devolve as sessões do navegador ao pool.
+
+        Returns:
+            bool: True se a tarefa ainda não havia terminado
+        """
+        tarefa = TarefaLinkedIn.query.get(tarefa_id)
+        if tarefa is None or tarefa.finalizada:
+            return False
+
+        with self._lock:
+            evento = self._cancelamentos.setdefault(tarefa_id, threading.Event())
+        evento.set()
+
+        if tarefa.status == TarefaLinkedIn.STATUS_PENDENTE:
+            tarefa.status = TarefaLinkedIn.STATUS_CANCELADA
+            tarefa.data_conclusao = datetime.utcnow()
+            db.session.commit()
+            self._finalizar(tarefa_id)
+        return True
+
+    def transmissao(self, tarefa_id):
+        """
+        Returns:
+            Transmissao: Perfis e progresso da tarefa em andamento neste processo,
+                ou None se ela já terminou (o estado final está no banco)
+        """
+        with self._lock:
+            return self._transmissoes.get(tarefa_id)
+
+    def _enviar(self, tarefa):
+        db.session.add(tarefa)
+        # Aproveitar o commit para descartar resultados de buscas antigas
+        expirar_resultados()
+        db.session.commit()
+        with self._lock:
+            self._cancelamentos[tarefa.id] = threading.Event()
+            self._transmissoes[tarefa.id] = Transmissao()
+        self._executor.submit(self._executar, tarefa.id)
+        return tarefa
+
+    def _executar(self, tarefa_id):
+        """Executa a tarefa em uma thread do executor"""
+        with self.app.app_context():
+            tarefa = TarefaLinkedIn.query.get(tarefa_id)
+            with self._lock:
+                cancelar = self._cancelamentos.setdefault(tarefa_id, threading.Event())
+            if tarefa is None or cancelar.is_set():
+                self._finalizar(tarefa_id)
+                return
+
+            tarefa.status = TarefaLinkedIn.STATUS_EXECUTANDO
+            tarefa.data_inicio = datetime.utcnow()
+            db.session.commit()
+
+            try:
+                if tarefa.tipo == TarefaLinkedIn.TIPO_BUSCA:
+                    self._executar_busca(tarefa, cancelar)
+                else:
+                    self._executar_atualizacao(tarefa)
+
+                if cancelar.is_set():
+                    tarefa.status = TarefaLinkedIn.STATUS_CANCELADA
+                else:
+                    tarefa.status = TarefaLinkedIn.STATUS_CONCLUIDA
+            except Exception as e:
+                logger.error(f"Erro na tarefa {tarefa_id}: {e}")
+                db.session.rollback()
+                tarefa = TarefaLinkedIn.query.get(tarefa_id)
+                tarefa.status = TarefaLinkedIn.STATUS_ERRO
+                tarefa.erro = str(e)
+                # Manter os perfis extraídos até o erro, que ainda podem ser importados
+                transmissao = self.transmissao(tarefa_id)
+                if transmissao is not None and transmissao.perfis:
+                    tarefa.set_resultados(transmissao.perfis)
+
+            tarefa.data_conclusao = datetime.utcnow()
+            db.session.commit()
+            self._finalizar(tarefa_id)
+
+    def _finalizar(self, tarefa_id):
+        """Descarta o estado em memória da tarefa, avisando quem acompanha a transmissão"""
+        with self._lock:
+            self._cancelamentos.pop(tarefa_id, None)
+            transmissao = self._transmissoes.pop(tarefa_id, None)
+        if transmissao is not None:
+            transmissao.publicar(finalizada=True)
+
+    def _registrar_progresso(self, tarefa_id):
+        """Cria o callback de progresso, que publica na transmissão e grava em uma sessão própria"""
+        app = self.app
+        transmissao = self.transmissao(tarefa_id)
+
+        def progresso(atual, total, perfil_url=None):
+            # Pode ser chamado a partir das threads de enriquecimento
+            if transmissao is not None:
+                transmissao.publicar(progresso=(atual, total))
+            try:
+                with app.app_context():
+                    TarefaLinkedIn.query.filter_by(id=tarefa_id).update({
+                        'progresso_atual': atual,
+                        'progresso_total': total
+                    })
+                    db.session.commit()
+            except Exception as e:
+                logger.warning(f"Erro ao registrar progresso da tarefa {tarefa_id}: {e}")
+
+        return progresso
+
+    def _executar_busca(self, tarefa, cancelar=None):
+        parametros = tarefa.get_parametros()
+        resultados = []
+        transmissao = self.transmissao(tarefa.id)
+        with crawler_pool.sessao() as crawler:
+            perfis = crawler.iterar_profissionais(
+                palavras_chave=parametros.get('palavras_chave', []),
+                min_seguidores=parametros.get('min_seguidores', 0),
+                localizacao=parametros.get('localizacao'),
+                max_resultados=parametros.get('max_resultados', 10),
+                pool=crawler_pool,
+                workers=self.app.config.get('CRAWLER_WORKERS', 1),
+                progresso=self._registrar_progresso(tarefa.id),
+                cancelar=cancelar,
+                por_palavra=parametros.get('por_palavra', False)
+            )
+            # Fechar o gerador antes de devolver a sessão, mesmo em caso de erro
+            with closing(perfis):
+                for info in perfis:
+                    # Publicar cada perfil assim que extraído, para a transmissão à página;
+                    # a importação referencia o perfil só pelo id do resultado
+                    info['id_resultado'] = formatar_id_resultado(tarefa.id, len(resultados))
+                    resultados.append(info)
+                    if transmissao is not None:
+                        transmissao.publicar(perfil=info)
+
+        # O callback gravou o progresso em outra sessão
+        db.session.refresh(tarefa)
+        tarefa.set_resultados(resultados)
+        tarefa.set_estatisticas(crawler.estatisticas_busca)
+
+    def _executar_atualizacao(self, tarefa):
+        palestrante = Palestrante.query.get(tarefa.palestrante_id)
+        if palestrante is None or not palestrante.linkedin_url:
+            raise ValueError("Palestrante inexistente ou sem URL do LinkedIn cadastrada.")
+
+        tarefa.progresso_total = 1
+        db.session.commit()
+
+        with crawler_pool.sessao() as crawler:
+            # Atualização explícita: ignorar o cache de perfis
+            info = crawler.obter_info_perfil(palestrante.linkedin_url, forcar_atualizacao=True)
+
+        aplicar_info_linkedin(palestrante, info)
+        tarefa.progresso_atual = 1
+        tarefa.set_resultados([info])
+
+# Instância única compartilhada pela aplicação
+executor_tarefas = ExecutorTarefas()
@@ -124,20 +124,82 @@ document.addEventListener('DOMContentLoaded', function() {
 
 // Funções para manipulação de dados do LinkedIn
 function importarPerfilLinkedIn(perfil) {
-    // Preencher o formulário com os dados do perfil
-    document.getElementById('importar-nome').value = perfil.nome || '';
-    document.getElementById('importar-cargo').value = perfil.cargo_atual || '';
-    document.getElementById('importar-empresa').value = perfil.empresa_atual || '';
-    document.getElementById('importar-perfil-url').value = perfil.perfil_url || '';
-    document.getElementById('importar-bio').value = perfil.bio || '';
-    document.getElementById('importar-foto-url').value = perfil.foto_url || '';
-    document.getElementById('importar-seguidores').value = perfil.seguidores || '0';
-    
-    // Habilidades como string separada por vírgulas
-    document.getElementById('importar-habilidades').value = 
-        Array.isArray(perfil.habilidades) ? perfil.habilidades.join(', ') : '';
+    // Os dados do perfil ficam no servidor: o formulário envia só o id do resultado
+    document.getElementById('importar-resultado-id').value = perfil.id_resultado || '';
+    
+    // Exibir um resumo do perfil no modal, se houver onde
+    const resumo = document.getElementById('importar-resumo');
+    if (resumo) {
+        resumo.textContent = [perfil.nome, perfil.cargo_atual, perfil.empresa_atual].filter(Boolean).join(' · ');
+    }
     
     // Mostrar o modal de importação
     const modal = new bootstrap.Modal(document.getElementById('modal-importar-linkedin'));
     modal.show();
-}
\ No newline at end of file
+}
+// Acompanhar o andamento de uma tarefa do LinkedIn executada em segundo plano
+function acompanharTarefaLinkedIn(urlStatus, aoAtualizar, intervalo = 2000) {
+    function consultar() {
+        fetch(urlStatus, { headers: { 'Accept': 'application/json' } })
+            .then(resposta => resposta.json())
+            .then(tarefa => {
+                aoAtualizar(tarefa);
+                
+                if (['concluida', 'erro', 'cancelada'].includes(tarefa.status)) {
+                    return;
+                }
+                setTimeout(consultar, intervalo);
+            })
+            .catch(() => setTimeout(consultar, intervalo * 2));
+    }
+    
+    consultar();
+}
+
+// Receber os perfis de uma busca do LinkedIn à medida que são extraídos (Server-Sent Events)
+function transmitirBuscaLinkedIn(urlEventos, callbacks) {
+    const fonte = new EventSource(urlEventos);
+    
+    fonte.addEventListener('perfil', evento => {
+        if (callbacks.aoReceberPerfil) callbacks.aoReceberPerfil(JSON.parse(evento.data));
+    });
+    fonte.addEventListener('progresso', evento => {
+        if (callbacks.aoAtualizarProgresso) callbacks.aoAtualizarProgresso(JSON.parse(evento.data));
+    });
+    fonte.addEventListener('fim', evento => {
+        fonte.close();
+        if (callbacks.aoTerminar) callbacks.aoTerminar(JSON.parse(evento.data));
+    });
+    
+    return fonte;
+}
+
+// Cancelar uma busca do LinkedIn em andamento
+function cancelarBuscaLinkedIn(urlCancelar, fonte) {
+    return fetch(urlCancelar, { method: 'POST', headers: { 'Accept': 'application/json' } })
+        .then(resposta => resposta.json())
+        .then(resultado => {
+            // A transmissão termina sozinha com o evento 'fim'; fechar só se nada havia a cancelar
+            if (!resultado.cancelada && fonte) fonte.close();
+            return resultado;
+        });
+}
+
+// Importar de uma vez vários perfis selecionados nos resultados da busca (pelos ids dos resultados)
+function importarPerfisLinkedIn(urlImportar, idsResultados) {
+    return fetch(urlImportar, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', 'Accept': 'application/json' },
+        body: JSON.stringify({ resultados: idsResultados })
+    }).then(resposta => resposta.json());
+}
+
+// Pedir palestrantes recomendados para o evento em edição (descrição, palavras-chave e ids já selecionados)
+function recomendarPalestrantes(urlRecomendar, descricao, palavrasChave = [], excluir = [], k = 10) {
+    const parametros = new URLSearchParams({ descricao: descricao || '', k: k });
+    palavrasChave.forEach(palavra => parametros.append('palavra_chave', palavra));
+    excluir.forEach(id => parametros.append('excluir', id));
+
+    return fetch(`${urlRecomendar}?${parametros}`, { headers: { 'Accept': 'application/json' } })
+        .then(resposta => resposta.json());
+}
@@ -0,0 +1 @@
+# Este arquivo é intencionalmente deixado vazio para o Python reconhecer o diretório como um pacote 
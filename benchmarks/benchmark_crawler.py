@@ -0,0 +1,211 @@
+"""
+Benchmark de ponta a ponta do LinkedInCrawler contra o servidor falso local.
+
+Mede, sem acessar o LinkedIn real:
+    - tempo de criação da sessão (abertura do backend + login);
+    - latência por perfil (p50/p95) visitando os perfis um a um, com os KB
+      servidos e o tempo até o DOM (Navigation Timing) de cada perfil;
+    - vazão de uma busca completa (perfis/s), usando o pool e os workers,
+      e o tempo até o primeiro perfil ser entregue;
+    - perfis cuja visita foi evitada pela pré-filtragem dos cards da busca;
+    - pico de memória dos processos do navegador e do próprio Python.
+
+Uso:
+    python -m benchmarks.benchmark_crawler --backend selenium --perfis 20 --workers 2
+    python -m benchmarks.benchmark_crawler --backend http --json
+    python -m benchmarks.benchmark_crawler --backend http --min-seguidores 10000
+    python -m benchmarks.benchmark_crawler --sem-bloqueio --page-load-strategy normal  # comparar com o modo leve
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import psutil
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.config import Config
+from app.services.crawler_pool import crawler_pool
+from app.services.linkedin_crawler import LinkedInCrawler
+from benchmarks.servidor_linkedin_falso import ServidorLinkedInFalso, dados_perfil
+
+def percentil(valores, p):
+    """Percentil `p` (0-100) por interpolação linear"""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    posicao = (len(ordenados) - 1) * p / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+class MonitorMemoria:
+    """Amostra periodicamente a memória do Python e dos processos filhos (navegadores)"""
+
+    def __init__(self, intervalo=0.1):
+        self.intervalo = intervalo
+        self.pico_navegador_mb = 0.0
+        self.pico_python_mb = 0.0
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._amostrar, daemon=True)
+
+    def _amostrar(self):
+        processo = psutil.Process()
+        while not self._parar.is_set():
+            navegador = 0
+            for filho in processo.children(recursive=True):
+                try:
+                    navegador += filho.memory_info().rss
+                except psutil.Error:
+                    continue
+            self.pico_navegador_mb = max(self.pico_navegador_mb, navegador / (1024 * 1024))
+            self.pico_python_mb = max(self.pico_python_mb, processo.memory_info().rss / (1024 * 1024))
+            self._parar.wait(self.intervalo)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._parar.set()
+        self._thread.join()
+
+def criar_config(servidor, args):
+    """Configuração da aplicação apontando para o servidor falso"""
+    class ConfigBenchmark(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+        LINKEDIN_BASE_URL = servidor.url
+        LINKEDIN_USERNAME = 'benchmark@example.com'
+        LINKEDIN_PASSWORD = 'benchmark'
+        LINKEDIN_BACKEND = args.backend
+        LINKEDIN_CACHE_TTL = 0  # Medir sempre a visita real ao perfil
+        LINKEDIN_COOKIES_PATH = None  # Não misturar com os cookies da aplicação
+        CRAWLER_POOL_SIZE = max(args.workers, 1)
+        CRAWLER_WORKERS = args.workers
+        CRAWLER_BLOQUEAR_RECURSOS = not args.sem_bloqueio
+        CRAWLER_PAGE_LOAD_STRATEGY = args.page_load_strategy
+
+    return ConfigBenchmark
+
+def executar(args):
+    with ServidorLinkedInFalso(perfis=args.perfis, atraso=args.atraso) as servidor:
+        app = create_app(criar_config(servidor, args))
+
+        with app.app_context(), MonitorMemoria() as memoria:
+            # Criação da sessão (backend + login)
+            inicio = time.perf_counter()
+            crawler = LinkedInCrawler()
+            tempo_sessao = time.perf_counter() - inicio
+
+            # Latência por perfil, visitando um de cada vez
+            latencias = []
+            tempos_dom = []
+            falhas = 0
+            visitados = min(args.max_resultados, args.perfis)
+            bytes_antes = servidor.bytes_enviados
+            for i in range(visitados):
+                perfil_url = f"{servidor.url}/in/{dados_perfil(i)['slug']}/"
+                inicio = time.perf_counter()
+                info = crawler.obter_info_perfil(perfil_url, forcar_atualizacao=True)
+                latencias.append(time.perf_counter() - inicio)
+                if info.get('nome') != dados_perfil(i)['nome']:
+                    falhas += 1
+                metricas = crawler.backend.metricas_navegacao()
+                if metricas.get('tempo_dom_ms') is not None:
+                    tempos_dom.append(metricas['tempo_dom_ms'])
+            # Aguardar os downloads que o navegador continua fazendo após o DOM
+            time.sleep(0.5)
+            bytes_por_perfil = (servidor.bytes_enviados - bytes_antes) / visitados if visitados else 0
+            crawler.fechar()
+
+            # Vazão de uma busca completa, com o pool e os workers configurados
+            bytes_antes = servidor.bytes_enviados
+            inicio = time.perf_counter()
+            tempo_primeiro = None
+            resultados = []
+            with crawler_pool.sessao() as sessao:
+                for info in sessao.iterar_profissionais(
+                    palavras_chave=['benchmark'],
+                    min_seguidores=args.min_seguidores,
+                    max_resultados=args.max_resultados,
+                    pool=crawler_pool,
+                    workers=args.workers
+                ):
+                    if tempo_primeiro is None:
+                        tempo_primeiro = time.perf_counter() - inicio
+                    resultados.append(info)
+                estatisticas_busca = dict(sessao.estatisticas_busca)
+            tempo_busca = time.perf_counter() - inicio
+            bytes_busca = servidor.bytes_enviados - bytes_antes
+
+        crawler_pool.encerrar()
+
+    return {
+        'backend': args.backend,
+        'workers': args.workers,
+        'perfis_na_busca': args.perfis,
+        'tempo_sessao_s': round(tempo_sessao, 3),
+        'latencia_p50_s': round(percentil(latencias, 50), 3),
+        'latencia_p95_s': round(percentil(latencias, 95), 3),
+        'falhas_extracao': falhas,
+        'bloqueio_recursos': not args.sem_bloqueio,
+        'page_load_strategy': args.page_load_strategy,
+        'kb_por_perfil': round(bytes_por_perfil / 1024, 1),
+        'tempo_ate_dom_p50_ms': round(percentil(tempos_dom, 50), 1),
+        'busca_perfis': len(resultados),
+        'busca_tempo_s': round(tempo_busca, 3),
+        'busca_primeiro_perfil_s': round(tempo_primeiro or 0.0, 3),
+        'busca_perfis_por_s': round(len(resultados) / tempo_busca, 2) if tempo_busca else 0.0,
+        'busca_kb_servidos': round(bytes_busca / 1024, 1),
+        'busca_min_seguidores': args.min_seguidores,
+        'busca_cards': estatisticas_busca.get('cards', 0),
+        'busca_perfis_carregados': estatisticas_busca.get('perfis_carregados', 0),
+        'busca_perfis_evitados': estatisticas_busca.get('perfis_evitados', 0),
+        'pico_memoria_navegador_mb': round(memoria.pico_navegador_mb, 1),
+        'pico_memoria_python_mb': round(memoria.pico_python_mb, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do crawler do LinkedIn contra um servidor local')
+    parser.add_argument('--backend', choices=['selenium', 'http'], default='selenium')
+    parser.add_argument('--perfis', type=int, default=20, help='Resultados na página de busca')
+    parser.add_argument('--max-resultados', type=int, default=20)
+    parser.add_argument('--min-seguidores', type=int, default=0, help='Mínimo de seguidores na busca completa')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--sem-bloqueio', action='store_true',
+                        help='Carregar imagens, fontes e mídia (para comparar com o modo leve)')
+    parser.add_argument('--page-load-strategy', choices=['normal', 'eager', 'none'], default='eager')
+    parser.add_argument('--atraso', type=float, default=0.0, help='Latência artificial por requisição (s)')
+    parser.add_argument('--json', action='store_true', help='Imprimir o resultado em JSON')
+    args = parser.parse_args()
+
+    resultado = executar(args)
+
+    if args.json:
+        print(json.dumps(resultado, indent=2))
+        return
+
+    print("\nBenchmark do crawler do LinkedIn")
+    print("================================")
+    print(f"Backend: {resultado['backend']} | workers: {resultado['workers']} | perfis: {resultado['perfis_na_busca']}")
+    print(f"Criação da sessão (login): {resultado['tempo_sessao_s']:.3f} s")
+    print(f"Latência por perfil: p50 {resultado['latencia_p50_s']:.3f} s | p95 {resultado['latencia_p95_s']:.3f} s")
+    print(f"Bloqueio de recursos: {'sim' if resultado['bloqueio_recursos'] else 'não'} | "
+          f"page load strategy: {resultado['page_load_strategy']}")
+    print(f"Por perfil: {resultado['kb_por_perfil']} KB servidos | "
+          f"tempo até o DOM p50 {resultado['tempo_ate_dom_p50_ms']} ms")
+    print(f"Falhas de extração: {resultado['falhas_extracao']}")
+    print(f"Busca completa: {resultado['busca_perfis']} perfis em {resultado['busca_tempo_s']:.3f} s "
+          f"({resultado['busca_perfis_por_s']:.2f} perfis/s, {resultado['busca_kb_servidos']} KB servidos)")
+    print(f"Primeiro perfil da busca entregue em {resultado['busca_primeiro_perfil_s']:.3f} s")
+    print(f"Pré-filtragem (mín. {resultado['busca_min_seguidores']} seguidores): {resultado['busca_cards']} cards, "
+          f"{resultado['busca_perfis_carregados']} perfis carregados, {resultado['busca_perfis_evitados']} evitados")
+    print(f"Pico de memória: navegador {resultado['pico_memoria_navegador_mb']} MB | "
+          f"Python {resultado['pico_memoria_python_mb']} MB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+"""
+Servidor HTTP local que imita as páginas do LinkedIn usadas pelo crawler.
+
+Serve o formulário de login (#username/#password), a página inicial com
+#global-nav, uma página de busca de pessoas e os perfis, a partir das páginas
+gravadas em benchmarks/fixtures. Os perfis trazem foto, banner, fonte web,
+vídeo e pixel de rastreamento, para medir o efeito do bloqueio de recursos. Os dados de cada perfil são gerados de forma
+determinística a partir do seu índice, para que as medições sejam repetíveis.
+
+Uso isolado:
+    python -m benchmarks.servidor_linkedin_falso --perfis 50 --porta 8765
+"""
+import argparse
+import os
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from string import Template
+from urllib.parse import urlsplit, parse_qs, unquote
+
+PASTA_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+COOKIE_SESSAO = 'li_at'
+
+HABILIDADES = [
+    'Python', 'Machine Learning', 'Inovação', 'Liderança', 'Gestão de Projetos',
+    'Inteligência Artificial', 'Ciência de Dados', 'Design Thinking', 'Marketing Digital',
+    'Empreendedorismo', 'Computação em Nuvem', 'Transformação Digital'
+]
+
+TIPOS_ESTATICOS = {
+    '.jpg': 'image/jpeg',
+    '.css': 'text/css; charset=utf-8',
+    '.woff2': 'font/woff2',
+    '.mp4': 'video/mp4',
+}
+
+# Folha de estilos dos perfis: carrega uma fonte web, como o LinkedIn
+CSS_PERFIL = """
+@font-face { font-family: 'SourceSans'; src: url('/static/fontes/source-sans.woff2') format('woff2'); }
+body { font-family: 'SourceSans', sans-serif; }
+"""
+
+def _carregar_fixture(nome):
+    with open(os.path.join(PASTA_FIXTURES, nome), encoding='utf-8') as f:
+        return Template(f.read())
+
+def dados_perfil(indice):
+    """Dados determinísticos do perfil de número `indice`"""
+    seguidores = (indice * 7919) % 20000
+    return {
+        'indice': indice,
+        'slug': f'perfil-benchmark-{indice}',
+        'nome': f'Palestrante Benchmark {indice}',
+        'cargo': f'Especialista em {HABILIDADES[indice % len(HABILIDADES)]}',
+        'empresa': f'Empresa {indice % 17}',
+        'localizacao': 'Rio de Janeiro, Brasil',
+        'bio': f'Profissional de número {indice} com experiência em palestras e eventos.',
+        'seguidores': seguidores,
+        'seguidores_texto': f'{seguidores:,} seguidores',
+        'habilidades': [HABILIDADES[(indice + i) % len(HABILIDADES)] for i in range(5)],
+    }
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # Não poluir a saída dos benchmarks
+        pass
+
+    @property
+    def servidor(self):
+        return self.server.servidor_falso
+
+    def _responder(self, corpo, status=200, tipo='text/html; charset=utf-8', cabecalhos=None):
+        if isinstance(corpo, str):
+            corpo = corpo.encode('utf-8')
+        self.servidor.bytes_enviados += len(corpo)
+        self.send_response(status)
+        self.send_header('Content-Type', tipo)
+        self.send_header('Content-Length', str(len(corpo)))
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _redirecionar(self, destino, cabecalhos=None):
+        cabecalhos = dict(cabecalhos or {})
+        cabecalhos['Location'] = destino
+        self._responder('', status=302, cabecalhos=cabecalhos)
+
+    def _autenticado(self):
+        return f'{COOKIE_SESSAO}=' in (self.headers.get('Cookie') or '')
+
+    def do_GET(self):
+        self.servidor.requisicoes += 1
+        if self.servidor.atraso:
+            time.sleep(self.servidor.atraso)
+
+        partes = urlsplit(self.path)
+        caminho = partes.path
+
+        if caminho.rstrip('/') == '/login':
+            self._responder(self.servidor.fixtures['login'].substitute(csrf='csrf-benchmark'))
+        elif caminho.startswith('/li/track'):
+            # Pixel de rastreamento
+            self._responder(b'GIF89a' + b'\x00' * 37, tipo='image/gif')
+        elif not self._autenticado() and not caminho.startswith('/static/'):
+            self._redirecionar('/login')
+        elif caminho.rstrip('/') == '/feed':
+            self._responder(self.servidor.fixtures['feed'].substitute())
+        elif caminho.rstrip('/') == '/search/results/people':
+            keywords = parse_qs(partes.query).get('keywords', [''])[0]
+            self._responder(self.servidor.pagina_busca(keywords))
+        elif caminho.startswith('/in/'):
+            slug = unquote(caminho[len('/in/'):]).strip('/')
+            pagina = self.servidor.pagina_perfil(slug)
+            if pagina is None:
+                self._responder('Perfil não encontrado', status=404)
+            else:
+                self._responder(pagina)
+        elif caminho.startswith('/static/'):
+            self._responder(self.servidor.conteudo_estatico(caminho), tipo=self.servidor.tipo_estatico(caminho))
+        else:
+            self._responder('Não encontrado', status=404)
+
+    def do_POST(self):
+        self.servidor.requisicoes += 1
+        tamanho = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(tamanho)
+
+        if urlsplit(self.path).path.startswith('/checkpoint/lg/login-submit'):
+            self._redirecionar('/feed/', cabecalhos={
+                'Set-Cookie': f'{COOKIE_SESSAO}=sessao-benchmark; Path=/; HttpOnly'
+            })
+        else:
+            self._responder('Não encontrado', status=404)
+
+class ServidorLinkedInFalso:
+    """
+    Servidor local com páginas gravadas do LinkedIn
+
+    Args:
+        perfis (int): Quantidade de resultados na página de busca
+        atraso (float): Latência artificial por requisição GET, em segundos
+        host (str): Endereço de escuta
+        porta (int): Porta de escuta (0 escolhe uma porta livre)
+    """
+
+    def __init__(self, perfis=20, atraso=0.0, host='127.0.0.1', porta=0):
+        self.perfis = perfis
+        self.atraso = atraso
+        self.host = host
+        self.porta = porta
+        self.requisicoes = 0
+        self.bytes_enviados = 0
+        self.fixtures = {
+            nome: _carregar_fixture(f'{nome}.html')
+            for nome in ('login', 'feed', 'busca', 'resultado', 'perfil')
+        }
+        self._servidor = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f'http://{self.host}:{self.porta}'
+
+    def pagina_busca(self, keywords):
+        resultados = '\n'.join(
+            self.fixtures['resultado'].substitute(dados_perfil(i)) for i in range(self.perfis)
+        )
+        return self.fixtures['busca'].substitute(keywords=keywords, resultados=resultados)
+
+    def pagina_perfil(self, slug):
+        prefixo = 'perfil-benchmark-'
+        if not slug.startswith(prefixo) or not slug[len(prefixo):].isdigit():
+            return None
+
+        dados = dados_perfil(int(slug[len(prefixo):]))
+        dados['base_url'] = self.url
+        dados['habilidades'] = '\n'.join(
+            f'                <li><span class="pv-skill-category-entity__name-text">{h}</span></li>'
+            for h in dados['habilidades']
+        )
+        return self.fixtures['perfil'].substitute(dados)
+
+    def tipo_estatico(self, caminho):
+        extensao = os.path.splitext(caminho)[1].lower()
+        return TIPOS_ESTATICOS.get(extensao, 'application/octet-stream')
+
+    def conteudo_estatico(self, caminho):
+        # Conteúdo fictício com tamanho semelhante ao dos recursos reais do LinkedIn
+        if caminho.endswith('.css'):
+            return CSS_PERFIL.encode('utf-8')
+        if caminho.startswith('/static/banners/'):
+            return b'\xff\xd8\xff' + b'\x00' * 160 * 1024
+        if caminho.endswith('.woff2'):
+            return b'wOF2' + b'\x00' * 64 * 1024
+        if caminho.endswith('.mp4'):
+            return b'\x00\x00\x00\x18ftypmp42' + b'\x00' * 512 * 1024
+        return b'\xff\xd8\xff' + b'\x00' * 48 * 1024
+
+    def iniciar(self):
+        """Inicia o servidor em uma thread em segundo plano"""
+        self._servidor = ThreadingHTTPServer((self.host, self.porta), _Handler)
+        self._servidor.daemon_threads = True
+        self._servidor.servidor_falso = self
+        self.porta = self._servidor.server_address[1]
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def parar(self):
+        """Encerra o servidor"""
+        if self._servidor is not None:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._servidor = None
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *args):
+        self.parar()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Servidor local com páginas gravadas do LinkedIn')
+    parser.add_argument('--perfis', type=int, default=20, help='Resultados na página de busca')
+    parser.add_argument('--atraso', type=float, default=0.0, help='Latência artificial por requisição (s)')
+    parser.add_argument('--porta', type=int, default=8765)
+    args = parser.parse_args()
+
+    servidor = ServidorLinkedInFalso(perfis=args.perfis, atraso=args.atraso, porta=args.porta).iniciar()
+    print(f'Servidor falso do LinkedIn em {servidor.url} (CTRL+C para encerrar)')
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        servidor.parar()
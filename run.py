@@ -2,6 +2,7 @@ from app import create_app, db
 from app.models.usuario import Usuario
 from app.models.palestrante import Palestrante, PalavraChave
 from app.models.evento import Evento, AvaliacaoPalestrante
+from app.models.tarefa import TarefaLinkedIn
 
 app = create_app()
 
@@ -14,7 +15,8 @@ def make_shell_context():
         'Palestrante': Palestrante,
         'PalavraChave': PalavraChave,
         'Evento': Evento,
-        'AvaliacaoPalestrante': AvaliacaoPalestrante
+        'AvaliacaoPalestrante': AvaliacaoPalestrante,
+        'TarefaLinkedIn': TarefaLinkedIn
     }
 
 if __name__ == '__main__':
@@ -0,0 +1,21 @@
+import pytest
+
+from app import create_app, db
+from app.config import Config
+
+@pytest.fixture
+def app(tmp_path):
+    class ConfigTeste(Config):
+        TESTING = True
+        # Um banco por teste (o índice de busca guarda o estado por URL do banco)
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / "teste.db"}'
+        UPLOAD_FOLDER = str(tmp_path / 'uploads')
+        FOTOS_FOLDER = str(tmp_path / 'fotos')
+        LINKEDIN_COOKIES_PATH = ''
+
+    app = create_app(ConfigTeste)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
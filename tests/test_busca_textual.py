@@ -0,0 +1,63 @@
+from app import db
+from app.models.palestrante import Palestrante, PalavraChave
+from app.services.busca_textual import indice_busca, montar_consulta
+
+def _buscar(texto):
+    query, relevancia = indice_busca.filtrar(Palestrante.query, texto)
+    if relevancia is not None:
+        query = query.order_by(relevancia.desc())
+    return [p.nome for p in query]
+
+def _cadastrar():
+    python = PalavraChave(palavra='Python')
+    inovacao = PalavraChave(palavra='Inovação')
+    ana = Palestrante(nome='Ana Silva', bio='Fala sobre dados', palavras_chave=[python])
+    bruno = Palestrante(nome='Bruno Costa', linkedin_cargo_atual='Diretor de Inovação', palavras_chave=[inovacao])
+    carla = Palestrante(nome='Carla Python', bio='Desenvolvedora')
+    db.session.add_all([ana, bruno, carla])
+    db.session.commit()
+    return ana, bruno, carla
+
+def test_montar_consulta_exige_todas_as_palavras_e_completa_a_ultima():
+    assert montar_consulta('ana sil', 'sqlite') == '"ana" "sil"*'
+    assert montar_consulta('ana sil', 'postgresql') == 'ana & sil:*'
+    assert montar_consulta('  ', 'sqlite') == ''
+
+def test_busca_em_todos_os_campos_sem_acentos_e_pela_relevancia(app):
+    _cadastrar()
+
+    # O nome pesa mais que as palavras-chave
+    assert _buscar('python') == ['Carla Python', 'Ana Silva']
+    assert _buscar('inovacao') == ['Bruno Costa']
+    assert _buscar('ana sil') == ['Ana Silva']
+    assert _buscar('dados ana') == ['Ana Silva']
+    assert _buscar('inexistente') == []
+
+def test_indice_acompanha_alteracoes_e_exclusoes(app):
+    ana, bruno, carla = _cadastrar()
+
+    bruno.bio = 'Especialista em blockchain'
+    db.session.delete(carla)
+    PalavraChave.query.filter_by(palavra='Python').one().palavra = 'Rust'
+    db.session.commit()
+
+    assert _buscar('blockchain') == ['Bruno Costa']
+    assert _buscar('python') == []
+    assert _buscar('rust') == ['Ana Silva']
+
+def test_campos_fora_do_indice_nao_reindexam(app, monkeypatch):
+    ana, _, _ = _cadastrar()
+    reindexados = []
+    original = indice_busca.reindexar
+    monkeypatch.setattr(indice_busca, 'reindexar', lambda conexao, alterados, removidos=(): (
+        reindexados.append(set(alterados)), original(conexao, alterados, removidos)
+    ))
+
+    ana.linkedin_falhas = 3
+    db.session.commit()
+    assert reindexados == []
+
+    ana.linkedin_empresa_atual = 'Acme'
+    db.session.commit()
+    assert reindexados == [{ana.id}]
+    assert _buscar('acme') == ['Ana Silva']
@@ -0,0 +1,45 @@
+from app import db
+from app.models.palestrante import AliasPalavraChave, Palestrante, PalavraChave
+from app.services.canonicalizacao import (agrupar_semelhantes, aplicar_fusoes, chave_comparacao, filtrar_fusoes,
+                                          propor_fusoes, resolver_palavras_chave)
+
+def _grupos(textos, limiar=0.8):
+    return sorted(sorted(textos[i] for i in grupo) for grupo in agrupar_semelhantes(textos, limiar))
+
+def test_chave_comparacao_mantem_sinais_de_tecnologias():
+    assert chave_comparacao('Python (Programming Language)') == 'python'
+    assert chave_comparacao('Inteligência Artificial') == 'artificial inteligencia'
+    assert [chave_comparacao(t) for t in ('C++', 'C ++', 'C#', '.NET', 'Node.js.')] == \
+        ['c++', 'c++', 'c#', '.net', 'node.js']
+
+def test_agrupa_variantes_mas_nao_linguagens_diferentes():
+    textos = ['C', 'C++', 'C#', 'c ++', 'Gestão de Projetos', 'Gestao de projetos', 'Projetos, Gestão de',
+              'Marketing Digital', 'Marketing']
+    assert _grupos(textos) == [
+        ['C++', 'c ++'],
+        ['Gestao de projetos', 'Gestão de Projetos', 'Projetos, Gestão de'],
+    ]
+
+def test_aplicar_fusoes_une_associacoes_e_cria_aliases(app):
+    canonica, variante, outra = (PalavraChave(palavra=p) for p in ('Liderança', 'Liderança (Leadership)', 'Python'))
+    db.session.add_all([
+        Palestrante(nome='Ana', palavras_chave=[canonica, variante]),
+        Palestrante(nome='Bruno', palavras_chave=[variante, outra]),
+        Palestrante(nome='Carla', palavras_chave=[canonica]),
+    ])
+    db.session.commit()
+
+    fusoes = propor_fusoes()
+    assert [(f['canonica'].palavra, [v.palavra for v in f['variantes']]) for f in fusoes] == \
+        [('Liderança', ['Liderança (Leadership)'])]
+    # Manter uma das palavras fora desfaz o grupo de duas
+    assert filtrar_fusoes(fusoes, palavras=['liderança (leadership)']) == []
+
+    estatisticas = aplicar_fusoes(fusoes)
+    assert (estatisticas['palavras_chave_removidas'], estatisticas['palestrantes_afetados']) == (1, 2)
+
+    palavras = {p.nome: sorted(k.palavra for k in p.palavras_chave) for p in Palestrante.query}
+    assert palavras == {'Ana': ['Liderança'], 'Bruno': ['Liderança', 'Python'], 'Carla': ['Liderança']}
+    # A grafia da variante passa a levar à canônica nas próximas importações
+    assert [a.alias_normalizado for a in AliasPalavraChave.query] == ['lideranca (leadership)']
+    assert resolver_palavras_chave(['Liderança (Leadership)'])['lideranca (leadership)'].palavra == 'Liderança'
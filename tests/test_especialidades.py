@@ -0,0 +1,36 @@
+from app import db
+from app.models.palestrante import Palestrante, PalavraChave
+from app.services.especialidades import (MODO_QUALQUER, MODO_TODAS, interpretar_especialidades,
+                                         filtrar_especialidades, contar_especialidades)
+
+def _cadastrar():
+    python, dados, lideranca = (PalavraChave(palavra=p) for p in ('Python', 'Dados', 'Liderança'))
+    db.session.add_all([
+        Palestrante(nome='Ana', palavras_chave=[python, dados]),
+        Palestrante(nome='Bruno', palavras_chave=[python]),
+        Palestrante(nome='Carla', palavras_chave=[lideranca]),
+        Palestrante(nome='Davi'),
+    ])
+    db.session.commit()
+
+def _nomes(especialidades, modo):
+    query = filtrar_especialidades(Palestrante.query, interpretar_especialidades(especialidades), modo)
+    return sorted(p.nome for p in query)
+
+def test_interpretar_aceita_repeticao_e_virgulas_sem_acentos():
+    assert interpretar_especialidades(['Python, Liderança', 'python', '', None]) == ['python', 'lideranca']
+
+def test_modo_qualquer_e_modo_todas(app):
+    _cadastrar()
+
+    assert _nomes(['python', 'LIDERANCA'], MODO_QUALQUER) == ['Ana', 'Bruno', 'Carla']
+    assert _nomes(['python', 'dados'], MODO_TODAS) == ['Ana']
+    assert _nomes(['python', 'liderança'], MODO_TODAS) == []
+    # Sem especialidades a consulta não é restringida
+    assert _nomes([], MODO_TODAS) == ['Ana', 'Bruno', 'Carla', 'Davi']
+
+def test_facetas_contam_so_o_resultado_filtrado(app):
+    _cadastrar()
+
+    query = filtrar_especialidades(Palestrante.query, ['python'], MODO_QUALQUER)
+    assert contar_especialidades(query) == [('Python', 2), ('Dados', 1)]
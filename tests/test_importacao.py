@@ -0,0 +1,30 @@
+from app.models.palestrante import Palestrante, PalavraChave
+from app.services.importacao import importar_perfis
+
+def test_importa_lote_de_perfis_sem_email(app):
+    # Perfis do LinkedIn não trazem email
+    perfis = [
+        {'nome': 'Ana Silva', 'perfil_url': 'https://www.linkedin.com/in/ana-silva',
+         'habilidades': ['Python', 'Dados']},
+        {'nome': 'Bruno Costa', 'perfil_url': 'https://www.linkedin.com/in/bruno-costa',
+         'habilidades': 'python, Liderança'},
+        {'nome': 'Carla Souza', 'perfil_url': 'https://www.linkedin.com/in/carla-souza'},
+    ]
+
+    resultado = importar_perfis(perfis, espelhar_fotos=False)
+
+    assert resultado['criados'] == 3
+    assert resultado['invalidos'] == 0
+    assert Palestrante.query.count() == 3
+    assert Palestrante.query.filter(Palestrante.email.is_(None)).count() == 3
+    assert PalavraChave.query.count() == 3
+
+def test_reimportacao_ignora_perfis_ja_cadastrados(app):
+    perfis = [{'nome': 'Ana Silva', 'perfil_url': 'https://www.linkedin.com/in/ana-silva'}]
+    importar_perfis(perfis, espelhar_fotos=False)
+
+    resultado = importar_perfis(perfis, espelhar_fotos=False)
+
+    assert resultado['criados'] == 0
+    assert resultado['ignorados'] == 1
+    assert Palestrante.query.count() == 1
@@ -0,0 +1,52 @@
+from benchmarks.servidor_linkedin_falso import ServidorLinkedInFalso, dados_perfil
+from app.services.linkedin_extracao import (extrair_perfil_html, extrair_cards_html, montar_info_perfil,
+                                            interpretar_card)
+
+# Páginas gravadas em benchmarks/fixtures, preenchidas pelo servidor falso (sem iniciá-lo)
+servidor = ServidorLinkedInFalso(perfis=3)
+
+def test_extrai_campos_da_pagina_de_perfil():
+    esperado = dados_perfil(7)
+
+    extraido = extrair_perfil_html(servidor.pagina_perfil('perfil-benchmark-7'))
+    info = montar_info_perfil(extraido['dados'])
+
+    assert info['nome'] == esperado['nome']
+    assert info['cargo_atual'] == esperado['cargo']
+    assert info['empresa_atual'] == esperado['empresa']
+    assert info['bio'] == esperado['bio']
+    assert info['seguidores'] == esperado['seguidores']
+    assert info['foto_url'].endswith('/static/fotos/perfil-benchmark-7.jpg')
+    assert info['habilidades'] == esperado['habilidades']
+    # Todos os campos encontrados pelo seletor preferido
+    assert set(extraido['seletores'].values()) == {0}
+
+def test_campos_ausentes_ficam_fora_do_perfil():
+    extraido = extrair_perfil_html('<html><body><h1 class="text-heading-xlarge">Ana</h1></body></html>')
+
+    assert montar_info_perfil(extraido['dados']) == {'nome': 'Ana'}
+    assert extraido['seletores']['habilidades'] == -1
+
+def test_extrai_cards_da_pagina_de_busca():
+    cards = [interpretar_card(c['dados'], 'https://www.linkedin.com')
+             for c in extrair_cards_html(servidor.pagina_busca('python'))]
+
+    assert [c['nome'] for c in cards] == [dados_perfil(i)['nome'] for i in range(3)]
+    # URL absoluta e sem parâmetros de rastreamento
+    assert cards[1]['perfil_url'] == 'https://www.linkedin.com/in/perfil-benchmark-1/'
+    assert cards[2]['seguidores_max'] == dados_perfil(2)['seguidores']
+
+def test_seguidores_abreviados_usam_o_limite_superior():
+    card = interpretar_card({'texto': 'Ana Silva · 1,2 mil seguidores'})
+    # "1,2 mil" pode ser até ~1.249: a estimativa não fica abaixo disso
+    assert card['seguidores_max'] >= 1249
+
+    assert interpretar_card({'texto': '12K followers'})['seguidores_max'] >= 12499
+    assert interpretar_card({'texto': '15.838 seguidores'})['seguidores_max'] == 15838
+
+def test_conexoes_nao_sao_lidas_como_seguidores():
+    card = interpretar_card({'texto': 'Ana Silva · 500+ conexões'})
+
+    # Sem seguidores informados o card não pode ser descartado pela pré-filtragem
+    assert card['seguidores_max'] is None
+    assert card['conexoes_min'] == 500
@@ -0,0 +1,79 @@
+from datetime import datetime
+
+from flask import template_rendered
+from sqlalchemy import inspect, text
+
+from app import db
+from app.models.evento import Evento
+from app.models.normalizacao import normalizar_texto, filtro_prefixo
+from app.models.palestrante import Palestrante, PalavraChave
+from app.models.usuario import Usuario
+from app.services.esquema import atualizar_esquema
+
+def test_normalizar_texto():
+    assert normalizar_texto('  Inovação   e  GESTÃO ') == 'inovacao e gestao'
+    assert normalizar_texto('São Paulo') == normalizar_texto('sao paulo')
+    assert normalizar_texto(None) is None
+
+def test_colunas_normalizadas_acompanham_o_nome(app):
+    palestrante = Palestrante(nome='José Ávila')
+    palavra = PalavraChave(palavra='Educação')
+    db.session.add_all([palestrante, palavra])
+    db.session.commit()
+    assert (palestrante.nome_normalizado, palavra.palavra_normalizada) == ('jose avila', 'educacao')
+
+    palestrante.nome = 'Joana Érica'
+    db.session.commit()
+    assert palestrante.nome_normalizado == 'joana erica'
+
+def test_filtro_prefixo_ignora_acentos_e_maiusculas(app):
+    db.session.add_all([Palestrante(nome=n) for n in ('Érico Souza', 'Erica Lima', 'Ana Erica')])
+    db.session.commit()
+
+    encontrados = Palestrante.query.filter(filtro_prefixo(Palestrante.nome_normalizado, 'ÉRIC'))
+    assert sorted(p.nome for p in encontrados) == ['Erica Lima', 'Érico Souza']
+
+def test_filtro_de_eventos_encontra_trecho_do_nome(app):
+    usuario = Usuario(nome='Equipe', email='equipe@exemplo.com')
+    inicio = datetime(2026, 5, 1)
+    db.session.add_all([usuario] + [Evento(nome=n, data_inicio=inicio, data_fim=inicio)
+                                    for n in ('Grande Congresso de Inovação', 'Congresso Regional', 'Oficina 100%')])
+    db.session.commit()
+
+    cliente = app.test_client()
+    with cliente.session_transaction() as sessao:
+        sessao['_user_id'] = str(usuario.id)
+    def nomes(busca):
+        renderizados = []
+        with template_rendered.connected_to(lambda _, template, context, **kw: renderizados.append(context), app):
+            cliente.get('/eventos/', query_string={'nome': busca, 'periodo': 'todos'})
+        return sorted(e.nome for e in renderizados[0]['eventos'].itens)
+
+    assert nomes('congresso') == ['Congresso Regional', 'Grande Congresso de Inovação']
+    assert nomes('INOVACAO') == ['Grande Congresso de Inovação']
+    # "%" digitado é literal, não curinga
+    assert nomes('100%') == ['Oficina 100%']
+
+def test_atualizar_esquema_de_banco_antigo(app):
+    # Tabela como criada antes das colunas normalizadas e com email obrigatório
+    db.session.remove()
+    db.drop_all()
+    with db.engine.begin() as conexao:
+        conexao.execute(text("""CREATE TABLE palestrante (
+            id INTEGER NOT NULL PRIMARY KEY, nome VARCHAR(100) NOT NULL, email VARCHAR(100) NOT NULL,
+            UNIQUE (email))"""))
+        conexao.execute(text("INSERT INTO palestrante (nome, email) VALUES ('Ana Inovação', 'ana@exemplo.com')"))
+
+    alteracoes = atualizar_esquema()
+    assert 'coluna palestrante.nome_normalizado criada' in alteracoes
+    assert 'coluna palestrante.email agora aceita nulos' in alteracoes
+    assert 'tabela alias_palavra_chave criada' in alteracoes
+    assert atualizar_esquema() == []
+
+    colunas = {c['name']: c for c in inspect(db.engine).get_columns('palestrante')}
+    assert {'nome_normalizado', 'linkedin_falhas', 'linkedin_proxima_tentativa'} <= colunas.keys()
+    assert colunas['email']['nullable']
+    # Os dados e o UNIQUE do email sobrevivem à recriação da tabela
+    assert [c['column_names'] for c in inspect(db.engine).get_unique_constraints('palestrante')] == [['email']]
+    palestrante = Palestrante.query.one()
+    assert (palestrante.nome, palestrante.email, palestrante.nome_normalizado) == ('Ana Inovação', 'ana@exemplo.com', None)
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+from app import db
+from app.models.evento import Evento
+from app.models.palestrante import Palestrante
+from app.services.paginacao import _CacheTotais, gerar_cursor, interpretar_cursor, paginar_por_cursor, DEPOIS
+
+ORDEM = [(Palestrante.nome, False), (Palestrante.id, False)]
+
+def _cadastrar(quantidade=25):
+    # Nomes repetidos: o id desempata a ordenação
+    db.session.add_all([Palestrante(nome=f'Palestrante {i // 2:02d}') for i in range(quantidade)])
+    db.session.commit()
+
+def _ids(pagina):
+    return [p.id for p in pagina.itens]
+
+def test_percorre_todas_as_paginas_e_volta(app):
+    _cadastrar()
+    esperado = [p.id for p in Palestrante.query.order_by(Palestrante.nome, Palestrante.id)]
+
+    paginas = [paginar_por_cursor(Palestrante.query, ORDEM, por_pagina=10, chave_total=('teste',))]
+    while paginas[-1].tem_proxima:
+        paginas.append(paginar_por_cursor(Palestrante.query, ORDEM, paginas[-1].proximo_cursor, por_pagina=10))
+
+    assert [len(p.itens) for p in paginas] == [10, 10, 5]
+    assert sum((_ids(p) for p in paginas), []) == esperado
+    assert not paginas[0].tem_anterior
+    assert (paginas[0].total, paginas[0].pages) == (25, 3)
+
+    # Voltando pelo cursor "anterior" as páginas são as mesmas
+    anterior = paginar_por_cursor(Palestrante.query, ORDEM, paginas[2].anterior_cursor, por_pagina=10)
+    assert _ids(anterior) == _ids(paginas[1])
+    primeira = paginar_por_cursor(Palestrante.query, ORDEM, anterior.anterior_cursor, por_pagina=10)
+    assert _ids(primeira) == _ids(paginas[0])
+    assert not primeira.tem_anterior
+
+def test_ordenacao_decrescente_com_datas(app):
+    inicio = datetime(2026, 1, 1)
+    db.session.add_all([Evento(nome=f'Evento {i}', data_inicio=inicio + timedelta(days=i % 3),
+                               data_fim=inicio + timedelta(days=5), local='Rio') for i in range(7)])
+    db.session.commit()
+    ordem = [(Evento.data_inicio, True), (Evento.id, True)]
+
+    pagina = paginar_por_cursor(Evento.query, ordem, por_pagina=4)
+    seguinte = paginar_por_cursor(Evento.query, ordem, pagina.proximo_cursor, por_pagina=4)
+
+    esperado = [e.id for e in Evento.query.order_by(Evento.data_inicio.desc(), Evento.id.desc())]
+    assert _ids(pagina) + _ids(seguinte) == esperado
+
+def test_cursor_adulterado_volta_para_a_primeira_pagina(app):
+    _cadastrar()
+    cursor = gerar_cursor(['Palestrante 04', 9], DEPOIS)
+    assert interpretar_cursor(cursor, 2) == (DEPOIS, ['Palestrante 04', 9])
+
+    adulterado = cursor[:-2] + ('AA' if not cursor.endswith('AA') else 'BB')
+    assert interpretar_cursor(adulterado, 2) is None
+    assert interpretar_cursor(cursor, 3) is None
+    assert interpretar_cursor('lixo', 2) is None
+
+    pagina = paginar_por_cursor(Palestrante.query, ORDEM, adulterado, por_pagina=10)
+    assert _ids(pagina) == _ids(paginar_por_cursor(Palestrante.query, ORDEM, por_pagina=10))
+
+def test_cache_de_totais_limitado_e_por_chave(app):
+    _cadastrar(3)
+    cache = _CacheTotais(max_entradas=2)
+
+    assert cache.obter(('a',), Palestrante.query, 60) == 3
+    db.session.add(Palestrante(nome='Outro'))
+    db.session.commit()
+    # Mesma chave dentro da validade: total reaproveitado
+    assert cache.obter(('a',), Palestrante.query, 60) == 3
+    assert cache.obter(('b',), Palestrante.query, 60) == 4
+    assert cache.obter(('c',), Palestrante.query, 60) == 4
+    # ('a',) era a usada há mais tempo
+    assert list(cache._totais) == [('b',), ('c',)]
@@ -0,0 +1,58 @@
+from app import db
+from app.models.palestrante import Palestrante, PalavraChave
+from app.services.recomendacao import motor_recomendacao
+
+def _cadastrar():
+    python, dados, lideranca = (PalavraChave(palavra=p) for p in ('Python', 'Ciência de Dados', 'Liderança'))
+    palestrantes = {
+        'Ana': Palestrante(nome='Ana', palavras_chave=[python, dados], avaliacao_media=6.0),
+        'Bruno': Palestrante(nome='Bruno', palavras_chave=[python], avaliacao_media=9.0),
+        'Carla': Palestrante(nome='Carla', palavras_chave=[lideranca], avaliacao_media=10.0),
+    }
+    db.session.add_all(palestrantes.values())
+    db.session.commit()
+    return {nome: p.id for nome, p in palestrantes.items()}
+
+def _motor():
+    # A instância única recebe os commits; a matriz de um teste anterior é de outro banco
+    motor_recomendacao.invalidar()
+    return motor_recomendacao
+
+def _ids(resultado):
+    return [r['palestrante_id'] for r in resultado['recomendacoes']]
+
+def test_palavras_chave_da_descricao_ordenam_e_filtram(app):
+    ids = _cadastrar()
+    motor = _motor()
+
+    resultado = motor.recomendar(descricao='Oficina de Python e ciencia de dados para iniciantes')
+    assert resultado['palavras_chave'] == ['ciencia de dados', 'python']
+    # Carla não tem nenhuma das palavras-chave; Ana tem as duas
+    assert _ids(resultado) == [ids['Ana'], ids['Bruno']]
+
+    # Sem palavras-chave reconhecidas, todos entram, ordenados pelos demais sinais
+    assert _ids(motor.recomendar(descricao='Evento de encerramento')) == [ids['Carla'], ids['Bruno'], ids['Ana']]
+
+def test_exclusoes_e_limite(app):
+    ids = _cadastrar()
+    motor = _motor()
+
+    assert _ids(motor.recomendar(palavras_chave=['PYTHON'], excluir=[ids['Ana']])) == [ids['Bruno']]
+    # Bruno só tem Python (similaridade maior) e avaliação melhor
+    assert _ids(motor.recomendar(palavras_chave=['python'], k=1)) == [ids['Bruno']]
+
+def test_gravacoes_confirmadas_atualizam_a_matriz(app):
+    ids = _cadastrar()
+    motor = _motor()
+    anterior = motor._matriz_atual()
+    assert _ids(motor.recomendar(palavras_chave=['liderança'])) == [ids['Carla']]
+
+    bruno = db.session.get(Palestrante, ids['Bruno'])
+    bruno.palavras_chave.append(PalavraChave.query.filter_by(palavra='Liderança').one())
+    db.session.commit()
+
+    assert set(_ids(motor.recomendar(palavras_chave=['liderança']))) == {ids['Carla'], ids['Bruno']}
+    # A matriz publicada antes não é alterada: a atualização é feita numa cópia
+    assert motor._matriz_atual() is not anterior
+    assert (anterior.coo_coluna >= 0).sum() == 4
+    assert (motor._matriz_atual().coo_coluna >= 0).sum() == 5